@@ -199,6 +199,8 @@ TRANSLATIONS = {
         "gemini_error": "Gemini Error: {0}",
         "model_loading": "Loading model: {0}...",
         "settings_default_export": "Default export format",
+        "settings_render_group": "Remove Silent Areas",
+        "settings_render_stream_copy": "Fast render (stream copy, cuts snap to keyframes)",
         "settings_restart_required": "Restart required for changes to take effect",
 
         # Whisper Models
@@ -253,6 +255,7 @@ TRANSLATIONS = {
         "error_file_not_found": "File not found: {0}",
         "error_invalid_file": "Invalid or corrupted file: {0}",
         "error_no_audio": "No audio track found in file",
+        "error_cancelled": "Operation cancelled",
         "error_analysis_failed": "Analysis failed: {0}",
         "error_export_failed": "Export failed: {0}",
         "error_model_download": "Failed to download model: {0}",
@@ -479,6 +482,8 @@ TRANSLATIONS = {
         "gemini_error": "Gemini Hatası: {0}",
         "model_loading": "Model yükleniyor: {0}...",
         "settings_default_export": "Varsayılan dışa aktarma formatı",
+        "settings_render_group": "Sessiz Alanları Silme",
+        "settings_render_stream_copy": "Hızlı render (stream copy, kesimler keyframe'e hizalanır)",
         "settings_restart_required": "Değişikliklerin geçerli olması için yeniden başlatma gerekli",
 
         # Whisper Models
@@ -533,6 +538,7 @@ TRANSLATIONS = {
         "error_file_not_found": "Dosya bulunamadı: {0}",
         "error_invalid_file": "Geçersiz veya bozuk dosya: {0}",
         "error_no_audio": "Dosyada ses kanalı bulunamadı",
+        "error_cancelled": "İşlem iptal edildi",
         "error_analysis_failed": "Analiz başarısız: {0}",
         "error_export_failed": "Dışa aktarma başarısız: {0}",
         "error_model_download": "Model indirme başarısız: {0}",
@@ -12,7 +12,7 @@ import uuid
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 
 class CutType(Enum):
@@ -160,7 +160,7 @@ class Cut:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptWord:
     """Kelime seviyesinde transcript verisi."""
     text: str
@@ -173,7 +173,7 @@ class TranscriptWord:
         return self.end - self.start
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     """Segment seviyesinde transcript verisi (cümle/paragraf)."""
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
@@ -181,7 +181,7 @@ class TranscriptSegment:
     start: float = 0.0
     end: float = 0.0
     language: str = "en"
-    words: list[TranscriptWord] = field(default_factory=list)
+    words: Sequence[TranscriptWord] = ()  # Kelime yoksa paylaşılan boş tuple
 
     @property
     def duration(self) -> float:
@@ -154,6 +154,8 @@ class Settings:
     default_export_format: str = "fcpxml"  # fcpxml, edl, xmeml
     fcpxml_version: str = "1.10"
     include_disabled_cuts: bool = False
+    # True = -c copy ile hızlı, keyframe hizalı; False = frame-accurate re-encode
+    render_stream_copy: bool = False
 
     # Autosave
     autosave_enabled: bool = True
@@ -245,6 +247,7 @@ class Settings:
             "default_export_format": self.default_export_format,
             "fcpxml_version": self.fcpxml_version,
             "include_disabled_cuts": self.include_disabled_cuts,
+            "render_stream_copy": self.render_stream_copy,
             "autosave_enabled": self.autosave_enabled,
             "autosave_interval_sec": self.autosave_interval_sec,
             "custom_presets": [p.to_dict() for p in self.custom_presets],
@@ -283,6 +286,7 @@ class Settings:
                 default_export_format=data.get("default_export_format", "fcpxml"),
                 fcpxml_version=data.get("fcpxml_version", "1.10"),
                 include_disabled_cuts=data.get("include_disabled_cuts", False),
+                render_stream_copy=data.get("render_stream_copy", False),
                 autosave_enabled=data.get("autosave_enabled", True),
                 autosave_interval_sec=data.get("autosave_interval_sec", 60),
                 custom_presets=[
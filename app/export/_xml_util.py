@@ -0,0 +1,32 @@
+"""
+Export builder'ları arasında paylaşılan XML yardımcıları.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import quote
+
+
+@lru_cache(maxsize=256)
+def _file_url_cached(path_str: str, prefix: str) -> str:
+    abs_path = os.fspath(Path(path_str).resolve())
+    # URL encode (boşluklar vs.)
+    encoded = quote(abs_path, safe="/:@")
+    return f"file://{prefix}{encoded}"
+
+
+def path_to_file_url(path: Path, prefix: str = "") -> str:
+    """
+    Path'i file:// URL'e dönüştür.
+
+    Args:
+        path: Dosya yolu
+        prefix: Host kısmı (ör. Premiere için "localhost")
+
+    Returns:
+        file://<prefix><encoded path>
+    """
+    return _file_url_cached(str(path), prefix)
@@ -19,19 +19,81 @@ Referans: https://developer.apple.com/documentation/professional_video_applicati
 from __future__ import annotations
 
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from urllib.parse import quote
 import logging
 
 from lxml import etree
 
 from app.core.models import MediaInfo, Project, Cut
+from ._xml_util import path_to_file_url
 
 logger = logging.getLogger(__name__)
 
+# Bu sayının üzerindeki segmentlerde clip'ler thread pool ile oluşturulur
+PARALLEL_CLIP_THRESHOLD = 512
+
+
+# [son güncelleme zamanı, "YYYY-MM-DD"] - en fazla 60 sn'de bir yenilenir
+_today_cache = [0.0, ""]
+
+
+def _today_str() -> str:
+    """Bugünün tarihini (cache'li) döndür."""
+    now = time.time()
+    if now - _today_cache[0] > 60:
+        _today_cache[:] = [now, datetime.now().strftime('%Y-%m-%d')]
+    return _today_cache[1]
+
+
+# Common frame rates için (num_per_frame, denominator)
+FPS_DENOMINATORS = {
+    23.976: (1001, 24000),
+    24.0: (1, 24),
+    25.0: (1, 25),
+    29.97: (1001, 30000),
+    30.0: (1, 30),
+    50.0: (1, 50),
+    59.94: (1001, 60000),
+    60.0: (1, 60),
+}
+
+
+def _rate_for_fps(fps: float) -> tuple[int, int]:
+    """En yakın standart fps için (num_per_frame, den) döndür."""
+    closest_fps = min(FPS_DENOMINATORS, key=lambda x: abs(x - fps))
+    return FPS_DENOMINATORS[closest_fps]
+
+
+def _seconds_to_frames(seconds: float, den: int, npf: int) -> int:
+    """Saniyeyi (den, num_per_frame) rate'inde tam sayı frame'e çevir."""
+    return round(seconds * den / npf)
+
+
+def _segment_frames(
+    keep_segments: list[tuple[float, float]],
+    den: int,
+    npf: int,
+) -> list[tuple[int, int, int]]:
+    """
+    Segmentleri sınırda bir kez frame'e çevir.
+
+    Returns:
+        Her segment için (start, duration, timeline offset) frame sayıları
+    """
+    frames = []
+    offset = 0
+    for seg_start, seg_end in keep_segments:
+        duration = _seconds_to_frames(seg_end - seg_start, den, npf)
+        frames.append((_seconds_to_frames(seg_start, den, npf), duration, offset))
+        offset += duration
+    return frames
+
 
 def time_to_rational(seconds: float, fps: float = 30.0) -> str:
     """
@@ -47,24 +109,10 @@ def time_to_rational(seconds: float, fps: float = 30.0) -> str:
     Returns:
         FCPXML time string
     """
-    # Common frame rates için denominator
-    fps_denominators = {
-        23.976: (1001, 24000),
-        24.0: (1, 24),
-        25.0: (1, 25),
-        29.97: (1001, 30000),
-        30.0: (1, 30),
-        50.0: (1, 50),
-        59.94: (1001, 60000),
-        60.0: (1, 60),
-    }
-
-    # En yakın fps'i bul
-    closest_fps = min(fps_denominators.keys(), key=lambda x: abs(x - fps))
-    num_per_frame, den = fps_denominators[closest_fps]
+    num_per_frame, den = _rate_for_fps(fps)
 
     # Frame sayısı
-    frames = round(seconds * den / num_per_frame)
+    frames = _seconds_to_frames(seconds, den, num_per_frame)
 
     # Rational format
     numerator = frames * num_per_frame
@@ -79,19 +127,75 @@ def duration_to_rational(seconds: float, fps: float = 30.0) -> str:
 
 def path_to_url(path: Path) -> str:
     """Path'i file:// URL'e dönüştür."""
-    abs_path = path.resolve()
-    # URL encode (boşluklar vs.)
-    encoded = quote(str(abs_path), safe="/:@")
-    return f"file://{encoded}"
+    return path_to_file_url(path)
 
 
-def sanitize_name(name: str) -> str:
-    """FCPXML için güvenli isim oluştur."""
+@lru_cache(maxsize=1024)
+def _sanitize_cached(name: str) -> str:
     # Özel karakterleri kaldır
     name = re.sub(r'[<>&"\']', '', name)
     return name[:50]  # Max 50 karakter
 
 
+def sanitize_name(name: str) -> str:
+    """FCPXML için güvenli isim oluştur (aynı isim tekrar export'larda cache'den gelir)."""
+    return _sanitize_cached(name)
+
+
+def _escape_attr(value: str) -> bytes:
+    """Attribute değerini lxml ile aynı şekilde escape edip UTF-8'e çevir."""
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+        .replace("\t", "&#9;")
+        .encode("utf-8")
+    )
+
+
+def _tag(tag: str, attrib: dict[str, str], close: bool = False) -> bytes:
+    """Açılış (veya self-closing) tag'ini byte olarak üret."""
+    parts = [b"<", tag.encode()]
+    for key, value in attrib.items():
+        parts += (b" ", key.encode(), b'="', _escape_attr(value), b'"')
+    parts.append(b"/>" if close else b">")
+    return b"".join(parts)
+
+
+def _make_clip(
+    index: int,
+    start_frames: int,
+    duration_frames: int,
+    offset_frames: int,
+    ref: str,
+    has_video: bool,
+    has_audio: bool,
+    npf: int,
+    den: int,
+) -> etree._Element:
+    """Tek bir asset-clip elementi oluştur (parent'sız)."""
+    # Tüm attribute'lar tek seferde verilir (sonradan .set() yok)
+    attrib = {
+        "name": f"Clip {index + 1}",
+        "ref": ref,
+        "offset": f"{offset_frames * npf}/{den}s",
+        "duration": f"{duration_frames * npf}/{den}s",
+        "start": f"{start_frames * npf}/{den}s",
+        "tcFormat": "NDF",
+    }
+
+    # Audio/video roles
+    if has_video:
+        attrib["videoRole"] = "video"
+    if has_audio:
+        attrib["audioRole"] = "dialogue"
+
+    return etree.Element("asset-clip", attrib=attrib)
+
+
 @dataclass
 class FCPXMLBuilder:
     """
@@ -105,6 +209,7 @@ class FCPXMLBuilder:
     project: Project
     output_path: Path
     version: str = "1.10"
+    validate: bool = False  # Kaydetmeden önce çıktıyı lxml ile parse et
 
     # Internal state
     _root: Optional[etree._Element] = None
@@ -132,14 +237,11 @@ class FCPXMLBuilder:
 
         # Library -> Event -> Project -> Sequence
         library = etree.SubElement(self._root, "library")
-        event = etree.SubElement(
-            library, "event",
-            name=f"AutoCut Export {datetime.now().strftime('%Y-%m-%d')}"
-        )
+        event = etree.SubElement(library, "event", name=self._event_name())
 
         project_elem = etree.SubElement(
             event, "project",
-            name=sanitize_name(self.project.name or media.file_path.stem)
+            name=self._project_name(media),
         )
 
         # Sequence
@@ -148,8 +250,16 @@ class FCPXMLBuilder:
 
         return self._root
 
-    def _build_format(self, media: MediaInfo) -> None:
-        """Video format resource."""
+    def _event_name(self) -> str:
+        """Event adı (export tarihi ile)."""
+        return f"AutoCut Export {_today_str()}"
+
+    def _project_name(self, media: MediaInfo) -> str:
+        """Project elementi adı."""
+        return sanitize_name(self.project.name or media.file_path.stem)
+
+    def _format_attrib(self, media: MediaInfo) -> dict[str, str]:
+        """Format resource attribute'ları."""
         self._format_id = "r1"
 
         # Frame duration
@@ -158,32 +268,56 @@ class FCPXMLBuilder:
 
         # Format element - sadece video format bilgileri
         # audioSampleRate ve audioChannels DTD'de yok
-        etree.SubElement(
-            self._resources, "format",
-            id=self._format_id,
-            name=f"FFVideoFormat{media.height or 1080}p{int(fps)}",
-            frameDuration=frame_duration,
-            width=str(media.width) if media.width else "1920",
-            height=str(media.height) if media.height else "1080",
-        )
-
-    def _build_asset(self, media: MediaInfo) -> None:
-        """Media asset resource."""
+        return {
+            "id": self._format_id,
+            "name": f"FFVideoFormat{media.height or 1080}p{int(fps)}",
+            "frameDuration": frame_duration,
+            "width": str(media.width) if media.width else "1920",
+            "height": str(media.height) if media.height else "1080",
+        }
+
+    def _asset_attrib(self, media: MediaInfo) -> dict[str, str]:
+        """Asset resource attribute'ları."""
         self._asset_id = "r2"
 
         fps = media.fps or 30.0
 
         # Asset element - src attribute yerine media-rep child kullanılmalı
-        asset = etree.SubElement(
-            self._resources, "asset",
-            id=self._asset_id,
-            name=sanitize_name(media.file_path.stem),
-            start="0s",
-            duration=duration_to_rational(media.duration, fps),
-            hasVideo="1" if media.has_video else "0",
-            hasAudio="1" if media.has_audio else "0",
-            format=self._format_id,
-        )
+        return {
+            "id": self._asset_id,
+            "name": sanitize_name(media.file_path.stem),
+            "start": "0s",
+            "duration": duration_to_rational(media.duration, fps),
+            "hasVideo": "1" if media.has_video else "0",
+            "hasAudio": "1" if media.has_audio else "0",
+            "format": self._format_id,
+        }
+
+    def _sequence_attrib(
+        self,
+        media: MediaInfo,
+        keep_segments: list[tuple[float, float]],
+    ) -> dict[str, str]:
+        """Sequence attribute'ları."""
+        fps = media.fps or 30.0
+
+        # Toplam duration (korunan segmentlerin toplamı)
+        total_duration = sum(end - start for start, end in keep_segments)
+
+        return {
+            "duration": duration_to_rational(total_duration, fps),
+            "format": self._format_id,
+            "tcStart": "0s",
+            "tcFormat": "NDF",  # Non-drop frame
+        }
+
+    def _build_format(self, media: MediaInfo) -> None:
+        """Video format resource."""
+        etree.SubElement(self._resources, "format", attrib=self._format_attrib(media))
+
+    def _build_asset(self, media: MediaInfo) -> None:
+        """Media asset resource."""
+        asset = etree.SubElement(self._resources, "asset", attrib=self._asset_attrib(media))
 
         # media-rep child element - source file location
         etree.SubElement(
@@ -200,63 +334,135 @@ class FCPXMLBuilder:
         """Timeline sequence oluştur."""
         fps = media.fps or 30.0
 
-        # Toplam duration (korunan segmentlerin toplamı)
-        total_duration = sum(end - start for start, end in keep_segments)
-
-        sequence = etree.Element(
-            "sequence",
-            duration=duration_to_rational(total_duration, fps),
-            format=self._format_id,
-            tcStart="0s",
-            tcFormat="NDF",  # Non-drop frame
-        )
+        sequence = etree.Element("sequence", attrib=self._sequence_attrib(media, keep_segments))
 
         # Spine (ana timeline)
         spine = etree.SubElement(sequence, "spine")
 
-        # Her korunan segment için asset-clip
-        timeline_offset = 0.0
+        # Segmentler bir kez tam sayı frame'e çevrilir; döngüde float yok
+        npf, den = _rate_for_fps(fps)
+        frames = _segment_frames(keep_segments, den, npf)
 
-        for i, (seg_start, seg_end) in enumerate(keep_segments):
-            seg_duration = seg_end - seg_start
+        # Döngü boyunca değişmeyen değerler
+        ref = self._asset_id
+        has_video = media.has_video
+        has_audio = media.has_audio
 
-            clip = etree.SubElement(
-                spine, "asset-clip",
-                name=f"Clip {i + 1}",
-                ref=self._asset_id,
-                offset=time_to_rational(timeline_offset, fps),
-                duration=duration_to_rational(seg_duration, fps),
-                start=time_to_rational(seg_start, fps),
-                tcFormat="NDF",
+        def make(i: int) -> etree._Element:
+            start, duration, offset = frames[i]
+            return _make_clip(
+                i, start, duration, offset,
+                ref, has_video, has_audio, npf, den,
             )
 
-            # Audio/video roles
-            if media.has_video:
-                clip.set("videoRole", "video")
-            if media.has_audio:
-                clip.set("audioRole", "dialogue")
+        # Çok büyük timeline'larda clip'leri paralel oluştur, sırayla ekle
+        indices = range(len(keep_segments))
+        if len(keep_segments) > PARALLEL_CLIP_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                clips = list(executor.map(make, indices))
+        else:
+            clips = [make(i) for i in indices]
 
-            timeline_offset += seg_duration
+        spine.extend(clips)
 
         return sequence
 
+    def _emit_spine(
+        self,
+        out: list[bytes],
+        media: MediaInfo,
+        keep_segments: list[tuple[float, float]],
+    ) -> None:
+        """Spine içindeki asset-clip'leri önceden encode edilmiş byte parçalarıyla üret."""
+        fps = media.fps or 30.0
+        num_per_frame, den = _rate_for_fps(fps)
+
+        # Döngüde değişmeyen parçalar bir kez encode edilir
+        indent = b"            "
+        b_name = indent + b'<asset-clip name="Clip '
+        b_ref = b'" ref="' + _escape_attr(self._asset_id) + b'" offset="'
+        b_den = f"/{den}s".encode()
+        b_tail = b'" tcFormat="NDF"'
+        if media.has_video:
+            b_tail += b' videoRole="video"'
+        if media.has_audio:
+            b_tail += b' audioRole="dialogue"'
+        b_tail += b"/>\n"
+
+        append = out.append
+        frames = _segment_frames(keep_segments, den, num_per_frame)
+        for i, (start, duration, offset) in enumerate(frames):
+            append(b"".join((
+                b_name, str(i + 1).encode(), b_ref,
+                str(offset * num_per_frame).encode(), b_den,
+                b'" duration="', str(duration * num_per_frame).encode(), b_den,
+                b'" start="', str(start * num_per_frame).encode(), b_den,
+                b_tail,
+            )))
+
+    def _emit_document(self, out: list[bytes]) -> None:
+        """
+        Tüm dokümanı lxml ağacı kurmadan byte parçaları olarak üret.
+
+        Çıktı, build() + etree.tostring(pretty_print=True) ile birebir aynıdır.
+        """
+        if not self.project.media_info:
+            raise ValueError("Project has no media info")
+
+        media = self.project.media_info
+        keep_segments = self.project.get_keep_segments()
+
+        logger.info(f"Emitting FCPXML with {len(keep_segments)} segments")
+
+        out.append(b"<?xml version='1.0' encoding='UTF-8'?>\n<!DOCTYPE fcpxml>\n")
+        out.append(_tag("fcpxml", {"version": self.version}) + b"\n")
+
+        # Resources
+        out.append(b"  <resources>\n")
+        out.append(b"    " + _tag("format", self._format_attrib(media), close=True) + b"\n")
+        out.append(b"    " + _tag("asset", self._asset_attrib(media)) + b"\n")
+        out.append(b"      " + _tag(
+            "media-rep",
+            {"kind": "original-media", "src": path_to_url(media.file_path)},
+            close=True,
+        ) + b"\n")
+        out.append(b"    </asset>\n  </resources>\n")
+
+        # Library -> Event -> Project -> Sequence -> Spine
+        out.append(b"  <library>\n")
+        out.append(b"    " + _tag("event", {"name": self._event_name()}) + b"\n")
+        out.append(b"      " + _tag("project", {"name": self._project_name(media)}) + b"\n")
+        sequence_attrib = self._sequence_attrib(media, keep_segments)
+        out.append(b"        " + _tag("sequence", sequence_attrib) + b"\n")
+        if keep_segments:
+            out.append(b"          <spine>\n")
+            self._emit_spine(out, media, keep_segments)
+            out.append(b"          </spine>\n")
+        else:
+            out.append(b"          <spine/>\n")
+        out.append(b"        </sequence>\n      </project>\n    </event>\n  </library>\n")
+        out.append(b"</fcpxml>\n")
+
+    def to_bytes(self) -> bytes:
+        """FCPXML dokümanını (XML declaration + DOCTYPE dahil) byte olarak döndür."""
+        out: list[bytes] = []
+        self._emit_document(out)
+        return b"".join(out)
+
     def save(self) -> Path:
         """FCPXML dosyasını kaydet."""
-        if self._root is None:
-            self.build()
+        # XML parçalarını oluştur - DOCTYPE dahil
+        out: list[bytes] = []
+        self._emit_document(out)
 
-        # XML string oluştur - DOCTYPE dahil
-        xml_string = etree.tostring(
-            self._root,
-            pretty_print=True,
-            xml_declaration=True,
-            encoding="UTF-8",
-            doctype="<!DOCTYPE fcpxml>",
-        )
+        # Opsiyonel doğrulama (well-formed değilse XMLSyntaxError)
+        if self.validate:
+            etree.fromstring(b"".join(out))
 
-        # Dosyaya yaz
+        # Dosyaya tek writelines ile yaz
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.output_path.write_bytes(xml_string)
+        with open(self.output_path, "wb") as f:
+            f.writelines(out)
 
         logger.info(f"FCPXML saved to {self.output_path}")
         return self.output_path
@@ -278,6 +484,7 @@ def export_fcpxml(
     project: Project,
     output_path: Path,
     version: str = "1.10",
+    validate: bool = False,
 ) -> Path:
     """
     Convenience function for FCPXML export.
@@ -286,6 +493,7 @@ def export_fcpxml(
         project: AutoCut project
         output_path: Çıktı dosya yolu
         version: FCPXML version
+        validate: Kaydetmeden önce XML'i lxml ile doğrula
 
     Returns:
         Kaydedilen dosya path'i
@@ -294,6 +502,7 @@ def export_fcpxml(
         project=project,
         output_path=output_path,
         version=version,
+        validate=validate,
     )
     return builder.save()
 
@@ -7,20 +7,26 @@ Premiere Pro CC bu formatı "Final Cut Pro XML" olarak import eder.
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 from typing import Optional
-from urllib.parse import quote
 import logging
 import uuid
 
+import numpy as np
 from lxml import etree
 
 from app.core.models import MediaInfo, Project
+from ._xml_util import path_to_file_url
 
 logger = logging.getLogger(__name__)
 
+# Tüm clipitem'ların ortak <file> referansı; kopyalanarak eklenir
+_FILE_REF_PROTO = etree.Element("file", id="file-1")
+
 
 def seconds_to_ticks(seconds: float, timebase: int = 30) -> int:
     """Saniyeyi tick'e dönüştür."""
@@ -28,10 +34,31 @@ def seconds_to_ticks(seconds: float, timebase: int = 30) -> int:
 
 
 def path_to_url(path: Path) -> str:
-    """Path'i file:// URL'e dönüştür."""
-    abs_path = path.resolve()
-    encoded = quote(str(abs_path), safe="/:@")
-    return f"file://localhost{encoded}"
+    """Path'i file://localhost URL'e dönüştür."""
+    return path_to_file_url(path, prefix="localhost")
+
+
+@cache
+def _rate_proto(timebase: int, ntsc: bool = False) -> etree._Element:
+    """
+    <rate> prototipi.
+
+    Dönen element paylaşılır; ağaca eklemeden önce copy.deepcopy ile kopyalanmalı.
+    """
+    rate = etree.Element("rate")
+    etree.SubElement(rate, "timebase").text = str(timebase)
+    etree.SubElement(rate, "ntsc").text = "TRUE" if ntsc else "FALSE"
+    return rate
+
+
+@cache
+def _timecode_proto(timebase: int, ntsc: bool = False) -> etree._Element:
+    """<timecode> prototipi (00:00:00:00). _rate_proto gibi kopyalanarak kullanılır."""
+    tc = etree.Element("timecode")
+    etree.SubElement(tc, "string").text = "00:00:00:00"
+    etree.SubElement(tc, "frame").text = "0"
+    tc.append(copy.deepcopy(_rate_proto(timebase, ntsc)))
+    return tc
 
 
 @dataclass
@@ -89,9 +116,7 @@ class PremiereXMLBuilder:
         etree.SubElement(clip, "duration").text = str(duration)
 
         # Rate
-        rate = etree.SubElement(clip, "rate")
-        etree.SubElement(rate, "timebase").text = str(timebase)
-        etree.SubElement(rate, "ntsc").text = "FALSE"
+        clip.append(copy.deepcopy(_rate_proto(timebase)))
 
         # Media
         media_elem = etree.SubElement(clip, "media")
@@ -104,9 +129,7 @@ class PremiereXMLBuilder:
             etree.SubElement(clip_item, "name").text = media.file_path.stem
             etree.SubElement(clip_item, "duration").text = str(duration)
 
-            rate2 = etree.SubElement(clip_item, "rate")
-            etree.SubElement(rate2, "timebase").text = str(timebase)
-            etree.SubElement(rate2, "ntsc").text = "FALSE"
+            clip_item.append(copy.deepcopy(_rate_proto(timebase)))
 
             # File reference
             file_elem = etree.SubElement(clip_item, "file", id="file-1")
@@ -114,9 +137,7 @@ class PremiereXMLBuilder:
             etree.SubElement(file_elem, "pathurl").text = path_to_url(media.file_path)
             etree.SubElement(file_elem, "duration").text = str(duration)
 
-            file_rate = etree.SubElement(file_elem, "rate")
-            etree.SubElement(file_rate, "timebase").text = str(timebase)
-            etree.SubElement(file_rate, "ntsc").text = "FALSE"
+            file_elem.append(copy.deepcopy(_rate_proto(timebase)))
 
         # Audio
         if media.has_audio:
@@ -139,26 +160,34 @@ class PremiereXMLBuilder:
         etree.SubElement(sequence, "name").text = f"{self.project.name or media.file_path.stem} - Edited"
         etree.SubElement(sequence, "uuid").text = str(uuid.uuid4())
 
+        # Segment sınırlarını bir kez frame'e çevir; string'ler video ve audio track'te ortak
+        segs = np.asarray(keep_segments, dtype=np.float64).reshape(-1, 2)
+        segs_i = (segs * timebase).astype(np.int64)
+        durs_i = segs_i[:, 1] - segs_i[:, 0]
+        ends_i = np.cumsum(durs_i)
+        offs_i = ends_i - durs_i
+        s_dur = [str(x) for x in durs_i.tolist()]
+        s_start = [str(x) for x in offs_i.tolist()]
+        s_end = [str(x) for x in ends_i.tolist()]
+        s_in = [str(x) for x in segs_i[:, 0].tolist()]
+        s_out = [str(x) for x in segs_i[:, 1].tolist()]
+
         # Toplam süre
-        total_duration = sum(end - start for start, end in keep_segments)
-        etree.SubElement(sequence, "duration").text = str(int(total_duration * timebase))
+        etree.SubElement(sequence, "duration").text = str(int(durs_i.sum()))
 
         # Rate
-        rate = etree.SubElement(sequence, "rate")
-        etree.SubElement(rate, "timebase").text = str(timebase)
-        etree.SubElement(rate, "ntsc").text = "FALSE"
+        sequence.append(copy.deepcopy(_rate_proto(timebase)))
 
         # Timecode
-        tc = etree.SubElement(sequence, "timecode")
-        etree.SubElement(tc, "string").text = "00:00:00:00"
-        etree.SubElement(tc, "frame").text = "0"
-        tc_rate = etree.SubElement(tc, "rate")
-        etree.SubElement(tc_rate, "timebase").text = str(timebase)
-        etree.SubElement(tc_rate, "ntsc").text = "FALSE"
+        sequence.append(copy.deepcopy(_timecode_proto(timebase)))
 
         # Media
         seq_media = etree.SubElement(sequence, "media")
 
+        # Segment döngülerinde global lookup yerine local kullan
+        sub_element = etree.SubElement
+        deepcopy = copy.deepcopy
+
         # Video track
         if media.has_video:
             video = etree.SubElement(seq_media, "video")
@@ -172,25 +201,20 @@ class PremiereXMLBuilder:
             # Track
             track = etree.SubElement(video, "track")
 
-            timeline_offset = 0
-            for i, (seg_start, seg_end) in enumerate(keep_segments):
-                seg_duration = seg_end - seg_start
-
-                clip_item = etree.SubElement(track, "clipitem", id=f"v-clipitem-{i+1}")
-                etree.SubElement(clip_item, "name").text = f"Clip {i+1}"
+            for i in range(len(keep_segments)):
+                clip_item = sub_element(track, "clipitem", id=f"v-clipitem-{i+1}")
+                sub_element(clip_item, "name").text = f"Clip {i+1}"
 
-                etree.SubElement(clip_item, "duration").text = str(int(seg_duration * timebase))
-                etree.SubElement(clip_item, "start").text = str(int(timeline_offset * timebase))
-                etree.SubElement(clip_item, "end").text = str(int((timeline_offset + seg_duration) * timebase))
+                sub_element(clip_item, "duration").text = s_dur[i]
+                sub_element(clip_item, "start").text = s_start[i]
+                sub_element(clip_item, "end").text = s_end[i]
 
                 # In/out points (source)
-                etree.SubElement(clip_item, "in").text = str(int(seg_start * timebase))
-                etree.SubElement(clip_item, "out").text = str(int(seg_end * timebase))
+                sub_element(clip_item, "in").text = s_in[i]
+                sub_element(clip_item, "out").text = s_out[i]
 
                 # File reference
-                file_ref = etree.SubElement(clip_item, "file", id="file-1")
-
-                timeline_offset += seg_duration
+                clip_item.append(deepcopy(_FILE_REF_PROTO))
 
         # Audio track
         if media.has_audio:
@@ -205,23 +229,18 @@ class PremiereXMLBuilder:
             # Track
             track = etree.SubElement(audio, "track")
 
-            timeline_offset = 0
-            for i, (seg_start, seg_end) in enumerate(keep_segments):
-                seg_duration = seg_end - seg_start
-
-                clip_item = etree.SubElement(track, "clipitem", id=f"a-clipitem-{i+1}")
-                etree.SubElement(clip_item, "name").text = f"Clip {i+1}"
-
-                etree.SubElement(clip_item, "duration").text = str(int(seg_duration * timebase))
-                etree.SubElement(clip_item, "start").text = str(int(timeline_offset * timebase))
-                etree.SubElement(clip_item, "end").text = str(int((timeline_offset + seg_duration) * timebase))
+            for i in range(len(keep_segments)):
+                clip_item = sub_element(track, "clipitem", id=f"a-clipitem-{i+1}")
+                sub_element(clip_item, "name").text = f"Clip {i+1}"
 
-                etree.SubElement(clip_item, "in").text = str(int(seg_start * timebase))
-                etree.SubElement(clip_item, "out").text = str(int(seg_end * timebase))
+                sub_element(clip_item, "duration").text = s_dur[i]
+                sub_element(clip_item, "start").text = s_start[i]
+                sub_element(clip_item, "end").text = s_end[i]
 
-                file_ref = etree.SubElement(clip_item, "file", id="file-1")
+                sub_element(clip_item, "in").text = s_in[i]
+                sub_element(clip_item, "out").text = s_out[i]
 
-                timeline_offset += seg_duration
+                clip_item.append(deepcopy(_FILE_REF_PROTO))
 
         return sequence
 
@@ -1,11 +1,12 @@
 """Media processing module."""
 
-from .ffmpeg import FFmpegWrapper, probe_media, extract_audio, generate_proxy
-from .waveform import WaveformGenerator, WaveformData
+from .ffmpeg import FFmpegWrapper, extract_audio, generate_proxy, probe_many, probe_media
+from .waveform import WaveformData, WaveformGenerator
 
 __all__ = [
     "FFmpegWrapper",
     "probe_media",
+    "probe_many",
     "extract_audio",
     "generate_proxy",
     "WaveformGenerator",
@@ -0,0 +1,20 @@
+"""
+Cache dosya adları için kısa hash.
+
+xxhash kuruluysa xxh3_64 kullanılır, değilse md5'e düşülür.
+"""
+
+from __future__ import annotations
+
+try:
+    import xxhash
+
+    def cache_hash(key: str) -> str:
+        """Cache anahtarından 16 karakterlik hex hash üret."""
+        return xxhash.xxh3_64_hexdigest(key.encode())
+except ImportError:
+    import hashlib
+
+    def cache_hash(key: str) -> str:
+        """Cache anahtarından 16 karakterlik hex hash üret."""
+        return hashlib.md5(key.encode()).hexdigest()[:16]
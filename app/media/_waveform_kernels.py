@@ -0,0 +1,60 @@
+"""
+Numba ile derlenmiş waveform kernel'ları.
+
+Opsiyonel: numba kurulu değilse import ImportError verir ve
+waveform.py NumPy yoluna düşer.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+# fastmath'in ninf/nnan'sız hali: NaN/inf içeren sample'larda davranış tanımlı kalır
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def peaks_minmax(
+    audio: np.ndarray,
+    spb: int,
+    out_min: np.ndarray,
+    out_max: np.ndarray,
+) -> None:
+    """Her bucket için min/max'ı tek geçişte hesapla (son bucket kısmi olabilir)."""
+    total = audio.shape[0]
+    num_buckets = out_min.shape[0]
+    for b in prange(num_buckets):
+        start = b * spb
+        end = min(start + spb, total)
+        if start >= end:
+            continue
+        lo = audio[start]
+        hi = lo
+        for j in range(start + 1, end):
+            v = audio[j]
+            if v < lo:
+                lo = v
+            if v > hi:
+                hi = v
+        out_min[b] = lo
+        out_max[b] = hi
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def rms_db(audio: np.ndarray, frame_size: int, out: np.ndarray) -> None:
+    """Frame bazlı RMS dBFS (sessiz frame'ler -96 dB)."""
+    num_frames = out.shape[0]
+    for i in prange(num_frames):
+        start = i * frame_size
+        acc = 0.0
+        for j in range(start, start + frame_size):
+            v = audio[j]
+            acc += v * v
+        rms = math.sqrt(acc / frame_size)
+        if rms > 0:
+            out[i] = 20.0 * math.log10(rms)
+        else:
+            out[i] = -96.0
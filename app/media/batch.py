@@ -0,0 +1,96 @@
+"""
+Çoklu dosya için paralel medya işleme.
+
+Her dosya ayrı bir process'te işlenir; NumPy/Numba waveform hesabı GIL'e
+takılmadan tüm çekirdeklerde çalışır. Her worker aynı anda tek ffmpeg
+çalıştırdığı için toplam ffmpeg process sayısı max_workers'ı geçmez.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
+
+from app.core.models import MediaInfo
+from app.core.settings import Settings
+from app.media._cache_key import cache_hash
+from app.media.ffmpeg import FFmpegNotFoundError, get_wrapper
+from app.media.waveform import WaveformData, WaveformGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker() -> None:
+    """Worker process'i ısıt: ffmpeg path'leri ve (varsa) Numba JIT cache'i."""
+    try:
+        get_wrapper()
+    except FFmpegNotFoundError as e:
+        # Isıtma opsiyonel; ffmpeg gerektiren fn hatayı kendisi fırlatır
+        logger.debug(f"Worker warm-up skipped: {e}")
+
+    from app.media.waveform import _kernels
+
+    kernels = _kernels()
+    if kernels is not None:
+        import numpy as np
+
+        # Küçük bir çağrı ile kernel'ı derlet / disk cache'ten yükle
+        out = np.zeros(1, dtype=np.float32)
+        kernels.peaks_minmax(np.zeros(4, dtype=np.float32), 4, out, out.copy())
+
+
+def extract_and_waveform(path: Path) -> tuple[MediaInfo, WaveformData]:
+    """Probe, audio extract ve waveform üretimi (tek dosya)."""
+    wrapper = get_wrapper()
+    media = wrapper.probe(path)
+
+    cache_dir = Settings.get_cache_dir()
+    # Farklı klasörlerde aynı isimli dosyalar paralel işlenince aynı WAV'a yazmasın
+    audio_path = cache_dir / f"{path.stem}_{cache_hash(str(path.resolve()))}_audio.wav"
+    wrapper.extract_audio(path, audio_path, sample_rate=48000, mono=True)
+    media.audio_path = audio_path
+
+    generator = WaveformGenerator(samples_per_bucket=256, cache_dir=cache_dir)
+    return media, generator.generate(audio_path)
+
+
+def batch_process(
+    paths: list[Path],
+    fn: Callable[[Path], Any] = extract_and_waveform,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[float], None]] = None,
+) -> dict[Path, Any]:
+    """
+    Dosyaları process pool'da paralel işle.
+
+    Args:
+        paths: Dosya yolları
+        fn: Her dosya için çağrılacak (pickle edilebilir, modül seviyesinde) fonksiyon
+        max_workers: Worker sayısı (None ise CPU sayısı)
+        progress_callback: İlerleme callback'i (0.0 - 1.0), tamamlanan her dosyada
+
+    Returns:
+        path -> fn(path) sonucu
+
+    Raises:
+        Herhangi bir dosyada fn'in fırlattığı hata
+    """
+    if not paths:
+        return {}
+
+    workers = min(max_workers or os.cpu_count() or 4, len(paths))
+    logger.info(f"Batch processing {len(paths)} files with {workers} workers")
+
+    results: dict[Path, Any] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(fn, path): path for path in paths}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if progress_callback:
+                progress_callback(done / len(paths))
+
+    return results
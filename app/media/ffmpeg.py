@@ -9,21 +9,54 @@ Provides:
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
+import re
 import subprocess
 import shutil
 import sys
 import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Optional, Callable
 import logging
 
+import numpy as np
+
 from app.core.models import MediaInfo
 
 logger = logging.getLogger(__name__)
 
+# ffmpeg stderr başlığındaki input süresi: "Duration: 00:01:23.45"
+_DURATION_RE = re.compile(r"Duration:\s+(\d+):(\d+):(\d+\.\d+)")
+
+# UI için sınırlı probe: süre/çözünürlük/codec header'dan okunur, tüm
+# stream analizi gerekmez (ffmpeg varsayılanı 5 MB / 5 sn)
+PROBE_SIZE = 1_000_000  # byte
+PROBE_ANALYZE_DURATION = 500_000  # mikrosaniye
+
+# progress_callback en fazla bu aralıkla çağrılır (UI'a ≤10 Hz)
+PROGRESS_INTERVAL = 0.1  # saniye
+# Kısa işler (audio çıkarma) için üst süre; render/proxy süre sınırı olmadan çalışır
+FFMPEG_TIMEOUT = 3600.0  # saniye
+
+# orjson varsa ffprobe çıktısı doğrudan bytes üzerinden parse edilir
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
+@lru_cache(maxsize=1)
 def get_bundle_bin_path() -> Optional[Path]:
     """Get the path to bundled binaries (for PyInstaller builds)."""
     if getattr(sys, 'frozen', False):
@@ -35,6 +68,7 @@ def get_bundle_bin_path() -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=1)
 def get_static_ffmpeg_path() -> Optional[Path]:
     """Get path to static-ffmpeg package binaries."""
     try:
@@ -58,6 +92,7 @@ def get_static_ffmpeg_path() -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=1)
 def find_ffmpeg() -> Optional[str]:
     """Find ffmpeg binary, checking bundle first, then static-ffmpeg, then system."""
     # 1. Check bundle first (PyInstaller)
@@ -80,6 +115,7 @@ def find_ffmpeg() -> Optional[str]:
     return shutil.which("ffmpeg")
 
 
+@lru_cache(maxsize=1)
 def find_ffprobe() -> Optional[str]:
     """Find ffprobe binary, checking bundle first, then static-ffmpeg, then system."""
     # 1. Check bundle first (PyInstaller)
@@ -102,6 +138,189 @@ def find_ffprobe() -> Optional[str]:
     return shutil.which("ffprobe")
 
 
+def invalidate_ffmpeg_cache() -> None:
+    """
+    Binary path cache'lerini ve wrapper singleton'ını sıfırla.
+
+    FFmpeg sonradan kurulduğunda (veya testlerde) çağrılır.
+    """
+    global _wrapper
+    from app.media import ffmpeg_installer
+
+    for fn in (
+        get_bundle_bin_path,
+        get_static_ffmpeg_path,
+        find_ffmpeg,
+        find_ffprobe,
+        _detect_hw_encoder,
+        _supports_stats_period,
+        ffmpeg_installer.is_ffmpeg_installed,
+        ffmpeg_installer.is_homebrew_installed,
+    ):
+        fn.cache_clear()
+
+    with _wrapper_lock:
+        _wrapper = None
+
+
+@cache
+def _detect_hw_encoder(ffmpeg_path: str) -> str:
+    """
+    Kullanılabilir H.264 donanım encoder'ını seç (ffmpeg başına bir kez).
+
+    Sıra: macOS'ta VideoToolbox, diğerlerinde NVENC, QSV; yoksa libx264.
+    """
+    import platform as plat
+
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        encoders = result.stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return "libx264"
+
+    if plat.system() == "Darwin":
+        candidates = ("h264_videotoolbox",)
+    else:
+        candidates = ("h264_nvenc", "h264_qsv")
+
+    for name in candidates:
+        if re.search(rf"\s{name}\s", encoders):
+            logger.info(f"Using hardware encoder: {name}")
+            return name
+    return "libx264"
+
+
+@cache
+def _supports_stats_period(ffmpeg_path: str) -> bool:
+    """
+    -stats_period ffmpeg 4.4 ile geldi; daha eski sürümler bu seçenekte hata verir.
+
+    Sürüm numarası olmayan git build'leri ("N-12345-g...") yeni kabul edilir.
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-version"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+    match = re.match(r"ffmpeg version n?(\d+)\.(\d+)", result.stdout)
+    if match is None:
+        return True
+    return (int(match.group(1)), int(match.group(2))) >= (4, 4)
+
+
+# Final render kalite ayarları; HW encoder'lar libx264 -crf 18'e yakın kalite hedefler
+_RENDER_VIDEO_ARGS = {
+    "libx264": ["-preset", "fast", "-crf", "18"],
+    "h264_nvenc": ["-preset", "p5", "-rc", "vbr", "-cq", "19", "-b:v", "0"],
+    "h264_qsv": ["-preset", "medium", "-global_quality", "19"],
+    "h264_videotoolbox": ["-q:v", "65"],
+}
+
+
+def render_video_args(encoder: str) -> list[str]:
+    """Re-encode render için -c:v ve encoder'a özgü kalite argümanları."""
+    return ["-c:v", encoder, *_RENDER_VIDEO_ARGS.get(encoder, [])]
+
+
+# Paralel render: parça başına en az bu kadar içerik (kısa işlerde process maliyeti baskın)
+RENDER_MIN_BATCH_SECONDS = 30.0
+RENDER_MAX_JOBS = 8
+# Tüketici GPU'larında eşzamanlı HW encode oturumu sınırlı
+RENDER_MAX_HW_JOBS = 2
+
+
+def render_jobs(encoder: str) -> int:
+    """Re-encode render için eşzamanlı ffmpeg sayısı."""
+    jobs = min(os.cpu_count() or 1, RENDER_MAX_JOBS)
+    if encoder != "libx264":
+        jobs = min(jobs, RENDER_MAX_HW_JOBS)
+    return jobs
+
+
+def split_segments(
+    segments: list[tuple[float, float]],
+    parts: int,
+) -> list[list[tuple[float, float]]]:
+    """
+    Tutulacak segmentleri toplam süresi eşit, ardışık parçalara böl.
+
+    Parça sınırına denk gelen segment ikiye bölünür; böylece tek uzun
+    segment de dengeli dağıtılır. Parçalar sırayla birleştirildiğinde
+    orijinal segment listesiyle aynı içeriği verir.
+
+    Args:
+        segments: Sıralı (start, end) aralıkları, saniye
+        parts: İstenen parça sayısı (üst sınır)
+
+    Returns:
+        Boş olmayan parça listesi (en az bir)
+    """
+    total = sum(end - start for start, end in segments)
+    parts = max(1, min(parts, int(total // RENDER_MIN_BATCH_SECONDS)))
+    if parts == 1:
+        return [list(segments)]
+
+    target = total / parts
+    batches: list[list[tuple[float, float]]] = []
+    current: list[tuple[float, float]] = []
+    room = target
+
+    for start, end in segments:
+        while len(batches) < parts - 1 and end - start > room:
+            if room > 1e-3:
+                current.append((start, start + room))
+                start += room
+            batches.append(current)
+            current = []
+            room = target
+        current.append((start, end))
+        room -= end - start
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def trim_concat_filter(
+    segments: list[tuple[float, float]],
+    offset: float = 0.0,
+    video: bool = True,
+    audio: bool = True,
+) -> str:
+    """
+    Segmentleri trim/atrim ile seçip concat eden filter_complex grafiği.
+
+    Çıkış etiketleri [outv] ve/veya [outa]. offset, girişte -ss ile atlanan
+    süredir; video/audio False ise o akış grafiğe hiç girmez.
+    """
+    filter_parts = []
+    concat_inputs = []
+    for i, (start, end) in enumerate(segments):
+        start, end = start - offset, end - offset
+        if video:
+            filter_parts.append(f"[0:v]trim=start={start}:end={end},setpts=PTS-STARTPTS[v{i}]")
+            concat_inputs.append(f"[v{i}]")
+        if audio:
+            filter_parts.append(f"[0:a]atrim=start={start}:end={end},asetpts=PTS-STARTPTS[a{i}]")
+            concat_inputs.append(f"[a{i}]")
+
+    outputs = ("[outv]" if video else "") + ("[outa]" if audio else "")
+    filter_parts.append(
+        f"{''.join(concat_inputs)}concat=n={len(segments)}:v={int(video)}:a={int(audio)}{outputs}"
+    )
+    return ";".join(filter_parts)
+
+
 class FFmpegError(Exception):
     """FFmpeg işlemi hatası."""
     pass
@@ -137,12 +356,22 @@ class FFmpegWrapper:
         logger.info(f"FFmpeg: {self._ffmpeg}")
         logger.info(f"FFprobe: {self._ffprobe}")
 
-    def probe(self, file_path: Path) -> MediaInfo:
+    def probe(
+        self,
+        file_path: Path,
+        probesize: Optional[int] = None,
+        analyzeduration: Optional[int] = None,
+    ) -> MediaInfo:
         """
         Medya dosyasını analiz et ve metadata döndür.
 
+        Sonuçlar (path, size, mtime) ile bellekte cache'lenir; dosya değişmedikçe
+        ffprobe tekrar çalıştırılmaz. Oturumlar arası kalıcı cache probe_cache'tedir.
+
         Args:
             file_path: Video/audio dosya yolu
+            probesize: ffprobe -probesize (byte, None ise ffmpeg varsayılanı)
+            analyzeduration: ffprobe -analyzeduration (mikrosaniye, None ise varsayılan)
 
         Returns:
             MediaInfo object
@@ -153,34 +382,45 @@ class FFmpegWrapper:
         if not file_path.exists():
             raise FFmpegError(f"File not found: {file_path}")
 
-        cmd = [
-            self._ffprobe,
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_format",
-            "-show_streams",
-            str(file_path)
-        ]
+        stat = file_path.stat()
+        key = (
+            self._ffprobe, str(file_path), stat.st_size, stat.st_mtime_ns,
+            probesize, analyzeduration,
+        )
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                raise FFmpegError(f"FFprobe failed: {result.stderr}")
+        # Çağıran tarafın değişiklikleri cache'i bozmasın diye kopya döndür
+        return copy.copy(_probe_cached(*key))
+
+    def probe_many(
+        self,
+        paths: list[Path],
+        max_workers: Optional[int] = None,
+    ) -> list[MediaInfo]:
+        """
+        Birden fazla dosyayı paralel probe et.
+
+        ffprobe harici process olduğu için thread'ler yeterli; eşzamanlı
+        process sayısı max_workers ile sınırlanır. Cache probe() ile ortak.
+
+        Args:
+            paths: Dosya yolları
+            max_workers: Eşzamanlı ffprobe sayısı (None ise CPU sayısı)
+
+        Returns:
+            paths ile aynı sırada MediaInfo listesi
 
-            data = json.loads(result.stdout)
-        except subprocess.TimeoutExpired:
-            raise FFmpegError("FFprobe timeout")
-        except json.JSONDecodeError as e:
-            raise FFmpegError(f"Failed to parse FFprobe output: {e}")
+        Raises:
+            FFmpegError: Herhangi bir dosyanın probe'u başarısız olursa
+        """
+        if not paths:
+            return []
 
-        return self._parse_probe_result(file_path, data)
+        workers = min(max_workers or os.cpu_count() or 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.probe, paths))
 
-    def _parse_probe_result(self, file_path: Path, data: dict) -> MediaInfo:
+    @staticmethod
+    def _parse_probe_result(file_path: Path, data: dict) -> MediaInfo:
         """FFprobe JSON çıktısını MediaInfo'ya dönüştür."""
         format_info = data.get("format", {})
         streams = data.get("streams", [])
@@ -271,11 +511,42 @@ class FFmpegWrapper:
         Returns:
             Çıktı dosya path'i
         """
+        cmd = self._extract_audio_cmd(input_path, output_path, sample_rate, mono)
+
+        # Duration ayrıca probe edilmez; ffmpeg stderr'inden okunur
+        self._run_with_progress(cmd, None, progress_callback)
+        return output_path
+
+    async def extract_audio_async(
+        self,
+        input_path: Path,
+        output_path: Path,
+        sample_rate: int = 48000,
+        mono: bool = True,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> Path:
+        """
+        extract_audio'nun asyncio versiyonu.
+
+        Birden fazla dosya tek event loop'tan asyncio.gather ile çıkarılabilir.
+        """
+        cmd = self._extract_audio_cmd(input_path, output_path, sample_rate, mono)
+        await self._run_with_progress_async(cmd, None, progress_callback)
+        return output_path
+
+    def _extract_audio_cmd(
+        self,
+        input_path: Path,
+        output_path: Path,
+        sample_rate: int,
+        mono: bool,
+    ) -> list[str]:
+        """WAV çıkarma komutu."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         channels = "1" if mono else "2"
 
-        cmd = [
+        return [
             self._ffmpeg,
             "-y",  # Overwrite
             "-i", str(input_path),
@@ -287,17 +558,54 @@ class FFmpegWrapper:
             str(output_path)
         ]
 
-        # Progress için duration al
-        duration = None
-        if progress_callback:
-            try:
-                info = self.probe(input_path)
-                duration = info.duration
-            except FFmpegError:
-                pass
+    def stream_audio_pcm(
+        self,
+        input_path: Path,
+        sample_rate: int = 16000,
+        mono: bool = True,
+    ) -> np.ndarray:
+        """
+        Audio'yu WAV dosyasına yazmadan ham s16le PCM olarak oku.
 
-        self._run_with_progress(cmd, duration, progress_callback)
-        return output_path
+        Args:
+            input_path: Kaynak dosya
+            sample_rate: Çıktı sample rate
+            mono: True ise mono'ya dönüştür
+
+        Returns:
+            int16 array: mono ise (n,), değilse (n, 2)
+        """
+        channels = 1 if mono else 2
+
+        cmd = [
+            self._ffmpeg,
+            "-nostdin",
+            "-hide_banner",
+            "-i", str(input_path),
+            "-vn",
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "-ar", str(sample_rate),
+            "-ac", str(channels),
+            "pipe:1",
+        ]
+
+        logger.debug(f"Running FFmpeg: {' '.join(cmd)}")
+
+        # communicate stdout ve stderr'i birlikte okur (pipe dolup bloklanmaz)
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=FFMPEG_TIMEOUT)
+        except subprocess.TimeoutExpired as e:
+            raise FFmpegError("FFmpeg process timeout") from e
+
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", "replace")
+            raise FFmpegError(f"FFmpeg failed (code {result.returncode}): {stderr}")
+
+        audio = np.frombuffer(result.stdout, dtype=np.int16)
+        if channels > 1:
+            audio = audio[:len(audio) - len(audio) % channels].reshape(-1, channels)
+        return audio
 
     def generate_proxy(
         self,
@@ -320,37 +628,310 @@ class FFmpegWrapper:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Resolution mapping
+        # Resolution mapping: (scale, HW encoder bitrate)
         res_map = {
-            "480p": "854:480",
-            "720p": "1280:720",
-            "1080p": "1920:1080",
+            "480p": ("854:480", "1M"),
+            "720p": ("1280:720", "2500k"),
+            "1080p": ("1920:1080", "5M"),
         }
-        scale = res_map.get(resolution, "1280:720")
+        scale, bitrate = res_map.get(resolution, res_map["720p"])
+
+        def build_cmd(encoder: str) -> list[str]:
+            cmd = [self._ffmpeg, "-y"]
+            if encoder != "libx264":
+                # Decode da mümkünse GPU'da
+                cmd += ["-hwaccel", "auto"]
+            cmd += [
+                "-i", str(input_path),
+                "-vf", f"scale={scale}:force_original_aspect_ratio=decrease",
+                "-c:v", encoder,
+            ]
+            if encoder == "libx264":
+                cmd += ["-preset", "ultrafast", "-crf", "28"]
+            else:
+                # HW encoder'lar CRF yerine bitrate ister
+                cmd += ["-b:v", bitrate]
+            cmd += [
+                "-c:a", "aac",
+                "-b:a", "128k",
+                str(output_path)
+            ]
+            return cmd
+
+        encoder = _detect_hw_encoder(self._ffmpeg)
+
+        # Duration ayrıca probe edilmez; ffmpeg stderr'inden okunur
+        try:
+            self._run_with_progress(build_cmd(encoder), None, progress_callback, timeout=None)
+        except FFmpegError as e:
+            if encoder == "libx264":
+                raise
+            # Encoder listede olsa da donanım yok/desteklenmiyor olabilir
+            logger.warning(f"{encoder} proxy encode failed, falling back to libx264: {e}")
+            self._run_with_progress(
+                build_cmd("libx264"), None, progress_callback, timeout=None
+            )
 
-        cmd = [
-            self._ffmpeg,
-            "-y",
-            "-i", str(input_path),
-            "-vf", f"scale={scale}:force_original_aspect_ratio=decrease",
-            "-c:v", "libx264",
-            "-preset", "ultrafast",
-            "-crf", "28",
-            "-c:a", "aac",
-            "-b:a", "128k",
-            str(output_path)
-        ]
+        return output_path
+
+    def video_encoder(self) -> str:
+        """Kullanılabilir H.264 encoder'ı (donanım varsa o, yoksa libx264; cache'li)."""
+        return _detect_hw_encoder(self._ffmpeg)
+
+    def cut_segments_copy(
+        self,
+        input_path: Path,
+        segments: list[tuple[float, float]],
+        output_path: Path,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Path]:
+        """
+        Segmentleri yeniden encode etmeden (-c copy) kesip birleştir.
+
+        Her segment -ss'i -i'den önce vererek keyframe'e hızlı seek ile ayrı
+        dosyaya kopyalanır, sonra concat demuxer ile tek dosyada birleştirilir.
+        Kesimler keyframe'lere hizalanır (frame-accurate değildir).
+
+        Args:
+            input_path: Kaynak video
+            segments: Tutulacak (start, end) aralıkları, saniye
+            output_path: Hedef dosya
+            progress_callback: İlerleme callback'i (0.0 - 1.0)
+            should_cancel: True dönerse segmentler arasında iptal edilir
+
+        Returns:
+            Çıktı dosya path'i; iptal edildiyse None
+
+        Raises:
+            FFmpegError: Kesme veya birleştirme başarısız olursa
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = input_path.suffix or ".mp4"
+
+        # Geçici parçalar çıktı ile aynı diskte tutulur
+        with tempfile.TemporaryDirectory(prefix="autocut_", dir=output_path.parent) as tmp:
+            tmp_dir = Path(tmp)
+            list_lines = []
+
+            for i, (start, end) in enumerate(segments):
+                if should_cancel and should_cancel():
+                    return None
+
+                part = tmp_dir / f"seg_{i:05d}{suffix}"
+                cmd = [
+                    self._ffmpeg, "-y", "-v", "error",
+                    "-ss", f"{start:.3f}",
+                    "-i", str(input_path),
+                    "-t", f"{end - start:.3f}",
+                    "-map", "0:v?", "-map", "0:a?",
+                    "-c", "copy",
+                    "-avoid_negative_ts", "make_zero",
+                    str(part),
+                ]
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode != 0:
+                    raise FFmpegError(f"Segment {i + 1} copy failed: {result.stderr.strip()}")
+
+                # concat demuxer: tek tırnak '\'' ile kaçırılır
+                escaped = str(part).replace("'", "'\\''")
+                list_lines.append(f"file '{escaped}'")
+
+                if progress_callback:
+                    progress_callback((i + 1) / (len(segments) + 1))
+
+            if should_cancel and should_cancel():
+                return None
+
+            list_path = tmp_dir / "segments.txt"
+            list_path.write_text("\n".join(list_lines) + "\n", encoding="utf-8")
+
+            cmd = [
+                self._ffmpeg, "-y", "-v", "error",
+                "-f", "concat", "-safe", "0",
+                "-i", str(list_path),
+                "-c", "copy",
+                str(output_path),
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise FFmpegError(f"Segment concat failed: {result.stderr.strip()}")
 
-        # Duration al
-        duration = None
         if progress_callback:
-            try:
-                info = self.probe(input_path)
-                duration = info.duration
-            except FFmpegError:
-                pass
+            progress_callback(1.0)
+        return output_path
 
-        self._run_with_progress(cmd, duration, progress_callback)
+    def render_segments(
+        self,
+        input_path: Path,
+        segments: list[tuple[float, float]],
+        output_path: Path,
+        encoder: str = "libx264",
+        progress_callback: Optional[Callable[[float], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Path]:
+        """
+        Segmentleri frame-accurate re-encode ederek tek dosyada birleştir.
+
+        Zaman çizelgesi render_jobs(encoder) kadar eşit süreli parçaya bölünür;
+        her parçanın videosu kendi ffmpeg process'inde (-ss ile parçanın başına
+        seek, trim/concat filtresi) paralel encode edilir. Audio, parça
+        sınırlarında AAC priming/padding (tık, boşluk) olmasın diye tüm zaman
+        çizelgesi üzerinden tek seferde encode edilir; sonra concat demuxer ile
+        birleşen video ve bu audio -c copy mux'lanır. Tek parça kalırsa ikisi
+        birlikte doğrudan output_path'e yazılır.
+
+        Args:
+            input_path: Kaynak video
+            segments: Tutulacak sıralı (start, end) aralıkları, saniye
+            output_path: Hedef dosya
+            encoder: Video encoder (bkz. render_video_args)
+            progress_callback: İlerleme callback'i (0.0 - 1.0), worker thread'lerden çağrılır
+            should_cancel: True dönerse çalışan ffmpeg'ler durdurulur
+
+        Returns:
+            Çıktı dosya path'i; iptal edildiyse None
+
+        Raises:
+            FFmpegError: Herhangi bir parçanın encode'u veya birleştirme başarısız olursa
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        batches = split_segments(segments, render_jobs(encoder))
+
+        def encode_cmd(
+            batch: list[tuple[float, float]],
+            target: Path,
+            script: Path,
+            threads: int,
+            video: bool = True,
+            audio: bool = True,
+        ) -> list[str]:
+            offset = batch[0][0]
+            # Yüzlerce segmentlik grafik komut satırı sınırını (Windows ~32K) aşar;
+            # tek filter_complex dosyadan okunur
+            script.write_text(trim_concat_filter(batch, offset, video, audio), encoding="utf-8")
+            cmd = [
+                self._ffmpeg, "-y",
+                "-ss", f"{offset:.6f}",
+                "-t", f"{batch[-1][1] - offset:.6f}",
+                "-i", str(input_path),
+                "-filter_complex_script", str(script),
+            ]
+            if video:
+                cmd += ["-map", "[outv]", *render_video_args(encoder)]
+                if threads:
+                    cmd += ["-threads", str(threads)]
+            if audio:
+                cmd += ["-map", "[outa]", "-c:a", "aac", "-b:a", "192k"]
+            cmd.append(str(target))
+            return cmd
+
+        durations = [sum(end - start for start, end in batch) for batch in batches]
+        total = sum(durations)
+        done = [0.0] * len(batches)
+        lock = threading.Lock()
+        failed = threading.Event()
+        # Parçalar arasında çekirdekleri paylaştır (oversubscription olmasın)
+        threads = max(1, (os.cpu_count() or 1) // len(batches)) if encoder == "libx264" else 0
+
+        def cancelled() -> bool:
+            return failed.is_set() or bool(should_cancel and should_cancel())
+
+        last_emit = [0.0]
+
+        def report(index: int, fraction: float) -> None:
+            # Parça başına ≤10 Hz; toplamı da aynı sınırla ilet
+            with lock:
+                done[index] = fraction * durations[index]
+                progress = sum(done) / total
+                now = time.monotonic()
+                if now - last_emit[0] < PROGRESS_INTERVAL:
+                    return
+                last_emit[0] = now
+            if progress_callback:
+                progress_callback(progress * 0.98)  # Son %2 concat için
+
+        suffix = output_path.suffix or ".mp4"
+        with tempfile.TemporaryDirectory(prefix="autocut_", dir=output_path.parent) as tmp:
+            tmp_dir = Path(tmp)
+
+            if len(batches) == 1:
+                completed = self._run_with_progress(
+                    encode_cmd(batches[0], output_path, tmp_dir / "filter.txt", 0),
+                    total,
+                    progress_callback,
+                    should_cancel,
+                    timeout=None,
+                )
+                if not completed:
+                    output_path.unlink(missing_ok=True)
+                    return None
+                return output_path
+
+            parts = [tmp_dir / f"part_{i:03d}{suffix}" for i in range(len(batches))]
+            audio_path = tmp_dir / "audio.m4a"
+
+            def encode(index: int) -> bool:
+                try:
+                    if index == len(batches):
+                        # Audio tek parça: decode ucuz, progress video parçalarından gelir
+                        return self._run_with_progress(
+                            encode_cmd(
+                                segments, audio_path, tmp_dir / "filter_audio.txt", 0,
+                                video=False,
+                            ),
+                            None,
+                            None,
+                            cancelled,
+                            timeout=None,
+                        )
+                    return self._run_with_progress(
+                        encode_cmd(
+                            batches[index],
+                            parts[index],
+                            tmp_dir / f"filter_{index:03d}.txt",
+                            threads,
+                            audio=False,
+                        ),
+                        durations[index],
+                        lambda fraction: report(index, fraction),
+                        cancelled,
+                        timeout=None,
+                    )
+                except Exception:
+                    failed.set()  # Diğer parçalar boşuna encode edilmesin
+                    raise
+
+            logger.info(f"Rendering {len(batches)} video parts in parallel ({encoder})")
+            with ThreadPoolExecutor(max_workers=len(batches) + 1) as executor:
+                completed = list(executor.map(encode, range(len(batches) + 1)))
+
+            if not all(completed):
+                return None
+
+            # concat demuxer: tek tırnak '\'' ile kaçırılır
+            list_lines = []
+            for part in parts:
+                escaped = str(part).replace("'", "'\\''")
+                list_lines.append(f"file '{escaped}'")
+
+            list_path = tmp_dir / "parts.txt"
+            list_path.write_text("\n".join(list_lines) + "\n", encoding="utf-8")
+            cmd = [
+                self._ffmpeg, "-y", "-v", "error",
+                "-f", "concat", "-safe", "0",
+                "-i", str(list_path),
+                "-i", str(audio_path),
+                "-map", "0:v", "-map", "1:a",
+                "-c", "copy",
+                str(output_path),
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise FFmpegError(f"Part concat failed: {result.stderr.strip()}")
+
+        if progress_callback:
+            progress_callback(1.0)
         return output_path
 
     def _run_with_progress(
@@ -358,45 +939,122 @@ class FFmpegWrapper:
         cmd: list[str],
         duration: Optional[float],
         progress_callback: Optional[Callable[[float], None]],
-    ) -> None:
-        """FFmpeg komutunu progress tracking ile çalıştır."""
-        # Progress için -progress pipe ekle
-        if progress_callback and duration:
-            cmd.insert(1, "-progress")
-            cmd.insert(2, "pipe:1")
-            cmd.insert(3, "-stats_period")
-            cmd.insert(4, "0.5")
+        should_cancel: Optional[Callable[[], bool]] = None,
+        timeout: Optional[float] = FFMPEG_TIMEOUT,
+    ) -> bool:
+        """FFmpeg komutunu progress tracking ile çalıştır (senkron); iptal edildiyse False."""
+        return asyncio.run(
+            self._run_with_progress_async(
+                cmd, duration, progress_callback, should_cancel, timeout
+            )
+        )
 
-        logger.debug(f"Running FFmpeg: {' '.join(cmd)}")
+    async def _run_with_progress_async(
+        self,
+        cmd: list[str],
+        duration: Optional[float],
+        progress_callback: Optional[Callable[[float], None]],
+        should_cancel: Optional[Callable[[], bool]] = None,
+        timeout: Optional[float] = FFMPEG_TIMEOUT,
+    ) -> bool:
+        """
+        FFmpeg komutunu progress tracking ile çalıştır.
 
-        try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+        stdout (progress) ve stderr aynı event loop'ta eşzamanlı okunur; stderr
+        son satırları hata mesajı için ring buffer'da tutulur. duration None
+        ise ffmpeg'in stderr'e yazdığı "Duration:" satırından öğrenilir.
+        should_cancel True dönerse process öldürülür ve False döner. timeout None
+        ise süre sınırı yoktur (uzun render/proxy işleri).
+        """
+        # Progress için -progress pipe ekle; stderr'deki istatistik satırları gereksiz.
+        # Çağıranın listesi değiştirilmez (fallback'te aynı komut tekrar kullanılabilir)
+        if progress_callback:
+            # 4.4 öncesinde progress varsayılan 0.5 sn aralıkla yazılır
+            period = (
+                ["-stats_period", str(PROGRESS_INTERVAL)]
+                if _supports_stats_period(cmd[0])
+                else []
             )
+            cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *period, *cmd[1:]]
 
-            if progress_callback and duration and process.stdout:
-                current_time = 0.0
-                for line in process.stdout:
-                    if line.startswith("out_time_ms="):
-                        try:
-                            time_ms = int(line.split("=")[1].strip())
-                            current_time = time_ms / 1_000_000  # microseconds to seconds
-                            progress = min(current_time / duration, 1.0)
-                            progress_callback(progress)
-                        except (ValueError, IndexError):
-                            pass
+        logger.debug(f"Running FFmpeg: {' '.join(cmd)}")
 
-            stdout, stderr = process.communicate(timeout=3600)  # 1 hour timeout
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE if progress_callback else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
 
-            if process.returncode != 0:
-                raise FFmpegError(f"FFmpeg failed (code {process.returncode}): {stderr}")
+        stderr_tail: deque[str] = deque(maxlen=200)
+        total = [duration]
+
+        async def read_stderr() -> None:
+            # ffmpeg istatistik satırlarını \r ile bitirir; readline yerine parça oku
+            pending = ""
+            while chunk := await process.stderr.read(4096):
+                pending += chunk.decode("utf-8", "replace")
+                *lines, pending = re.split(r"[\r\n]", pending)
+                for line in lines:
+                    if not line:
+                        continue
+                    stderr_tail.append(line)
+                    if total[0] is None:
+                        match = _DURATION_RE.search(line)
+                        if match:
+                            h, m, sec = match.groups()
+                            total[0] = int(h) * 3600 + int(m) * 60 + float(sec)
+            if pending:
+                stderr_tail.append(pending)
+
+        async def read_stdout() -> None:
+            if not (progress_callback and process.stdout):
+                return
+            last_emit = 0.0
+            async for raw in process.stdout:
+                line = raw.decode("utf-8", "replace")
+                # out_time_ms da mikrosaniyedir (ffmpeg'in eski adı); out_time_us tercih edilir
+                if not line.startswith("out_time_us=") or not total[0]:
+                    continue
+                now = time.monotonic()
+                if now - last_emit < PROGRESS_INTERVAL:
+                    continue
+                try:
+                    current_time = int(line[len("out_time_us="):]) / 1_000_000
+                except ValueError:
+                    continue  # Başlangıçta "N/A" gelebilir
+                last_emit = now
+                progress_callback(min(max(current_time / total[0], 0.0), 1.0))
+
+        cancelled = False
+
+        async def watch_cancel() -> None:
+            nonlocal cancelled
+            if not should_cancel:
+                return
+            while process.returncode is None:
+                if should_cancel():
+                    cancelled = True
+                    process.kill()
+                    return
+                await asyncio.sleep(0.2)
 
-        except subprocess.TimeoutExpired:
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(read_stdout(), read_stderr(), process.wait(), watch_cancel()),
+                timeout=timeout,
+            )
+        except TimeoutError:
             process.kill()
-            raise FFmpegError("FFmpeg process timeout")
+            await process.wait()
+            raise FFmpegError("FFmpeg process timeout") from None
+
+        if cancelled:
+            return False
+
+        if process.returncode != 0:
+            stderr = "\n".join(stderr_tail)
+            raise FFmpegError(f"FFmpeg failed (code {process.returncode}): {stderr}")
+        return True
 
     def get_frame_at_time(
         self,
@@ -422,10 +1080,11 @@ class FFmpegWrapper:
         cmd = [
             self._ffmpeg,
             "-y",
-            "-ss", str(time_sec),
+            "-ss", str(time_sec),  # -i'den önce: keyframe'e hızlı seek
             "-i", str(input_path),
-            "-vframes", "1",
+            "-frames:v", "1",
             "-vf", f"scale={width}:-1",
+            "-an", "-sn",  # Audio/subtitle stream'lerini atla
             str(output_path)
         ]
 
@@ -436,21 +1095,80 @@ class FFmpegWrapper:
         return output_path
 
 
+@lru_cache(maxsize=256)
+def _probe_cached(
+    ffprobe_path: str,
+    file_str: str,
+    size: int,
+    mtime_ns: int,
+    probesize: Optional[int] = None,
+    analyzeduration: Optional[int] = None,
+) -> MediaInfo:
+    """
+    ffprobe'u çalıştır ve sonucu parse et.
+
+    size/mtime_ns yalnızca cache anahtarı içindir; dosya değişince yeniden probe edilir.
+    """
+    file_path = Path(file_str)
+    cmd = [ffprobe_path, "-v", "quiet"]
+    # Input seçenekleri -i'den önce gelmeli
+    if probesize is not None:
+        cmd += ["-probesize", str(probesize)]
+    if analyzeduration is not None:
+        cmd += ["-analyzeduration", str(analyzeduration)]
+    cmd += [
+        "-print_format", "json",
+        "-show_format",
+        "-show_streams",
+        "-i", file_str,
+    ]
+
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            raise FFmpegError(f"FFprobe failed: {result.stderr.decode('utf-8', 'replace')}")
+
+        # orjson.JSONDecodeError, json.JSONDecodeError'ın alt sınıfı
+        data = _json_loads(result.stdout)
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("FFprobe timeout")
+    except json.JSONDecodeError as e:
+        raise FFmpegError(f"Failed to parse FFprobe output: {e}")
+
+    return FFmpegWrapper._parse_probe_result(file_path, data)
+
+
 # Convenience functions
 _wrapper: Optional[FFmpegWrapper] = None
+_wrapper_lock = threading.Lock()
 
 
 def get_wrapper() -> FFmpegWrapper:
-    """Singleton FFmpegWrapper instance."""
+    """Singleton FFmpegWrapper instance (thread-safe)."""
     global _wrapper
     if _wrapper is None:
-        _wrapper = FFmpegWrapper()
+        with _wrapper_lock:
+            if _wrapper is None:
+                _wrapper = FFmpegWrapper()
     return _wrapper
 
 
-def probe_media(file_path: Path) -> MediaInfo:
-    """Medya dosyasını probe et."""
-    return get_wrapper().probe(file_path)
+def probe_media(
+    file_path: Path,
+    probesize: Optional[int] = PROBE_SIZE,
+    analyzeduration: Optional[int] = PROBE_ANALYZE_DURATION,
+) -> MediaInfo:
+    """Medya dosyasını probe et (varsayılan olarak sınırlı probesize ile)."""
+    return get_wrapper().probe(file_path, probesize, analyzeduration)
+
+
+def probe_many(paths: list[Path], max_workers: Optional[int] = None) -> list[MediaInfo]:
+    """Birden fazla medya dosyasını paralel probe et."""
+    return get_wrapper().probe_many(paths, max_workers)
 
 
 def extract_audio(
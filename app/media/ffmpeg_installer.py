@@ -8,16 +8,19 @@ import subprocess
 import shutil
 import sys
 import logging
+from functools import lru_cache
 from typing import Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def is_ffmpeg_installed() -> bool:
     """Check if FFmpeg is installed and accessible."""
     return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
 
 
+@lru_cache(maxsize=1)
 def is_homebrew_installed() -> bool:
     """Check if Homebrew is installed."""
     return shutil.which("brew") is not None
@@ -83,6 +86,10 @@ def install_ffmpeg_via_homebrew(progress_callback=None) -> Tuple[bool, str]:
         return_code = process.wait()
 
         if return_code == 0:
+            # Önceki "bulunamadı" sonuçları cache'te kalmasın
+            from app.media.ffmpeg import invalidate_ffmpeg_cache
+            invalidate_ffmpeg_cache()
+
             if progress_callback:
                 progress_callback(100, "FFmpeg installed successfully!")
             logger.info("FFmpeg installed successfully via Homebrew")
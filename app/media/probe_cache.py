@@ -0,0 +1,85 @@
+"""
+MediaInfo probe sonuçları için kalıcı disk cache.
+
+Aynı dosya tekrar açıldığında ffprobe çalıştırılmaz; kayıt (path, mtime, size)
+ile doğrulanır, dosya değiştiyse cache geçersiz sayılır.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from app.core.models import MediaInfo
+from app.core.settings import Settings
+from app.media._cache_key import cache_hash
+
+logger = logging.getLogger(__name__)
+
+# Probe'a ait olmayan, sonradan doldurulan alanlar cache'lenmez
+_RUNTIME_FIELDS = frozenset({"proxy_path", "audio_path"})
+
+
+@lru_cache(maxsize=1)
+def _cache_dir() -> Path:
+    """Probe cache dizini."""
+    path = Settings.get_cache_dir() / "probe"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _entry_path(path: Path) -> Path:
+    return _cache_dir() / f"{cache_hash(str(path.resolve()))}.json"
+
+
+def get(path: Path) -> Optional[MediaInfo]:
+    """Dosya değişmemişse cache'teki MediaInfo'yu döndür, yoksa None."""
+    entry = _entry_path(path)
+    try:
+        stat = path.stat()
+        with open(entry, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Probe cache load failed: {e}")
+        return None
+
+    if data.get("mtime_ns") != stat.st_mtime_ns or data.get("size") != stat.st_size:
+        return None
+
+    try:
+        info = data["info"]
+        return MediaInfo(**{**info, "file_path": Path(info["file_path"])})
+    except (KeyError, TypeError) as e:
+        logger.warning(f"Probe cache entry invalid: {e}")
+        return None
+
+
+def put(path: Path, info: MediaInfo) -> None:
+    """Probe sonucunu dosyanın güncel mtime/size değerleriyle kaydet."""
+    try:
+        stat = path.stat()
+        data = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "info": {
+                f.name: getattr(info, f.name)
+                for f in fields(info)
+                if f.name not in _RUNTIME_FIELDS
+            },
+        }
+        data["info"]["file_path"] = str(info.file_path)
+
+        entry = _entry_path(path)
+        tmp = entry.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, entry)  # Yarım yazılmış kayıt okunmasın
+    except (OSError, TypeError) as e:
+        logger.warning(f"Probe cache save failed: {e}")
@@ -7,8 +7,9 @@ Timeline çizimi için optimize edilmiş format.
 
 from __future__ import annotations
 
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import Optional, Callable
 import logging
@@ -16,9 +17,34 @@ import logging
 import numpy as np
 from scipy.io import wavfile
 
+from app.media._cache_key import cache_hash
+
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _kernels():
+    """Numba kernel modülünü döndür (numba yoksa None)."""
+    try:
+        from app.media import _waveform_kernels
+        return _waveform_kernels
+    except ImportError:
+        logger.debug("numba not available, using NumPy waveform path")
+        return None
+
+
+# int16 peak <-> float (-1.0 to 1.0) ölçeği
+PEAK_SCALE = 32767.0
+
+
+def pack_peaks(peaks_min: np.ndarray, peaks_max: np.ndarray) -> np.ndarray:
+    """Float min/max peak'leri (n, 2) int16 array'e quantize et."""
+    packed = np.empty((len(peaks_min), 2), dtype=np.int16)
+    packed[:, 0] = np.clip(np.rint(peaks_min * PEAK_SCALE), -32768, 32767)
+    packed[:, 1] = np.clip(np.rint(peaks_max * PEAK_SCALE), -32768, 32767)
+    return packed
+
+
 @dataclass
 class WaveformData:
     """
@@ -26,9 +52,9 @@ class WaveformData:
 
     Her "bucket" için min ve max değerler tutulur.
     Bu sayede farklı zoom seviyelerinde hızlı çizim yapılabilir.
+    Peak'ler bucket başına yan yana iki int16 olarak saklanır (4 B/bucket).
     """
-    peaks_min: np.ndarray   # (n_buckets,) float32, -1.0 to 1.0
-    peaks_max: np.ndarray   # (n_buckets,) float32, -1.0 to 1.0
+    peaks: np.ndarray       # (n_buckets, 2) int16: [:, 0] min, [:, 1] max
     sample_rate: int
     samples_per_bucket: int
     total_samples: int
@@ -36,7 +62,17 @@ class WaveformData:
 
     @property
     def num_buckets(self) -> int:
-        return len(self.peaks_min)
+        return len(self.peaks)
+
+    @property
+    def peaks_min(self) -> np.ndarray:
+        """(n_buckets,) float32, -1.0 to 1.0"""
+        return self.peaks[:, 0] * np.float32(1.0 / PEAK_SCALE)
+
+    @property
+    def peaks_max(self) -> np.ndarray:
+        """(n_buckets,) float32, -1.0 to 1.0"""
+        return self.peaks[:, 1] * np.float32(1.0 / PEAK_SCALE)
 
     def get_peaks_for_range(
         self,
@@ -64,43 +100,54 @@ class WaveformData:
         if start_bucket >= end_bucket:
             return np.zeros(num_points), np.zeros(num_points)
 
-        # Bucket'ları al
-        min_data = self.peaks_min[start_bucket:end_bucket]
-        max_data = self.peaks_max[start_bucket:end_bucket]
+        # Bucket'ları al (min/max aynı satırda; tek gather)
+        data = self.peaks[start_bucket:end_bucket]
 
         # Resample if needed
-        if len(min_data) != num_points:
-            indices = np.linspace(0, len(min_data) - 1, num_points).astype(int)
-            min_data = min_data[indices]
-            max_data = max_data[indices]
+        if len(data) != num_points:
+            indices = np.linspace(0, len(data) - 1, num_points).astype(int)
+            data = data[indices]
 
-        return min_data, max_data
+        data = data * np.float32(1.0 / PEAK_SCALE)
+        return data[:, 0], data[:, 1]
 
     def save(self, path: Path) -> None:
-        """Waveform verisini .npz olarak kaydet."""
-        np.savez_compressed(
-            path,
-            peaks_min=self.peaks_min,
-            peaks_max=self.peaks_max,
-            metadata=np.array([
+        """
+        Waveform verisini .npy olarak kaydet.
+
+        Sıkıştırma yok: metadata ve peak array'i aynı dosyaya art arda
+        np.save ile yazılır (cache için memcpy hızında).
+        """
+        with open(path, "wb") as f:
+            np.save(f, np.array([
                 self.sample_rate,
                 self.samples_per_bucket,
                 self.total_samples,
-            ]),
-        )
+            ], dtype=np.int64))
+            np.save(f, self.peaks)
         logger.debug(f"Waveform saved to {path}")
 
     @classmethod
     def load(cls, path: Path) -> WaveformData:
-        """Waveform verisini .npz'den yükle."""
-        data = np.load(path)
-        metadata = data["metadata"]
+        """Waveform verisini .npy'den (veya eski .npz'den) yükle."""
+        if path.suffix == ".npz":
+            # Eski format: savez_compressed
+            data = np.load(path)
+            metadata = data["metadata"]
+            if "peaks" in data:
+                peaks = data["peaks"]
+            else:
+                peaks = pack_peaks(data["peaks_min"], data["peaks_max"])
+        else:
+            with open(path, "rb") as f:
+                metadata = np.load(f)
+                peaks = np.load(f)
+
         sample_rate = int(metadata[0])
         total_samples = int(metadata[2])
 
         return cls(
-            peaks_min=data["peaks_min"],
-            peaks_max=data["peaks_max"],
+            peaks=peaks,
             sample_rate=sample_rate,
             samples_per_bucket=int(metadata[1]),
             total_samples=total_samples,
@@ -137,78 +184,49 @@ class WaveformGenerator:
         # Hash: file path + mtime + size
         stat = wav_path.stat()
         hash_input = f"{wav_path}:{stat.st_mtime}:{stat.st_size}:{self.samples_per_bucket}"
-        file_hash = hashlib.md5(hash_input.encode()).hexdigest()[:16]
-
-        return self.cache_dir / f"waveform_{file_hash}.npz"
-
-    def generate(
-        self,
-        wav_path: Path,
-        progress_callback: Optional[Callable[[float], None]] = None,
-        use_cache: bool = True,
-    ) -> WaveformData:
-        """
-        WAV dosyasından waveform verisi üret.
+        file_hash = cache_hash(hash_input)
 
-        Args:
-            wav_path: WAV dosya yolu
-            progress_callback: İlerleme callback'i (0.0 - 1.0)
-            use_cache: Cache kullan
+        return self.cache_dir / f"waveform_{file_hash}.npy"
 
-        Returns:
-            WaveformData
-        """
-        # Cache kontrol
-        cache_path = self._get_cache_path(wav_path)
-        if use_cache and cache_path and cache_path.exists():
+    def _load_cached(self, cache_path: Optional[Path]) -> Optional[WaveformData]:
+        """Cache'ten yükle (yoksa veya bozuksa None)."""
+        if cache_path and cache_path.exists():
             try:
                 logger.debug(f"Loading cached waveform from {cache_path}")
                 return WaveformData.load(cache_path)
             except Exception as e:
                 logger.warning(f"Cache load failed: {e}")
+        return None
 
-        # WAV yükle
-        logger.debug(f"Generating waveform for {wav_path}")
-        sample_rate, audio_data = wavfile.read(wav_path)
-
-        # Mono'ya dönüştür
-        if audio_data.ndim > 1:
-            audio_data = audio_data.mean(axis=1)
-
-        # Normalize et (-1.0 to 1.0)
-        if audio_data.dtype == np.int16:
-            audio_data = audio_data.astype(np.float32) / 32768.0
-        elif audio_data.dtype == np.int32:
-            audio_data = audio_data.astype(np.float32) / 2147483648.0
-        elif audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-
-        total_samples = len(audio_data)
-        num_buckets = (total_samples + self.samples_per_bucket - 1) // self.samples_per_bucket
-
-        peaks_min = np.zeros(num_buckets, dtype=np.float32)
-        peaks_max = np.zeros(num_buckets, dtype=np.float32)
-
-        # Bucket'ları hesapla
-        for i in range(num_buckets):
-            start = i * self.samples_per_bucket
-            end = min(start + self.samples_per_bucket, total_samples)
-            chunk = audio_data[start:end]
-
-            if len(chunk) > 0:
-                peaks_min[i] = chunk.min()
-                peaks_max[i] = chunk.max()
+    def _from_audio(
+        self,
+        sample_rate: int,
+        audio_data: np.ndarray,
+        cache_path: Optional[Path],
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> WaveformData:
+        """Ham (memory-mapped) PCM'den waveform üret ve cache'e yaz."""
+        if progress_callback:
+            progress_callback(0.0)
 
-            # Progress
-            if progress_callback and i % 1000 == 0:
-                progress_callback(i / num_buckets)
+        peaks_min, peaks_max = _buckets_from_audio(audio_data, self.samples_per_bucket)
 
         if progress_callback:
             progress_callback(1.0)
 
+        return self._from_peaks(sample_rate, len(audio_data), peaks_min, peaks_max, cache_path)
+
+    def _from_peaks(
+        self,
+        sample_rate: int,
+        total_samples: int,
+        peaks_min: np.ndarray,
+        peaks_max: np.ndarray,
+        cache_path: Optional[Path],
+    ) -> WaveformData:
+        """Hesaplanmış float peak'lerden WaveformData oluştur ve cache'e yaz."""
         waveform = WaveformData(
-            peaks_min=peaks_min,
-            peaks_max=peaks_max,
+            peaks=pack_peaks(peaks_min, peaks_max),
             sample_rate=sample_rate,
             samples_per_bucket=self.samples_per_bucket,
             total_samples=total_samples,
@@ -224,6 +242,54 @@ class WaveformGenerator:
 
         return waveform
 
+    def generate(
+        self,
+        wav_path: Path,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        use_cache: bool = True,
+    ) -> WaveformData:
+        """
+        WAV dosyasından waveform verisi üret.
+
+        Args:
+            wav_path: WAV dosya yolu
+            progress_callback: İlerleme callback'i (0.0 - 1.0)
+            use_cache: Cache kullan
+
+        Returns:
+            WaveformData
+        """
+        # Cache kontrol
+        cache_path = self._get_cache_path(wav_path)
+        if use_cache:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return cached
+
+        logger.debug(f"Generating waveform for {wav_path}")
+        sample_rate, audio_data = _load_wav(wav_path)
+
+        return self._from_audio(sample_rate, audio_data, cache_path, progress_callback)
+
+    def generate_from_pcm(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> WaveformData:
+        """
+        Bellekteki PCM verisinden waveform üret (WAV dosyası gerekmez).
+
+        Args:
+            audio_data: (n,) veya (n, channels) int16/int32/float32 PCM
+            sample_rate: Sample rate
+            progress_callback: İlerleme callback'i (0.0 - 1.0)
+
+        Returns:
+            WaveformData (dosya olmadığı için cache'lenmez)
+        """
+        return self._from_audio(sample_rate, audio_data, None, progress_callback)
+
     def generate_multi_resolution(
         self,
         wav_path: Path,
@@ -233,26 +299,173 @@ class WaveformGenerator:
         """
         Birden fazla çözünürlükte waveform üret.
 
-        Farklı zoom seviyelerinde hızlı çizim için.
+        Farklı zoom seviyelerinde hızlı çizim için. WAV bir kez okunur.
+        Çözünürlükler birbirinin katıysa (varsayılan [64, 256, 1024, 4096])
+        kaba seviyeler ince seviyeden türetilir; değilse thread pool'da
+        paralel hesaplanır.
         """
         if resolutions is None:
             resolutions = [64, 256, 1024, 4096]
 
+        generators = {
+            res: WaveformGenerator(samples_per_bucket=res, cache_dir=self.cache_dir)
+            for res in resolutions
+        }
+
         result = {}
-        for i, res in enumerate(resolutions):
-            generator = WaveformGenerator(
-                samples_per_bucket=res,
-                cache_dir=self.cache_dir,
-            )
+        missing = {}
+        for res, generator in generators.items():
+            cache_path = generator._get_cache_path(wav_path)
+            cached = generator._load_cached(cache_path)
+            if cached is not None:
+                result[res] = cached
+            else:
+                missing[res] = cache_path
+
+        if missing:
+            logger.debug(f"Generating waveforms {list(missing)} for {wav_path}")
+            sample_rate, audio_data = _load_wav(wav_path)
+
+            chain = sorted(missing)
+            if all(coarse % fine == 0 for fine, coarse in zip(chain, chain[1:], strict=False)):
+                # Mipmap: en ince çözünürlük audio'dan, diğerleri ondan türetilir
+                peaks_min, peaks_max = _buckets_from_audio(audio_data, chain[0])
+                for done, res in enumerate(chain, start=1):
+                    if done > 1:
+                        factor = res // chain[done - 2]
+                        peaks_min, peaks_max = _downsample_peaks(peaks_min, peaks_max, factor)
+                    result[res] = generators[res]._from_peaks(
+                        sample_rate, len(audio_data), peaks_min, peaks_max, missing[res],
+                    )
+                    if progress_callback:
+                        progress_callback(done / len(chain))
+            else:
+                # Çözünürlükler birbirinin katı değil: her biri audio'dan, paralel
+                with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                    futures = {
+                        res: executor.submit(
+                            generators[res]._from_audio, sample_rate, audio_data, cache_path,
+                        )
+                        for res, cache_path in missing.items()
+                    }
+                    for done, (res, future) in enumerate(futures.items(), start=1):
+                        result[res] = future.result()
+                        if progress_callback:
+                            progress_callback(done / len(missing))
+        elif progress_callback:
+            progress_callback(1.0)
+
+        return {res: result[res] for res in resolutions}
+
+
+# Bucket hesabı bu kadar bucket'lık parçalar halinde yapılır (bellek sınırlı kalır)
+_CHUNK_BUCKETS = 4096
+
+
+def _load_wav(wav_path: Path) -> tuple[int, np.ndarray]:
+    """
+    WAV'ı memory-map ile aç.
+
+    PCM verisi RAM'e kopyalanmaz; normalize işlemi parça parça yapılır.
+    """
+    try:
+        return wavfile.read(wav_path, mmap=True)
+    except ValueError:
+        # mmap desteklenmeyen formatlar (ör. 24-bit PCM)
+        return wavfile.read(wav_path)
+
+
+def _normalize(audio_data: np.ndarray) -> np.ndarray:
+    """Float32 (-1.0 to 1.0) yap ve mono'ya indir."""
+    # Normalize et (-1.0 to 1.0) - ölçek dtype'a göre, mono karıştırmadan önce
+    if audio_data.dtype == np.int16:
+        audio_data = audio_data.astype(np.float32) / 32768.0
+    elif audio_data.dtype == np.int32:
+        audio_data = audio_data.astype(np.float32) / 2147483648.0
+    elif audio_data.dtype != np.float32:
+        audio_data = audio_data.astype(np.float32)
+
+    # Mono'ya dönüştür
+    if audio_data.ndim > 1:
+        audio_data = audio_data.mean(axis=1, dtype=np.float32)
+
+    return audio_data
+
+
+def _reduce_buckets(
+    audio_data: np.ndarray,
+    spb: int,
+    peaks_min: np.ndarray,
+    peaks_max: np.ndarray,
+) -> None:
+    """Normalize edilmiş audio'nun bucket min/max'larını verilen array'lere yaz."""
+    kernels = _kernels()
+    if kernels is not None:
+        # Numba: min ve max tek geçişte, bucket'lar paralel
+        kernels.peaks_minmax(np.ascontiguousarray(audio_data), spb, peaks_min, peaks_max)
+        return
+
+    total_samples = len(audio_data)
+    full_buckets = total_samples // spb
+
+    # Tam bucket'lar: (n, spb) matrisine reshape edip tek seferde indirge
+    if full_buckets:
+        mat = audio_data[:full_buckets * spb].reshape(full_buckets, spb)
+        peaks_min[:full_buckets] = mat.min(axis=1)
+        peaks_max[:full_buckets] = mat.max(axis=1)
+
+    # Son (kısmi) bucket ayrı hesaplanır - padding ile sıfır karışmasın
+    if len(peaks_min) > full_buckets:
+        tail = audio_data[full_buckets * spb:]
+        peaks_min[-1] = tail.min()
+        peaks_max[-1] = tail.max()
+
+
+def _buckets_from_audio(audio_data: np.ndarray, spb: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Bucket başına (min, max) peak array'leri.
+
+    audio_data ham (memory-mapped) PCM olabilir; her parça ayrı normalize
+    edilir, tam boy float32 kopya oluşmaz.
+    """
+    total_samples = len(audio_data)
+    num_buckets = (total_samples + spb - 1) // spb
+
+    peaks_min = np.zeros(num_buckets, dtype=np.float32)
+    peaks_max = np.zeros(num_buckets, dtype=np.float32)
 
-            def sub_progress(p: float):
-                if progress_callback:
-                    base = i / len(resolutions)
-                    progress_callback(base + p / len(resolutions))
+    step = spb * _CHUNK_BUCKETS
+    for start in range(0, total_samples, step):
+        chunk = _normalize(audio_data[start:start + step])
+        b0 = start // spb
+        b1 = b0 + (len(chunk) + spb - 1) // spb
+        _reduce_buckets(chunk, spb, peaks_min[b0:b1], peaks_max[b0:b1])
 
-            result[res] = generator.generate(wav_path, sub_progress)
+    return peaks_min, peaks_max
 
-        return result
+
+def _downsample_peaks(
+    peaks_min: np.ndarray,
+    peaks_max: np.ndarray,
+    factor: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Ardışık `factor` bucket'ı birleştirerek daha kaba peak'ler üret."""
+    n = len(peaks_min)
+    full = n // factor
+    num_buckets = (n + factor - 1) // factor
+
+    coarse_min = np.empty(num_buckets, dtype=np.float32)
+    coarse_max = np.empty(num_buckets, dtype=np.float32)
+
+    coarse_min[:full] = peaks_min[:full * factor].reshape(full, factor).min(axis=1)
+    coarse_max[:full] = peaks_max[:full * factor].reshape(full, factor).max(axis=1)
+
+    # Son (kısmi) bucket
+    if num_buckets > full:
+        coarse_min[-1] = peaks_min[full * factor:].min()
+        coarse_max[-1] = peaks_max[full * factor:].max()
+
+    return coarse_min, coarse_max
 
 
 def compute_rms_db(audio_data: np.ndarray, frame_size: int) -> np.ndarray:
@@ -269,18 +482,16 @@ def compute_rms_db(audio_data: np.ndarray, frame_size: int) -> np.ndarray:
     num_frames = len(audio_data) // frame_size
     rms_values = np.zeros(num_frames, dtype=np.float32)
 
-    for i in range(num_frames):
-        start = i * frame_size
-        end = start + frame_size
-        frame = audio_data[start:end]
+    kernels = _kernels()
+    if kernels is not None:
+        kernels.rms_db(np.ascontiguousarray(audio_data), frame_size, rms_values)
+        return rms_values
 
-        # RMS hesapla
-        rms = np.sqrt(np.mean(frame ** 2))
+    # (num_frames, frame_size) matrisi; einsum kare toplamını ara array'siz hesaplar
+    mat = audio_data[:num_frames * frame_size].reshape(num_frames, frame_size)
+    rms = np.sqrt(np.einsum("ij,ij->i", mat, mat) * (1.0 / frame_size))
 
-        # dBFS'e dönüştür
-        if rms > 0:
-            rms_values[i] = 20 * np.log10(rms)
-        else:
-            rms_values[i] = -96.0  # Minimum dB
+    # dBFS'e dönüştür (sessiz frame'ler -96 dB)
+    rms_values[:] = np.where(rms > 0, 20.0 * np.log10(np.maximum(rms, 1e-20)), -96.0)
 
     return rms_values
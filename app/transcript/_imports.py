@@ -0,0 +1,43 @@
+"""
+Ağır backend modülleri için memoize edilmiş lazy import'lar.
+
+torch ve whisper import'u yüzlerce ms sürer; modül import edilirken değil,
+ilk gerçekten gerektiğinde bir kez yüklenir.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+
+@cache
+def get_torch():
+    """torch modülü (yoksa ImportError)."""
+    import torch
+    return torch
+
+
+@cache
+def get_whisper():
+    """openai-whisper modülü."""
+    try:
+        import whisper
+    except ImportError as e:
+        raise ImportError(
+            "openai-whisper not installed. "
+            "Install with: pip install openai-whisper"
+        ) from e
+    return whisper
+
+
+@cache
+def get_faster_whisper_model_class():
+    """faster_whisper.WhisperModel sınıfı."""
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as e:
+        raise ImportError(
+            "faster-whisper not installed. "
+            "Install with: pip install faster-whisper"
+        ) from e
+    return WhisperModel
@@ -15,28 +15,51 @@ Features:
 
 from __future__ import annotations
 
+import http.client
+import io
 import json
+import mmap
+import os
+import queue
 import re
+import threading
+import urllib.parse
 import urllib.request
 import urllib.error
-import base64
+import binascii
 import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable, Literal
+from typing import TYPE_CHECKING, ClassVar, Final, Iterator, Optional, Callable, TextIO, Union
 from enum import Enum
 import logging
 
 from app.core.models import TranscriptSegment, TranscriptWord
+from app.transcript._imports import get_faster_whisper_model_class, get_torch, get_whisper
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# orjson varsa Gemini request/response JSON'u C tarafında bytes üzerinden işlenir
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
 
 def get_model_cache_path(model_name: str) -> Path:
     """Get the cache path for a whisper model."""
-    from pathlib import Path
-    import os
-
     # faster-whisper uses huggingface hub cache
     cache_dir = Path(os.environ.get(
         "HF_HOME",
@@ -45,44 +68,81 @@ def get_model_cache_path(model_name: str) -> Path:
     return cache_dir
 
 
+# faster-whisper model names map to huggingface repo names
+_MODEL_REPOS = {
+    "tiny": "Systran/faster-whisper-tiny",
+    "base": "Systran/faster-whisper-base",
+    "small": "Systran/faster-whisper-small",
+    "medium": "Systran/faster-whisper-medium",
+    "large-v3": "Systran/faster-whisper-large-v3",
+    "large": "Systran/faster-whisper-large-v3",
+}
+
+_MODEL_FILE_SUFFIXES = (".bin", ".safetensors")
+
+
+def _has_model_file(snapshots_dir: str) -> bool:
+    """Herhangi bir snapshot'ta model dosyası var mı (ilk eşleşmede durur)."""
+    with os.scandir(snapshots_dir) as snapshots:
+        for snapshot in snapshots:
+            if not snapshot.is_dir():
+                continue
+            with os.scandir(snapshot.path) as files:
+                if any(f.name.endswith(_MODEL_FILE_SUFFIXES) for f in files):
+                    return True
+    return False
+
+
+@lru_cache(maxsize=32)
+def _model_ready(model_dir: str, state: tuple[int, ...]) -> bool:
+    """
+    Model klasöründe indirilmiş model dosyası var mı.
+
+    state sadece cache anahtarıdır (bkz. _snapshot_state): indirme bitip
+    snapshot'a dosya eklenince değişir.
+    """
+    try:
+        return _has_model_file(os.path.join(model_dir, "snapshots"))
+    except OSError:
+        return False
+
+
+def _snapshot_state(model_dir: str) -> tuple[int, ...]:
+    """
+    snapshots/ ve revizyon klasörlerinin mtime'ları.
+
+    huggingface_hub dosyaları revizyon klasörüne link olarak ekler; üst hub
+    klasörünün mtime'ı bu sırada değişmez, revizyon klasörününki değişir.
+    """
+    snapshots_dir = os.path.join(model_dir, "snapshots")
+    state = [os.stat(snapshots_dir).st_mtime_ns]
+    with os.scandir(snapshots_dir) as snapshots:
+        for snapshot in snapshots:
+            if snapshot.is_dir():
+                state.append(snapshot.stat().st_mtime_ns)
+    return tuple(sorted(state))
+
+
+def invalidate_model_cache() -> None:
+    """İndirme sonrası cache'lenmiş model durumlarını sıfırla."""
+    _model_ready.cache_clear()
+
+
+def _repo_id(model_name: str) -> str:
+    """Model adını HF cache klasör adındaki repo id'ye çevir."""
+    repo_name = _MODEL_REPOS.get(model_name, f"Systran/faster-whisper-{model_name}")
+    return repo_name.replace("/", "--")
+
+
 def is_model_downloaded(model_name: str) -> bool:
     """Check if a whisper model is already downloaded."""
+    model_dir = str(get_model_cache_path("") / f"models--{_repo_id(model_name)}")
     try:
-        from pathlib import Path
-        import os
-
-        # faster-whisper model names map to huggingface repo names
-        model_map = {
-            "tiny": "Systran/faster-whisper-tiny",
-            "base": "Systran/faster-whisper-base",
-            "small": "Systran/faster-whisper-small",
-            "medium": "Systran/faster-whisper-medium",
-            "large-v3": "Systran/faster-whisper-large-v3",
-            "large": "Systran/faster-whisper-large-v3",
-        }
-
-        repo_name = model_map.get(model_name, f"Systran/faster-whisper-{model_name}")
-        repo_id = repo_name.replace("/", "--")
-
-        # Check huggingface cache directory
-        cache_dir = Path(os.environ.get(
-            "HF_HOME",
-            Path.home() / ".cache" / "huggingface" / "hub"
-        ))
-
-        model_dir = cache_dir / f"models--{repo_id}"
-
-        if model_dir.exists():
-            # Check if model files are present (not just the directory)
-            snapshots_dir = model_dir / "snapshots"
-            if snapshots_dir.exists():
-                for snapshot in snapshots_dir.iterdir():
-                    if snapshot.is_dir():
-                        # Check for model.bin or other model files
-                        model_files = list(snapshot.glob("*.bin")) + list(snapshot.glob("*.safetensors"))
-                        if model_files:
-                            return True
-        return False
+        state = _snapshot_state(model_dir)
+    except OSError:
+        return False  # Klasör yok: hiç indirilmemiş
+    try:
+        return _model_ready(model_dir, state)
     except Exception as e:
         logger.debug(f"Error checking model {model_name}: {e}")
         return False
@@ -90,8 +150,325 @@ def is_model_downloaded(model_name: str) -> bool:
 
 def get_downloaded_models() -> list[str]:
     """Get list of downloaded model names."""
-    models = ["tiny", "base", "small", "medium", "large-v3"]
-    return [m for m in models if is_model_downloaded(m)]
+    return [m for m in _ALL_MODEL_SIZES if is_model_downloaded(m)]
+
+
+@lru_cache(maxsize=1)
+def _cpu_flags() -> Optional[frozenset[str]]:
+    """x86 CPU flag'leri (/proc/cpuinfo veya macOS sysctl); okunamazsa None."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return frozenset(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+
+    try:
+        import subprocess
+        out = subprocess.run(
+            ["sysctl", "-n", "machdep.cpu.features", "machdep.cpu.leaf7_features"],
+            capture_output=True, text=True, timeout=2,
+        ).stdout
+        if out.strip():
+            return frozenset(out.lower().replace(".", "_").split())
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return None
+
+
+def _cpu_compute_type() -> str:
+    """
+    CPU için compute_type seç.
+
+    int8 yalnızca VNNI/AVX2 int8 kernel'leri olan CPU'larda hızlı; eski x86
+    CPU'larda int16 daha hızlı. Flag okunamazsa (ör. Apple Silicon) int8.
+    """
+    flags = _cpu_flags()
+    if flags is None or flags & {"avx512_vnni", "avx_vnni", "avx512vnni", "avx2"}:
+        return "int8"
+    return "int16"
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """
+    CUDA kullanılabilir mi (process başına bir kez).
+
+    torch importu ilk seferde CUDA init yüzünden saniyeler sürebilir; sadece
+    device "auto" iken çağrılır, "cpu" seçen kullanıcı için torch hiç yüklenmez.
+    """
+    try:
+        return get_torch().cuda.is_available()
+    except Exception:
+        return False
+
+
+def _resolve_device(device: str) -> str:
+    """"auto" ise process başına bir kez tespit edilen cihazı döndür."""
+    if device == "auto":
+        return "cuda" if _cuda_available() else "cpu"
+    return device
+
+
+@lru_cache(maxsize=1)
+def _cuda_compute_type() -> str:
+    """
+    CUDA için compute_type seç.
+
+    INT8 ağırlık + fp16 aktivasyon (int8_float16) float16'ya göre VRAM'i
+    yarıya indirir ve daha hızlıdır; CTranslate2 kartta desteklemiyorsa
+    float16 kullanılır.
+    """
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types("cuda")
+    except Exception as e:
+        logger.debug(f"Could not query CUDA compute types: {e}")
+        return "float16"
+
+    compute_type = "int8_float16" if "int8_float16" in supported else "float16"
+    logger.info(f"CUDA compute type: {compute_type} (supported: {sorted(supported)})")
+    return compute_type
+
+
+@lru_cache(maxsize=4)
+def _get_faster_whisper_model(
+    size: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int,
+    num_workers: int,
+):
+    """
+    WhisperModel'i yükle ve process genelinde paylaş.
+
+    Ağırlıklar değişmez; her Transcriber için disk okuma + GPU allocation
+    tekrarlanmaz.
+    """
+    WhisperModel = get_faster_whisper_model_class()
+
+    logger.info(f"Loading faster-whisper model: {size} on {device} with {compute_type}")
+    model = WhisperModel(
+        size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+    resolved = getattr(model.model, "compute_type", compute_type)
+    logger.info(f"faster-whisper compute type: {resolved}")
+    return model
+
+
+@lru_cache(maxsize=4)
+def _prewarm_model(model) -> None:
+    """Model başına bir kez boş audio ile transkript çalıştır."""
+    import numpy as np
+
+    segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), language="en")
+    for _ in segments:
+        pass
+
+
+@lru_cache(maxsize=2)
+def _get_openai_whisper_model(size: str, device: str):
+    """
+    openai-whisper model'ini yükle ve paylaş.
+
+    CUDA'da encoder torch.compile ile derlenir: girdi hep 30 sn'lik mel
+    (sabit shape) olduğu için CUDA graph'larla tek seferde çalışır. Decoder'ın
+    kv-cache'i her adımda büyüdüğünden eager kalır.
+    """
+    whisper = get_whisper()
+
+    logger.info(f"Loading openai-whisper model: {size} on {device}")
+    model = whisper.load_model(size, device=device)
+
+    if device == "cuda":
+        encoder = model.encoder
+        try:
+            torch = get_torch()
+
+            model.encoder = torch.compile(encoder, mode="reduce-overhead")
+            # Derlemeyi ilk gerçek istekten önce yap (transcribe fp16 mel verir)
+            with torch.no_grad():
+                model.encoder(torch.zeros(
+                    1, model.dims.n_mels, whisper.audio.N_FRAMES,
+                    dtype=torch.float16, device=device,
+                ))
+        except Exception as e:
+            model.encoder = encoder
+            logger.warning(f"torch.compile unavailable for whisper encoder: {e}")
+
+    return model
+
+
+# Whisper modellerinin beklediği sample rate
+WHISPER_SAMPLE_RATE = 16000
+
+
+def _read_audio(source):
+    """
+    Kaynağı ham (sample_rate, samples) olarak aç.
+
+    WAV memory-map ile açılır, numpy array 16 kHz kabul edilir. WAV olmayan
+    ya da okunamayan dosyalarda None.
+    """
+    if not isinstance(source, (str, Path)):
+        import numpy as np
+        return WHISPER_SAMPLE_RATE, np.asarray(source)
+
+    audio_path = Path(source)
+    if audio_path.suffix.lower() != ".wav":
+        return None
+
+    try:
+        from scipy.io import wavfile
+        return wavfile.read(audio_path, mmap=True)
+    except (ImportError, ValueError, OSError) as e:
+        logger.debug(f"WAV decode failed, letting the model decode {audio_path.name}: {e}")
+        return None
+
+
+def _to_model_audio(audio, sample_rate: int):
+    """Ham sample'ları float32 16 kHz mono contiguous array'e çevir."""
+    from math import gcd
+
+    import numpy as np
+    from scipy.signal import resample_poly
+
+    if audio.dtype == np.int16:
+        audio = audio.astype(np.float32) / 32768.0
+    elif audio.dtype == np.int32:
+        audio = audio.astype(np.float32) / 2147483648.0
+    elif audio.dtype == np.uint8:
+        audio = (audio.astype(np.float32) - 128.0) / 128.0
+    else:
+        audio = audio.astype(np.float32)
+
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1, dtype=np.float32)
+
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        # 48k -> 16k gibi tam sayı oranlarında polyphase resample tek geçiş
+        g = gcd(sample_rate, WHISPER_SAMPLE_RATE)
+        audio = resample_poly(audio, WHISPER_SAMPLE_RATE // g, sample_rate // g).astype(np.float32)
+
+    return np.ascontiguousarray(audio)
+
+
+def _decode_audio(source, max_seconds: Optional[float] = None):
+    """
+    Audio'yu float32 16 kHz mono numpy array'e çevir.
+
+    source bir WAV yolu ya da bellekteki PCM olabilir (numpy array, 16 kHz
+    kabul edilir). max_seconds verilirse sadece baştaki o kadar audio okunur
+    (mmap sayesinde dosyanın geri kalanına dokunulmaz).
+
+    Uygulamanın kendi çıkardığı WAV'lar için model tarafındaki decode
+    (ffmpeg/PyAV) atlanır. WAV olmayan ya da okunamayan dosyalarda path
+    string'i döner, decode'u model yapar.
+    """
+    raw = _read_audio(source)
+    if raw is None:
+        return str(source)
+
+    sample_rate, audio = raw
+    if max_seconds is not None:
+        audio = audio[:int(max_seconds * sample_rate)]
+    return _to_model_audio(audio, sample_rate)
+
+
+def _decode_windows(source, seconds: float, count: int = 3):
+    """
+    Başa, ortaya ve sona yayılmış `count` pencereyi decode et.
+
+    Sadece pencerelerin sample'ları okunur. Okunamazsa None.
+    """
+    raw = _read_audio(source)
+    if raw is None:
+        return None
+
+    sample_rate, audio = raw
+    window = int(seconds * sample_rate)
+    last_start = max(len(audio) - window, 0)
+    starts = sorted({round(i * last_start / max(count - 1, 1)) for i in range(count)})
+    return [_to_model_audio(audio[start:start + window], sample_rate) for start in starts]
+
+
+def _run_pipelined(segments_iter, consume: Callable[[Iterator], list]) -> list:
+    """
+    Model decode'u çağıran thread'de; segment dönüşümü ve progress ayrı thread'de.
+
+    Aradaki bounded queue, tüketici geride kalırsa decode'u bekletir.
+    """
+    segments_queue: queue.Queue = queue.Queue(maxsize=8)
+    done = object()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(lambda: consume(iter(segments_queue.get, done)))
+
+        def put(item) -> None:
+            while True:
+                try:
+                    segments_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    if future.done():
+                        future.result()  # Tüketici hatasını yükselt
+                        return
+
+        try:
+            for segment in segments_iter:
+                put(segment)
+        finally:
+            put(done)
+        return future.result()
+
+
+def _srt_time(seconds: float) -> str:
+    """Saniyeyi SRT zaman damgasına çevir (HH:MM:SS,mmm)."""
+    ms = round(seconds * 1000)
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{ms:03d}"
+
+
+def _report_done(progress_callback: Optional[Callable[[float, str], None]], count: int) -> None:
+    if progress_callback:
+        progress_callback(100, "Transcription complete")
+    logger.info(f"Transcribed {count} segments")
+
+
+# Segment başına progress GUI'yi yorar; en fazla bu aralıkla bildir (saniye)
+PROGRESS_INTERVAL = 0.5
+
+
+def _with_progress(
+    segments_iter,
+    total_duration: float,
+    progress_callback: Callable[[float, str], None],
+):
+    """
+    Segment iterator'ını sarmala, ilerlemeyi seyrek bildir.
+
+    En fazla PROGRESS_INTERVAL'da bir; ancak hızlı çalışmalarda ilerleme
+    donmuş görünmesin diye her %5 eşiği geçilince de bildirilir.
+    """
+    scale = 75.0 / total_duration if total_duration else 0.0
+    next_tick = 0.0
+    last_step = -1
+    for segment in segments_iter:
+        now = time.monotonic()
+        progress = 20.0 + segment.end * scale
+        step = int(progress // 5)
+        if now >= next_tick or step > last_step:
+            progress_callback(progress, f"Transcribing... {segment.end:.1f}s")
+            next_tick = now + PROGRESS_INTERVAL
+            last_step = step
+        yield segment
 
 
 class TranscriptBackend(Enum):
@@ -109,27 +486,49 @@ class ModelSize(Enum):
     LARGE = "large-v3"
 
 
+_ALL_MODEL_SIZES: Final = tuple(m.value for m in ModelSize)
+
+
 @dataclass
 class TranscriptConfig:
-    """Transkript konfigürasyonu."""
+    """
+    Transkript konfigürasyonu.
+
+    faster-whisper CUDA'da çalışırken CT2_CUDA_ALLOCATOR ortam değişkeni
+    ayarlanmamışsa "cuda_malloc_async" yapılır (VRAM işler arasında iade
+    edilir). Diğer CTranslate2 ortam değişkenleri (ör. CPU'da MKL için
+    CT2_USE_EXPERIMENTAL_PACKED_GEMM=1) kullanıcıya bırakılır.
+    """
     backend: TranscriptBackend = TranscriptBackend.FASTER_WHISPER
     model_size: ModelSize = ModelSize.BASE  # Changed from MEDIUM for speed
     language: Optional[str] = None  # None = auto-detect
     word_timestamps: bool = False  # Disabled by default for speed
     device: str = "auto"  # auto, cpu, cuda
-    compute_type: str = "auto"  # auto, int8, float16, float32
+    # auto, int8, int16, int8_float16, int8_bfloat16, float16, bfloat16, float32
+    compute_type: str = "auto"
 
     # VAD filter - helps speed by skipping silent parts
     vad_filter: bool = True
     vad_min_silence_duration_ms: int = 300  # Reduced for faster processing
 
-    # Output
-    include_word_timestamps: bool = False  # Disabled for speed
-
     # Performance options
     beam_size: int = 1  # 1 = greedy (fastest), 5 = default beam search
     best_of: int = 1  # Number of candidates (1 = fastest)
     num_workers: int = 4  # Parallel workers for faster-whisper
+    cpu_threads: int = 0  # CTranslate2 intra-op thread sayısı; 0 = min(CPU sayısı, 8)
+    batch_size: int = 8  # faster-whisper batched decode; 1 = sıralı
+    pipeline_preprocessing: bool = False  # Decode/model yükleme ve segment işleme paralel
+    preload: bool = True  # Model'i Transcriber oluşturulurken arka planda yükle
+    prewarm: bool = False  # İlk gerçek istekten önce 1 sn sessizlikle ısıt
+
+    @property
+    def include_word_timestamps(self) -> bool:
+        """Eski isim; word_timestamps kullanın (bir sürüm sonra kaldırılacak)."""
+        return self.word_timestamps
+
+
+# Transcriber preload'ları için tek thread: modeller sırayla, paylaşılan cache'e yüklenir
+_preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-preload")
 
 
 class Transcriber:
@@ -144,9 +543,27 @@ class Transcriber:
     def __init__(self, config: Optional[TranscriptConfig] = None):
         self.config = config or TranscriptConfig()
         self._model = None
+        self._batched = None
         self._backend_module = None
 
+        # Model yüklemesi arka planda başlar; çağıran audio'yu hazırlarken biter
+        self._load_future: Optional[Future] = None
+        if self.config.preload:
+            self._load_future = _preload_executor.submit(self._load_model_sync)
+
     def _load_model(self):
+        """Model'i yükle (preload sürüyorsa onu bekle)."""
+        if self._load_future is not None:
+            future, self._load_future = self._load_future, None
+            try:
+                future.result()
+            except Exception as e:
+                # Hata tekrar denenince (senkron yüklemede) kullanıcıya ulaşır
+                logger.debug(f"Model preload failed: {e}")
+
+        self._load_model_sync()
+
+    def _load_model_sync(self):
         """Model'i yükle (lazy loading)."""
         if self._model is not None:
             return
@@ -156,99 +573,255 @@ class Transcriber:
         else:
             self._load_openai_whisper()
 
+    def release(self) -> None:
+        """
+        Model'i bırak ve paylaşılan model cache'ini boşalt.
+
+        Diğer Transcriber'lar aynı modeli tutuyorsa bellek onlar bırakınca açılır.
+        """
+        if self._load_future is not None and not self._load_future.cancel():
+            self._load_future.exception()  # Sürüyorsa bitmesini bekle (hata yutulur)
+        self._load_future = None
+
+        if self._backend_module == "faster_whisper":
+            _get_faster_whisper_model.cache_clear()
+            _prewarm_model.cache_clear()
+        elif self._backend_module == "openai_whisper":
+            _get_openai_whisper_model.cache_clear()
+        self._model = None
+        self._batched = None
+        self._backend_module = None
+
     def _load_faster_whisper(self):
         """faster-whisper model'ini yükle."""
-        try:
-            from faster_whisper import WhisperModel
-        except ImportError:
-            raise ImportError(
-                "faster-whisper not installed. "
-                "Install with: pip install faster-whisper"
-            )
-
         # Device seçimi
-        device = self.config.device
+        device = _resolve_device(self.config.device)
         compute_type = self.config.compute_type
 
-        if device == "auto":
-            try:
-                import torch
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-            except ImportError:
-                device = "cpu"
+        if device == "cuda":
+            # CTranslate2'nin varsayılan caching allocator'ı çok dosyalı işlerde
+            # VRAM'i geri vermeden büyür; async allocator belleği driver'a iade eder.
+            # CTranslate2 ilk CUDA allocation'da okur, import'tan önce ayarlanmalı.
+            os.environ.setdefault("CT2_CUDA_ALLOCATOR", "cuda_malloc_async")
+
+        get_faster_whisper_model_class()  # Kurulu değilse burada ImportError
 
         if compute_type == "auto":
-            compute_type = "float16" if device == "cuda" else "int8"
+            compute_type = _cuda_compute_type() if device == "cuda" else _cpu_compute_type()
 
-        logger.info(f"Loading faster-whisper model: {self.config.model_size.value} "
-                   f"on {device} with {compute_type}")
+        # 8'den fazla intra-op thread getiri sağlamıyor; GPU'da paralellik
+        # zaten cihazda, ek worker sadece launch maliyeti ekler
+        cpu_threads = self.config.cpu_threads or min(os.cpu_count() or 1, 8)
+        num_workers = 1 if device == "cuda" else self.config.num_workers
 
-        self._model = WhisperModel(
-            self.config.model_size.value,
-            device=device,
-            compute_type=compute_type,
-        )
+        load_args = (self.config.model_size.value, device)
+        load_kwargs = {"cpu_threads": cpu_threads, "num_workers": num_workers}
+        try:
+            self._model = _get_faster_whisper_model(*load_args, compute_type, **load_kwargs)
+        except ValueError as e:
+            # Sürücü/kart bu tipi reddettiyse (ör. INT8 kapalı GPU'lar) float16'ya düş
+            if device != "cuda" or compute_type == "float16":
+                raise
+            logger.warning(f"compute_type {compute_type} rejected ({e}), falling back to float16")
+            self._model = _get_faster_whisper_model(*load_args, "float16", **load_kwargs)
         self._backend_module = "faster_whisper"
 
+        # VAD segmentlerini batch halinde encode eden pipeline (faster-whisper >= 1.0)
+        if self.config.batch_size > 1:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                self._batched = BatchedInferencePipeline(model=self._model)
+            except ImportError:
+                logger.debug("BatchedInferencePipeline unavailable, using sequential decode")
+
+        if self.config.prewarm:
+            _prewarm_model(self._model)
+
     def _load_openai_whisper(self):
         """openai-whisper model'ini yükle."""
-        try:
-            import whisper
-        except ImportError:
-            raise ImportError(
-                "openai-whisper not installed. "
-                "Install with: pip install openai-whisper"
-            )
+        get_whisper()  # Kurulu değilse burada ImportError
 
-        device = self.config.device
-        if device == "auto":
-            try:
-                import torch
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-            except ImportError:
-                device = "cpu"
+        device = _resolve_device(self.config.device)
 
-        logger.info(f"Loading openai-whisper model: {self.config.model_size.value} on {device}")
+        if device == "cpu":
+            logger.warning(
+                "openai-whisper will run on CPU, expect ~10x slower; "
+                "install torch with CUDA or switch backend to FASTER_WHISPER"
+            )
 
-        self._model = whisper.load_model(self.config.model_size.value, device=device)
+        self._model = _get_openai_whisper_model(self.config.model_size.value, device)
         self._backend_module = "openai_whisper"
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: Union[Path, np.ndarray],
         progress_callback: Optional[Callable[[float, str], None]] = None,
     ) -> list[TranscriptSegment]:
         """
         Audio dosyasını transkript et.
 
         Args:
-            audio_path: WAV dosya yolu
+            audio_path: WAV dosya yolu ya da 16 kHz mono PCM (numpy array)
             progress_callback: İlerleme callback'i (0-100, message)
 
         Returns:
             TranscriptSegment listesi
         """
-        self._load_model()
+        audio = self._prepare(audio_path, progress_callback)
 
-        if progress_callback:
-            progress_callback(10, "Model loaded, starting transcription...")
+        if self._backend_module == "faster_whisper":
+            return self._transcribe_faster_whisper(audio, progress_callback)
+        else:
+            return self._transcribe_openai_whisper(audio, progress_callback)
+
+    def iter_transcribe(
+        self,
+        audio_path: Union[Path, np.ndarray],
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> Iterator[TranscriptSegment]:
+        """
+        Audio dosyasını transkript et, segmentleri üretildikçe döndür.
+
+        faster-whisper'da segmentler decode ilerledikçe gelir; çağıran dosyanın
+        sonunu beklemeden işlemeye başlayabilir.
+
+        Args:
+            audio_path: WAV dosya yolu ya da 16 kHz mono PCM (numpy array)
+            progress_callback: İlerleme callback'i (0-100, message)
+
+        Yields:
+            TranscriptSegment
+        """
+        audio = self._prepare(audio_path, progress_callback)
+
+        if self._backend_module == "faster_whisper":
+            yield from self._iter_faster_whisper(audio, progress_callback)
+        else:
+            yield from self._transcribe_openai_whisper(audio, progress_callback)
+
+    def stream_srt(
+        self,
+        audio_path: Union[Path, np.ndarray],
+        out: TextIO,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> int:
+        """
+        Transkripti doğrudan SRT olarak yaz.
+
+        Sadece altyazı gereken durumlar için: segmentler decode edildikçe
+        yazılır, TranscriptSegment/TranscriptWord nesneleri hiç oluşturulmaz.
+
+        Args:
+            audio_path: WAV dosya yolu ya da 16 kHz mono PCM (numpy array)
+            out: Yazılabilir text stream
+            progress_callback: İlerleme callback'i (0-100, message)
+
+        Returns:
+            Yazılan cue sayısı
+        """
+        audio = self._prepare(audio_path, progress_callback)
 
         if self._backend_module == "faster_whisper":
-            return self._transcribe_faster_whisper(audio_path, progress_callback)
+            segments_iter, _ = self._start_faster_whisper(audio, progress_callback)
+            cues = ((seg.start, seg.end, seg.text) for seg in segments_iter)
         else:
-            return self._transcribe_openai_whisper(audio_path, progress_callback)
+            cues = (
+                (seg.get("start", 0), seg.get("end", 0), seg.get("text", ""))
+                for seg in self._run_openai_whisper(audio, progress_callback)["segments"]
+            )
+
+        count = 0
+        for start, end, text in cues:
+            count += 1
+            out.write(f"{count}\n{_srt_time(start)} --> {_srt_time(end)}\n{text.strip()}\n\n")
+
+        _report_done(progress_callback, count)
+        return count
+
+    def _prepare(
+        self,
+        audio_path: Union[Path, np.ndarray],
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ):
+        """Model'i yükle ve audio'yu decode et."""
+        if self.config.pipeline_preprocessing:
+            # Audio decode, model yüklenirken arka planda yapılır
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                audio_future = executor.submit(_decode_audio, audio_path)
+                self._load_model()
+                audio = audio_future.result()
+        else:
+            self._load_model()
+            audio = _decode_audio(audio_path)
+
+        if progress_callback:
+            progress_callback(10, "Model loaded, starting transcription...")
+        return audio
 
     def _transcribe_faster_whisper(
         self,
-        audio_path: Path,
+        audio,
         progress_callback: Optional[Callable[[float, str], None]] = None,
     ) -> list[TranscriptSegment]:
         """faster-whisper ile transkript."""
-        segments_iter, info = self._model.transcribe(
-            str(audio_path),
+        segments_iter, convert = self._start_faster_whisper(audio, progress_callback)
+
+        if self.config.pipeline_preprocessing:
+            result = _run_pipelined(segments_iter, lambda segments: list(convert(segments)))
+        else:
+            result = list(convert(segments_iter))
+
+        _report_done(progress_callback, len(result))
+        return result
+
+    def _iter_faster_whisper(
+        self,
+        audio,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> Iterator[TranscriptSegment]:
+        """faster-whisper ile transkript, segment segment."""
+        segments_iter, convert = self._start_faster_whisper(audio, progress_callback)
+
+        count = 0
+        for segment in convert(segments_iter):
+            count += 1
+            yield segment
+
+        _report_done(progress_callback, count)
+
+    def _start_faster_whisper(
+        self,
+        audio,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> tuple[Iterator, Callable[[Iterator], Iterator[TranscriptSegment]]]:
+        """
+        Decode'u başlat.
+
+        Returns:
+            (progress bildiren faster-whisper segment iterator'ı,
+             TranscriptSegment'e çeviren generator fonksiyonu)
+        """
+        transcribe = self._model.transcribe
+        extra = {}
+        batched = self._batched is not None and self.config.batch_size > 1
+        if batched:
+            transcribe = self._batched.transcribe
+            extra["batch_size"] = self.config.batch_size
+
+        # VAD'i bir kez burada çalıştır, decoder'a sadece konuşma aralıklarını ver.
+        # Batched pipeline VAD'i kendisi çalıştırıp aralıkları chunk_length'e göre
+        # birleştirir/böler (clip_timestamps'i sample offset olarak bekler); ona dokunulmaz.
+        vad_filter = self.config.vad_filter
+        clips = self._speech_clips(audio) if vad_filter and not batched else None
+        if clips:
+            vad_filter = False
+            extra["clip_timestamps"] = [t for clip in clips for t in clip]
+
+        segments_iter, info = transcribe(
+            audio,
             language=self.config.language,
             word_timestamps=self.config.word_timestamps,
-            vad_filter=self.config.vad_filter,
+            vad_filter=vad_filter,
             vad_parameters={
                 "min_silence_duration_ms": self.config.vad_min_silence_duration_ms,
             },
@@ -256,6 +829,7 @@ class Transcriber:
             best_of=self.config.best_of,
             without_timestamps=False,
             condition_on_previous_text=False,  # Faster, less context
+            **extra,
         )
 
         detected_language = info.language
@@ -264,95 +838,148 @@ class Transcriber:
 
         if progress_callback:
             progress_callback(20, f"Language: {detected_language}")
+        report_progress = progress_callback is not None and info.duration > 0
+
+        # Döngü dışında bir kez oku; kelimeler istenmiyorsa iç döngü hiç çalışmaz
+        want_words = self.config.word_timestamps
+
+        def convert(segments) -> Iterator[TranscriptSegment]:
+            # Progress tüketici tarafında: pipelined modda decode thread'ini bekletmez
+            if report_progress:
+                segments = _with_progress(segments, info.duration, progress_callback)
+            for segment in segments:
+                yield TranscriptSegment(
+                    text=segment.text.strip(),
+                    start=segment.start,
+                    end=segment.end,
+                    language=detected_language,
+                    words=[
+                        TranscriptWord(word.word.strip(), word.start, word.end, word.probability)
+                        for word in segment.words
+                    ] if want_words and segment.words else (),
+                )
 
-        result = []
-        total_duration = info.duration
-        processed_time = 0
-
-        for segment in segments_iter:
-            # Word-level timestamps
-            words = []
-            if self.config.include_word_timestamps and segment.words:
-                for word in segment.words:
-                    words.append(TranscriptWord(
-                        text=word.word.strip(),
-                        start=word.start,
-                        end=word.end,
-                        confidence=word.probability,
-                    ))
-
-            transcript_segment = TranscriptSegment(
-                text=segment.text.strip(),
-                start=segment.start,
-                end=segment.end,
-                language=detected_language,
-                words=words,
-            )
-            result.append(transcript_segment)
+        return segments_iter, convert
 
-            # Progress
-            processed_time = segment.end
-            if progress_callback and total_duration > 0:
-                progress = 20 + (processed_time / total_duration) * 75
-                progress_callback(progress, f"Transcribing... {processed_time:.1f}s")
+    def _speech_clips(self, audio) -> Optional[list[tuple[float, float]]]:
+        """
+        Silero VAD ile konuşma aralıkları (saniye).
 
-        if progress_callback:
-            progress_callback(100, "Transcription complete")
+        Audio decode edilmemişse (path) ya da faster-whisper'ın VAD modülü
+        yoksa None; konuşma bulunamazsa boş liste.
+        """
+        if isinstance(audio, str):
+            return None
+        try:
+            from faster_whisper.vad import VadOptions, get_speech_timestamps
+        except ImportError:
+            return None
 
-        logger.info(f"Transcribed {len(result)} segments")
-        return result
+        timestamps = get_speech_timestamps(
+            audio,
+            VadOptions(min_silence_duration_ms=self.config.vad_min_silence_duration_ms),
+        )
+        return [
+            (ts["start"] / WHISPER_SAMPLE_RATE, ts["end"] / WHISPER_SAMPLE_RATE)
+            for ts in timestamps
+        ]
 
-    def _transcribe_openai_whisper(
+    def _run_openai_whisper(
         self,
-        audio_path: Path,
+        audio,
         progress_callback: Optional[Callable[[float, str], None]] = None,
-    ) -> list[TranscriptSegment]:
-        """openai-whisper ile transkript."""
-        import whisper
-
+    ) -> dict:
+        """openai-whisper transcribe çağrısı (ham sonuç dict'i)."""
         if progress_callback:
             progress_callback(20, "Transcribing with OpenAI Whisper...")
 
-        # Transkript
-        result = self._model.transcribe(
-            str(audio_path),
+        # openai-whisper'ın kendi VAD'i yok; sessiz aralıklar decode edilmez
+        extra = {}
+        clips = self._speech_clips(audio) if self.config.vad_filter else None
+        if clips:
+            extra["clip_timestamps"] = [t for clip in clips for t in clip]
+
+        return self._model.transcribe(
+            audio,
             language=self.config.language,
             word_timestamps=self.config.word_timestamps,
             verbose=False,
+            fp16=self._model.device.type == "cuda",
+            **extra,
         )
 
+    def _transcribe_openai_whisper(
+        self,
+        audio,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> list[TranscriptSegment]:
+        """openai-whisper ile transkript."""
+        result = self._run_openai_whisper(audio, progress_callback)
+
         detected_language = result.get("language", "en")
 
         if progress_callback:
             progress_callback(80, "Processing segments...")
 
-        segments = []
-        for segment_data in result.get("segments", []):
-            words = []
-            if self.config.include_word_timestamps and "words" in segment_data:
-                for word_data in segment_data["words"]:
-                    words.append(TranscriptWord(
-                        text=word_data.get("word", "").strip(),
-                        start=word_data.get("start", 0),
-                        end=word_data.get("end", 0),
-                        confidence=word_data.get("probability", 1.0),
-                    ))
-
-            segment = TranscriptSegment(
+        want_words = self.config.word_timestamps
+        segments = [
+            TranscriptSegment(
                 text=segment_data.get("text", "").strip(),
                 start=segment_data.get("start", 0),
                 end=segment_data.get("end", 0),
                 language=detected_language,
-                words=words,
+                words=[
+                    TranscriptWord(
+                        word_data.get("word", "").strip(),
+                        word_data.get("start", 0),
+                        word_data.get("end", 0),
+                        word_data.get("probability", 1.0),
+                    )
+                    for word_data in segment_data["words"]
+                ] if want_words and "words" in segment_data else (),
             )
-            segments.append(segment)
+            for segment_data in result.get("segments", [])
+        ]
 
-        if progress_callback:
-            progress_callback(100, "Transcription complete")
-
-        logger.info(f"Transcribed {len(segments)} segments")
+        _report_done(progress_callback, len(segments))
         return segments
 
+    def _vote_language(self, audio_path: Path) -> Optional[tuple[str, float]]:
+        """
+        Baş/orta/son 10 sn'lik pencerelerle tek batch'te dil tespiti.
+
+        Pencereler CTranslate2 encoder'ına tek forward'da verilir, decoder
+        hiç çalışmaz; olasılıklar toplanıp en yüksek dil seçilir. Gerekli
+        faster-whisper iç API'leri yoksa None.
+        """
+        windows = _decode_windows(audio_path, seconds=10)
+        if not windows:
+            return None
+
+        try:
+            import numpy as np
+            from faster_whisper.audio import pad_or_trim
+            from faster_whisper.transcribe import get_ctranslate2_storage
+
+            extractor = self._model.feature_extractor
+            features = np.stack([
+                pad_or_trim(extractor(window)[..., :-1], extractor.nb_max_frames)
+                for window in windows
+            ])
+            results = self._model.model.detect_language(get_ctranslate2_storage(features))
+        except Exception as e:
+            logger.debug(f"Batched language detection unavailable: {e}")
+            return None
+
+        totals: dict[str, float] = {}
+        for window_result in results:
+            for token, prob in window_result:
+                language = token[2:-2]  # "<|en|>" -> "en"
+                totals[language] = totals.get(language, 0.0) + prob
+
+        detected = max(totals, key=totals.get)
+        return detected, totals[detected] / len(results)
+
     def detect_language(self, audio_path: Path) -> tuple[str, float]:
         """
         Dil tespiti yap.
@@ -363,17 +990,25 @@ class Transcriber:
         self._load_model()
 
         if self._backend_module == "faster_whisper":
-            # İlk 30 saniye ile dil tespiti
+            voted = self._vote_language(audio_path)
+            if voted is not None:
+                return voted
+
+        # Dil tespiti için ilk 30 saniye yeterli (Whisper'ın tek pencere uzunluğu)
+        audio = _decode_audio(audio_path, max_seconds=30)
+
+        if self._backend_module == "faster_whisper":
             _, info = self._model.transcribe(
-                str(audio_path),
+                audio,
                 language=None,
                 task="transcribe",
             )
             return info.language, info.language_probability
         else:
-            import whisper
+            whisper = get_whisper()
             # openai-whisper için ayrı dil tespiti
-            audio = whisper.load_audio(str(audio_path))
+            if isinstance(audio, str):
+                audio = whisper.load_audio(audio)
             audio = whisper.pad_or_trim(audio)
             mel = whisper.log_mel_spectrogram(audio).to(self._model.device)
             _, probs = self._model.detect_language(mel)
@@ -382,7 +1017,7 @@ class Transcriber:
 
 
 def transcribe_audio(
-    audio_path: Path,
+    audio_path: Union[Path, np.ndarray],
     config: Optional[TranscriptConfig] = None,
     progress_callback: Optional[Callable[[float, str], None]] = None,
 ) -> list[TranscriptSegment]:
@@ -390,7 +1025,7 @@ def transcribe_audio(
     Convenience function for transcription.
 
     Args:
-        audio_path: Audio dosya yolu
+        audio_path: Audio dosya yolu ya da 16 kHz mono PCM (numpy array)
         config: Transkript konfigürasyonu
         progress_callback: İlerleme callback'i
 
@@ -405,6 +1040,125 @@ def transcribe_audio(
 # Gemini Transcriber
 # =============================================================================
 
+GEMINI_API_HOST = "generativelanguage.googleapis.com"
+GEMINI_API_BASE = f"https://{GEMINI_API_HOST}"
+
+# Gemini yanıtından JSON objesi: önce ```json``` bloğu, yoksa ilk '{' ile son '}' arası
+_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+# Inline audio JSON'a bu placeholder ile girer, serileştirmeden sonra değiştirilir
+_B64_PLACEHOLDER = "__AUDIO_B64__"
+
+# 3'ün katı: parça sınırlarında base64 padding oluşmaz
+_B64_CHUNK = 3 * 64 * 1024
+
+
+class _InlineAudioBody(io.RawIOBase):
+    """
+    Inline audio'lu request body'si için okunabilir stream.
+
+    JSON'un placeholder öncesi kısmı, mmap'lenmiş dosyanın parça parça
+    base64'ü ve JSON'un kalanı sırayla okunur; base64'ün tamamı hiçbir
+    zaman bellekte tutulmaz. seek(0) ile baştan okunabilir (bağlantı
+    yeniden denemesi için).
+    """
+
+    def __init__(self, prefix: bytes, audio_path: Path, suffix: bytes):
+        super().__init__()
+        self._prefix = prefix
+        self._suffix = suffix
+        self._file = audio_path.open('rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # Boş dosya mmap'lenemez
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.length = len(prefix) + 4 * ((size + 2) // 3) + len(suffix)
+        self.seek(0)
+
+    def _pieces(self) -> Iterator[bytes]:
+        yield self._prefix
+        mm = self._mm
+        for i in range(0, len(mm), _B64_CHUNK):
+            yield binascii.b2a_base64(mm[i:i + _B64_CHUNK], newline=False)
+        yield self._suffix
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("only seek(0) is supported")
+        self._iter = self._pieces()
+        self._pending = memoryview(b"")
+        return 0
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            piece = next(self._iter, None)
+            if piece is None:
+                return 0
+            self._pending = memoryview(piece)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            if isinstance(self._mm, mmap.mmap):
+                self._mm.close()
+            self._file.close()
+        super().close()
+
+
+def _encode_request(request_data: dict, inline_path: Optional[Path] = None):
+    """
+    Request body'yi hazırla.
+
+    Inline audio yoksa JSON byte'ları döner. Varsa _InlineAudioBody döner:
+    base64 yalnızca [A-Za-z0-9+/=] içerdiği için JSON encoder'ından (orjson
+    dahil) geçirilmeden placeholder'ın yerine stream edilir.
+    """
+    body = _json_dumps(request_data)
+    if inline_path is None:
+        return body
+    prefix, suffix = body.split(_B64_PLACEHOLDER.encode(), 1)
+    return _InlineAudioBody(prefix, inline_path, suffix)
+
+
+_MIME_BY_SUFFIX = {
+    '.wav': 'audio/wav',
+    '.mp3': 'audio/mp3',
+    '.m4a': 'audio/mp4',
+    '.aac': 'audio/aac',
+    '.ogg': 'audio/ogg',
+    '.flac': 'audio/flac',
+}
+
+_GEMINI_PROMPT = """Transcribe this audio file accurately.{language_hint}
+
+Return the transcription in JSON format with timestamps:
+{
+  "language": "detected language code (e.g., en, tr)",
+  "segments": [
+    {"start": 0.0, "end": 2.5, "text": "First sentence here."},
+    {"start": 2.5, "end": 5.0, "text": "Second sentence here."}
+  ]
+}
+
+Rules:
+- Use accurate timestamps in seconds
+- Each segment should be a complete sentence or phrase
+- Preserve the original language
+- Include punctuation
+- Return ONLY the JSON, no other text"""
+
+# File API kullanılamazsa bu boyutun altındaki dosyalar inline (base64) gönderilir
+GEMINI_INLINE_LIMIT = 20 * 1024 * 1024
+
+
 @dataclass
 class GeminiConfig:
     """Gemini transcription configuration."""
@@ -422,9 +1176,88 @@ class GeminiTranscriber:
         segments = transcriber.transcribe(audio_path, progress_callback)
     """
 
+    # Keep-alive bağlantılar: sonraki istekler TCP + TLS handshake'i atlar.
+    # http.client bağlantıları thread-safe değil, bu yüzden her istek havuzdan
+    # boşta bir bağlantı alır ve iş bitince geri bırakır.
+    _idle_conns: ClassVar[list[http.client.HTTPSConnection]] = []
+    _conn_lock: ClassVar[threading.Lock] = threading.Lock()
+    _MAX_IDLE_CONNS: ClassVar[int] = 4
+
     def __init__(self, config: GeminiConfig):
         self.config = config
 
+    @classmethod
+    def _acquire_conn(cls) -> http.client.HTTPSConnection:
+        with cls._conn_lock:
+            if cls._idle_conns:
+                return cls._idle_conns.pop()
+        return http.client.HTTPSConnection(GEMINI_API_HOST, blocksize=64 * 1024)
+
+    @classmethod
+    def _release_conn(cls, conn: http.client.HTTPSConnection) -> None:
+        with cls._conn_lock:
+            if len(cls._idle_conns) < cls._MAX_IDLE_CONNS:
+                cls._idle_conns.append(conn)
+                return
+        conn.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        body=None,
+        headers: Optional[dict] = None,
+        timeout: float = 300,
+    ) -> tuple[http.client.HTTPMessage, bytes]:
+        """
+        Gemini host'una keep-alive bağlantı üzerinden istek at.
+
+        urlopen ile aynı hata sözleşmesi: HTTP >= 400 için HTTPError,
+        bağlantı hataları için URLError.
+
+        Returns:
+            (response_headers, response_body)
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.netloc != GEMINI_API_HOST:
+            req = urllib.request.Request(url, data=body, headers=headers or {}, method=method)
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                return response.headers, response.read()
+
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+        # Boşta beklerken sunucunun kapattığı bağlantı ilk denemede düşebilir; bir kez yeniden dene
+        for attempt in range(2):
+            conn = self._acquire_conn()
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if attempt:
+                    raise urllib.error.URLError(e) from e
+                if hasattr(body, "seek"):
+                    body.seek(0)
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise urllib.error.URLError(e) from e
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release_conn(conn)
+
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, io.BytesIO(data)
+            )
+        return response.headers, data
+
     def transcribe(
         self,
         audio_path: Path,
@@ -443,58 +1276,29 @@ class GeminiTranscriber:
         if progress_callback:
             progress_callback(10, "Preparing audio for Gemini...")
 
-        # Read and encode audio file
-        audio_data = audio_path.read_bytes()
-        audio_base64 = base64.standard_b64encode(audio_data).decode('utf-8')
-
-        # Determine MIME type
-        suffix = audio_path.suffix.lower()
-        mime_types = {
-            '.wav': 'audio/wav',
-            '.mp3': 'audio/mp3',
-            '.m4a': 'audio/mp4',
-            '.aac': 'audio/aac',
-            '.ogg': 'audio/ogg',
-            '.flac': 'audio/flac',
-        }
-        mime_type = mime_types.get(suffix, 'audio/wav')
+        mime_type = _MIME_BY_SUFFIX.get(audio_path.suffix.lower(), 'audio/wav')
 
         if progress_callback:
-            progress_callback(20, "Sending to Gemini API...")
+            progress_callback(20, "Uploading audio to Gemini...")
+
+        # Audio part: File API (binary upload) veya küçük dosyalarda inline base64
+        audio_part, uploaded_name, inline_path = self._audio_part(audio_path, mime_type)
 
         # Prepare the prompt for transcription with timestamps
         language_hint = f" The audio is in {self.config.language}." if self.config.language else ""
-        prompt = f"""Transcribe this audio file accurately.{language_hint}
-
-Return the transcription in JSON format with timestamps:
-{{
-  "language": "detected language code (e.g., en, tr)",
-  "segments": [
-    {{"start": 0.0, "end": 2.5, "text": "First sentence here."}},
-    {{"start": 2.5, "end": 5.0, "text": "Second sentence here."}}
-  ]
-}}
-
-Rules:
-- Use accurate timestamps in seconds
-- Each segment should be a complete sentence or phrase
-- Preserve the original language
-- Include punctuation
-- Return ONLY the JSON, no other text"""
+        prompt = _GEMINI_PROMPT.replace("{language_hint}", language_hint)
 
         # Build API request
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.config.model}:generateContent?key={self.config.api_key}"
+        url = (
+            f"{GEMINI_API_BASE}/v1beta/models/{self.config.model}:generateContent"
+            f"?key={self.config.api_key}"
+        )
 
         request_data = {
             "contents": [{
                 "parts": [
                     {"text": prompt},
-                    {
-                        "inline_data": {
-                            "mime_type": mime_type,
-                            "data": audio_base64
-                        }
-                    }
+                    audio_part,
                 ]
             }],
             "generationConfig": {
@@ -503,19 +1307,18 @@ Rules:
             }
         }
 
+        body = None
         try:
-            req = urllib.request.Request(
-                url,
-                data=json.dumps(request_data).encode('utf-8'),
-                headers={"Content-Type": "application/json"},
-                method="POST"
-            )
+            body = _encode_request(request_data, inline_path)
+            headers = {"Content-Type": "application/json"}
+            if isinstance(body, _InlineAudioBody):
+                headers["Content-Length"] = str(body.length)
 
             if progress_callback:
                 progress_callback(40, "Waiting for Gemini response...")
 
-            with urllib.request.urlopen(req, timeout=300) as response:
-                result = json.loads(response.read().decode('utf-8'))
+            _, response_body = self._request("POST", url, body=body, headers=headers)
+            result = _json_loads(response_body)
 
             if progress_callback:
                 progress_callback(80, "Processing transcription...")
@@ -544,62 +1347,139 @@ Rules:
             logger.error(f"Gemini transcription error: {e}")
             raise
 
+        finally:
+            if isinstance(body, _InlineAudioBody):
+                body.close()
+            if uploaded_name:
+                self._delete_file(uploaded_name)
+
+    def _audio_part(
+        self,
+        audio_path: Path,
+        mime_type: str,
+    ) -> tuple[dict, Optional[str], Optional[Path]]:
+        """
+        Request için audio part'ı hazırla.
+
+        Returns:
+            (part, uploaded_file_name, inline_path) - File API'de inline_path None,
+            inline fallback'te name None ve part'taki data placeholder'dır
+        """
+        try:
+            file_uri, file_name = self._upload_file(audio_path, mime_type)
+            part = {"file_data": {"mime_type": mime_type, "file_uri": file_uri}}
+            return part, file_name, None
+        except (urllib.error.URLError, ValueError, KeyError) as e:
+            if audio_path.stat().st_size >= GEMINI_INLINE_LIMIT:
+                raise RuntimeError(f"Gemini file upload failed: {e}") from e
+            logger.warning(f"Gemini file upload failed, sending inline: {e}")
+
+        part = {"inline_data": {"mime_type": mime_type, "data": _B64_PLACEHOLDER}}
+        return part, None, audio_path
+
+    def _upload_file(self, path: Path, mime_type: str) -> tuple[str, str]:
+        """
+        Dosyayı Gemini File API'ye resumable upload ile yükle.
+
+        Returns:
+            (file_uri, file_name)
+        """
+        size = path.stat().st_size
+
+        # 1. Upload session başlat
+        response_headers, _ = self._request(
+            "POST",
+            f"{GEMINI_API_BASE}/upload/v1beta/files?key={self.config.api_key}",
+            body=_json_dumps({"file": {"display_name": path.name}}),
+            headers={
+                "X-Goog-Upload-Protocol": "resumable",
+                "X-Goog-Upload-Command": "start",
+                "X-Goog-Upload-Header-Content-Length": str(size),
+                "X-Goog-Upload-Header-Content-Type": mime_type,
+                "Content-Type": "application/json",
+            },
+            timeout=60,
+        )
+        upload_url = response_headers.get("X-Goog-Upload-URL")
+        if not upload_url:
+            raise ValueError("Gemini upload URL missing from response")
+
+        # 2. Byte'ları tek parçada gönder (dosya objesi stream edilir)
+        with path.open('rb') as f:
+            _, response_body = self._request(
+                "POST",
+                upload_url,
+                body=f,
+                headers={
+                    "Content-Length": str(size),
+                    "X-Goog-Upload-Offset": "0",
+                    "X-Goog-Upload-Command": "upload, finalize",
+                },
+            )
+            file_info = _json_loads(response_body)["file"]
+
+        # 3. İşlenmesini bekle (audio için genelde hemen ACTIVE)
+        deadline = time.monotonic() + 60
+        while file_info.get("state") == "PROCESSING" and time.monotonic() < deadline:
+            time.sleep(1)
+            _, response_body = self._request(
+                "GET",
+                f"{GEMINI_API_BASE}/v1beta/{file_info['name']}?key={self.config.api_key}",
+                timeout=30,
+            )
+            file_info = _json_loads(response_body)
+
+        if file_info.get("state") == "FAILED":
+            raise ValueError(f"Gemini file processing failed: {file_info['name']}")
+
+        logger.debug(f"Uploaded {path.name} to Gemini as {file_info['name']}")
+        return file_info["uri"], file_info["name"]
+
+    def _delete_file(self, file_name: str) -> None:
+        """Yüklenen dosyayı sil (best effort; dosyalar 48 saatte zaten silinir)."""
+        try:
+            self._request(
+                "DELETE",
+                f"{GEMINI_API_BASE}/v1beta/{file_name}?key={self.config.api_key}",
+                timeout=30,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to delete Gemini file {file_name}: {e}")
+
     def _parse_response(self, response_text: str) -> list[TranscriptSegment]:
         """Parse Gemini response to TranscriptSegment list."""
         logger.debug(f"Parsing Gemini response, length: {len(response_text)}")
 
-        json_text = response_text.strip()
-
-        # Method 1: Extract content from markdown code blocks
-        if '```' in json_text:
-            lines = json_text.split('\n')
-            cleaned_lines = []
-            in_code_block = False
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith('```'):
-                    in_code_block = not in_code_block
-                    continue  # Skip the ``` lines themselves
-                if in_code_block:
-                    cleaned_lines.append(line)  # Keep lines inside code block
-            if cleaned_lines:
-                json_text = '\n'.join(cleaned_lines).strip()
-            logger.debug(f"After code block removal: {json_text[:200]}...")
-
-        # Method 2: Find JSON object boundaries
-        brace_start = json_text.find('{')
-        if brace_start != -1:
-            # Find matching closing brace
-            depth = 0
-            brace_end = -1
-            for i, char in enumerate(json_text[brace_start:], brace_start):
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        brace_end = i
-                        break
-
-            if brace_end > brace_start:
-                json_text = json_text[brace_start:brace_end + 1]
-
-        logger.debug(f"Cleaned JSON text starts with: {json_text[:100]}...")
-
+        # Fast path: temperature düşük olduğunda Gemini çoğunlukla saf JSON döner
+        data = None
         try:
-            data = json.loads(json_text)
-            logger.debug(f"Successfully parsed JSON with {len(data.get('segments', []))} segments")
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Gemini response as JSON: {e}")
-            logger.error(f"JSON text was: {json_text[:500]}...")
-            # Return single segment with cleaned text (without JSON/code blocks)
-            clean_text = response_text.replace('```json', '').replace('```', '').strip()
-            return [TranscriptSegment(
-                text=clean_text,
-                start=0.0,
-                end=0.0,
-                language="unknown",
-            )]
+            data = _json_loads(response_text)
+        except json.JSONDecodeError:
+            pass
+
+        if not isinstance(data, dict):
+            # Code block içindeki ya da metne gömülü JSON objesini çıkar
+            match = _JSON_RE.search(response_text)
+            json_text = (match.group(1) or match.group(2)) if match else response_text.strip()
+            logger.debug(f"Cleaned JSON text starts with: {json_text[:100]}...")
+
+            try:
+                data = _json_loads(json_text)
+                if not isinstance(data, dict):
+                    raise json.JSONDecodeError("Expected JSON object", json_text, 0)
+                segment_count = len(data.get("segments", []))
+                logger.debug(f"Successfully parsed JSON with {segment_count} segments")
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse Gemini response as JSON: {e}")
+                logger.error(f"JSON text was: {json_text[:500]}...")
+                # Return single segment with cleaned text (without JSON/code blocks)
+                clean_text = response_text.replace('```json', '').replace('```', '').strip()
+                return [TranscriptSegment(
+                    text=clean_text,
+                    start=0.0,
+                    end=0.0,
+                    language="unknown",
+                )]
 
         language = data.get("language", "unknown")
         segments = []
@@ -0,0 +1,78 @@
+"""
+Cuts listesi için model (QListView ile sanallaştırılmış gösterim).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from app.core.models import Cut
+
+
+class CutsModel(QAbstractListModel):
+    """
+    Project.cuts listesini doğrudan gösteren liste modeli.
+
+    Satır başına widget/item oluşturulmaz; metin yalnızca görünen satırlar
+    için data() çağrıldığında üretilir. Qt.UserRole cut.id döndürür.
+    """
+
+    def __init__(self, format_time: Callable[[float], str], parent=None):
+        super().__init__(parent)
+        self._format_time = format_time
+        self._cuts: list[Cut] = []
+        self._rows: Optional[dict[str, int]] = None  # cut.id -> satır, ilk aramada kurulur
+
+    def set_cuts(self, cuts: list[Cut]) -> None:
+        """Gösterilen listeyi tek reset ile değiştir (liste kopyalanmaz)."""
+        self.beginResetModel()
+        self._cuts = cuts
+        self._rows = None
+        self.endResetModel()
+
+    def rowCount(self, parent: Optional[QModelIndex] = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self._cuts)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cut = self._cuts[index.row()]
+        if role == Qt.DisplayRole:
+            status = "✅" if cut.enabled else "⬜"
+            return (
+                f"{status} {self._format_time(cut.start)} → {self._format_time(cut.end)}"
+                f" ({self._format_time(cut.duration)})"
+            )
+        if role == Qt.UserRole:
+            return cut.id
+        return None
+
+    def cut_at(self, index: QModelIndex) -> Optional[Cut]:
+        """index'teki Cut (geçersizse None)."""
+        if not index.isValid() or index.row() >= len(self._cuts):
+            return None
+        return self._cuts[index.row()]
+
+    def row_of(self, cut_id: str) -> int:
+        """cut_id'nin satırı, yoksa -1."""
+        if self._rows is None:
+            self._rows = {cut.id: row for row, cut in enumerate(self._cuts)}
+        return self._rows.get(cut_id, -1)
+
+    def remove_row(self, row: int) -> None:
+        """Tek cut'ı listeden çıkar; diğer satırlar yeniden kurulmaz."""
+        if not 0 <= row < len(self._cuts):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._cuts[row]
+        self._rows = None
+        self.endRemoveRows()
+
+    def refresh_row(self, row: int) -> None:
+        """Tek satırın metnini yeniden çizdir (ör. enabled değişince)."""
+        if 0 <= row < len(self._cuts):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
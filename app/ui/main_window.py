@@ -11,10 +11,15 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
+from functools import cache
+from importlib import import_module
 from datetime import datetime
+from concurrent.futures import Future
 
-from PySide6.QtCore import Qt, QTimer, Signal, Slot, QThreadPool, QSize
+from PySide6.QtCore import (
+    Qt, QEvent, QTimer, Signal, Slot, QThread, QThreadPool, QSize, QModelIndex,
+)
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -23,7 +28,7 @@ from PySide6.QtWidgets import (
     QSplitter,
     QFileDialog,
     QMessageBox,
-    QProgressDialog,
+    QProgressBar,
     QApplication,
     QMenuBar,
     QMenu,
@@ -37,8 +42,8 @@ from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
     QFormLayout,
+    QListView,
     QListWidget,
-    QListWidgetItem,
     QCheckBox,
     QTabWidget,
     QFrame,
@@ -57,20 +62,360 @@ import importlib.resources
 from app.core.models import Project, MediaInfo, AnalysisConfig, Cut
 from app.core.settings import Settings, Preset, DEFAULT_PRESETS
 from app.core.i18n import tr, set_language, get_language, detect_system_language
-from app.media.ffmpeg import probe_media, extract_audio, FFmpegError, FFmpegNotFoundError
-from app.media.waveform import WaveformGenerator, WaveformData
-from app.analysis.silence_detector import detect_silence, detect_silence_ffmpeg
-from app.export.fcpxml import export_fcpxml
-from app.export.edl import export_edl
-from app.export.premiere_xml import export_premiere_xml
+from app.media.ffmpeg import (
+    PROBE_ANALYZE_DURATION,
+    PROBE_SIZE,
+    probe_media,
+    extract_audio,
+    FFmpegError,
+    FFmpegNotFoundError,
+)
+from app.media import probe_cache
 
 from .timeline_widget import TimelineWidget
 from .settings_dialog import SettingsDialog
 from .worker import Worker
+from .cuts_model import CutsModel
 from .video_player import VideoPlayer
 
+if TYPE_CHECKING:
+    from app.media.waveform import WaveformData
+
 logger = logging.getLogger(__name__)
 
+# Export modülleri (lxml vb.) ilk export'a kadar import edilmez; sıra export dialog'u ile aynı
+_EXPORT_FUNCS = (
+    ("app.export.fcpxml", "export_fcpxml"),
+    ("app.export.premiere_xml", "export_premiere_xml"),
+    ("app.export.edl", "export_edl"),
+)
+
+
+@cache
+def _preset_display_names(language: str) -> dict[str, str]:
+    """Varsayılan preset adlarının çevirisi (dil başına bir kez)."""
+    return {
+        "Podcast": tr("preset_podcast"),
+        "Tutorial": tr("preset_tutorial"),
+        "Meeting": tr("preset_meeting"),
+        "Noisy Room": tr("preset_noisy"),
+        "Aggressive": tr("preset_aggressive"),
+    }
+
+
+@cache
+def _get_export_fn(format_id: int) -> Callable[[Project, Path], Path]:
+    """format_id'ye ait export fonksiyonunu ilk kullanımda import et."""
+    module_name, func_name = _EXPORT_FUNCS[format_id]
+    return getattr(import_module(module_name), func_name)
+
+# Siyah/Beyaz minimal tema; modül yüklenirken bir kez oluşturulur
+_DARK_QSS: str = """
+QMainWindow {
+    background-color: #1a1a1a;
+}
+
+#leftPanel, #rightPanel {
+    background-color: #222222;
+    border: none;
+}
+
+#centerPanel {
+    background-color: #1a1a1a;
+}
+
+#appTitle {
+    color: #ffffff;
+    padding: 8px 0;
+}
+
+QGroupBox {
+    color: #ffffff;
+    border: 1px solid #333333;
+    border-radius: 6px;
+    margin-top: 12px;
+    padding: 12px 8px 8px 8px;
+    font-weight: 500;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 12px;
+    padding: 0 6px;
+    color: #888888;
+}
+
+QLabel {
+    color: #ffffff;
+    background: transparent;
+}
+
+#mediaInfo, #cutInfo {
+    color: #888888;
+    font-size: 12px;
+    padding: 8px;
+    background-color: #2a2a2a;
+    border-radius: 6px;
+}
+
+QPushButton {
+    background-color: #333333;
+    color: #ffffff;
+    border: 1px solid #444444;
+    border-radius: 6px;
+    padding: 10px 16px;
+    font-weight: 500;
+}
+
+QPushButton:hover {
+    background-color: #444444;
+    border-color: #666666;
+}
+
+QPushButton:pressed {
+    background-color: #222222;
+}
+
+QPushButton:disabled {
+    background-color: #1a1a1a;
+    color: #555555;
+    border-color: #2a2a2a;
+}
+
+#primaryButton {
+    background-color: #ffffff;
+    color: #000000;
+    border-color: #ffffff;
+}
+
+#primaryButton:hover {
+    background-color: #e0e0e0;
+}
+
+#primaryButton:disabled {
+    background-color: #444444;
+    color: #888888;
+    border-color: #444444;
+}
+
+#playButton {
+    background-color: #ffffff;
+    color: #000000;
+    border-radius: 20px;
+    font-size: 16px;
+}
+
+#playButton:hover {
+    background-color: #e0e0e0;
+}
+
+#zoomButton {
+    padding: 4px 10px;
+    min-width: 28px;
+}
+
+QComboBox, QSpinBox, QDoubleSpinBox {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    border: 1px solid #444444;
+    border-radius: 6px;
+    padding: 8px 12px;
+}
+
+QComboBox:hover, QSpinBox:hover, QDoubleSpinBox:hover {
+    border-color: #666666;
+}
+
+QComboBox::drop-down {
+    border: none;
+    width: 24px;
+}
+
+QComboBox QAbstractItemView {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    selection-background-color: #444444;
+}
+
+QListView {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    border: 1px solid #333333;
+    border-radius: 6px;
+}
+
+QListView::item {
+    padding: 8px;
+    border-radius: 4px;
+}
+
+QListView::item:selected {
+    background-color: #ffffff;
+    color: #000000;
+}
+
+QListView::item:hover:!selected {
+    background-color: #3a3a3a;
+}
+
+QCheckBox {
+    color: #ffffff;
+    spacing: 8px;
+}
+
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border: 2px solid #444444;
+    border-radius: 4px;
+    background-color: #2a2a2a;
+}
+
+QCheckBox::indicator:checked {
+    background-color: #ffffff;
+    border-color: #ffffff;
+}
+
+QTabWidget::pane {
+    border: 1px solid #333333;
+    border-radius: 6px;
+    background-color: #222222;
+}
+
+QTabBar::tab {
+    background-color: #2a2a2a;
+    color: #888888;
+    border: none;
+    padding: 10px 20px;
+    margin-right: 2px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+}
+
+QTabBar::tab:selected {
+    background-color: #222222;
+    color: #ffffff;
+    border-bottom: 2px solid #ffffff;
+}
+
+QSlider::groove:horizontal {
+    background: #333333;
+    height: 6px;
+    border-radius: 3px;
+}
+
+QSlider::handle:horizontal {
+    background: #ffffff;
+    width: 16px;
+    height: 16px;
+    margin: -5px 0;
+    border-radius: 8px;
+}
+
+QSlider::sub-page:horizontal {
+    background: #888888;
+    border-radius: 3px;
+}
+
+#timeLabel {
+    color: #ffffff;
+    font-family: "Menlo", "Consolas", "DejaVu Sans Mono";
+    font-size: 13px;
+    font-weight: bold;
+}
+
+#playbackControls {
+    background-color: #222222;
+    border-radius: 8px;
+    margin: 0 12px;
+}
+
+QMenuBar {
+    background-color: #222222;
+    color: #ffffff;
+    border-bottom: 1px solid #333333;
+}
+
+QMenuBar::item:selected {
+    background-color: #333333;
+}
+
+QMenu {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    border: 1px solid #333333;
+}
+
+QMenu::item:selected {
+    background-color: #444444;
+}
+
+QToolBar {
+    background-color: #222222;
+    border-bottom: 1px solid #333333;
+    padding: 4px;
+    spacing: 4px;
+}
+
+#statusBar {
+    background-color: #222222;
+    color: #888888;
+    border-top: 1px solid #333333;
+}
+
+QScrollBar:vertical {
+    background-color: #1a1a1a;
+    width: 10px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: #444444;
+    border-radius: 5px;
+    min-height: 30px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: #666666;
+}
+
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0;
+}
+
+#statusBar QProgressBar {
+    background-color: #1a1a1a;
+    border: 1px solid #333333;
+    border-radius: 3px;
+    color: #ffffff;
+    text-align: center;
+    max-height: 14px;
+}
+
+#statusBar QProgressBar::chunk {
+    background-color: #ffffff;
+}
+
+QMessageBox {
+    background-color: #2a2a2a;
+}
+
+QMessageBox QLabel {
+    color: #ffffff;
+}
+"""
+
+
+class _ProgressJob:
+    """Status bar'da izlenen arka plan işi: başlık, son ilerleme ve iptal bayrağı."""
+
+    __slots__ = ("title", "value", "message", "cancelled")
+
+    def __init__(self, title: str):
+        self.title = title
+        self.value = 0
+        self.message = ""
+        self.cancelled = False  # UI'da set edilir, worker thread'leri yoklar
+
 
 class MainWindow(QMainWindow):
     """Ana uygulama penceresi."""
@@ -79,6 +424,13 @@ class MainWindow(QMainWindow):
     project_changed = Signal()
     analysis_complete = Signal(list)
     export_complete = Signal(Path)
+    # job, value, message (worker thread'lerinden emit edilir)
+    progress_update = Signal(object, int, str)
+
+    # Font eşleştirme / dosya okuma pahalı; pencereler arasında paylaşılır
+    # (QApplication sonrası oluşturulur)
+    _TITLE_FONT: Optional[QFont] = None
+    _APP_ICON: Optional[QIcon] = None
 
     def __init__(self):
         super().__init__()
@@ -86,14 +438,35 @@ class MainWindow(QMainWindow):
         self.settings = Settings.load()
         self.project: Optional[Project] = None
         self.waveform_data: Optional[WaveformData] = None
-        self.thread_pool = QThreadPool()
+        # Süreç genelinde tek havuz; bir çekirdek UI thread'ine bırakılır
+        self.thread_pool = QThreadPool.globalInstance()
+        self.thread_pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 1))
         self._project_path: Optional[Path] = None
-        self._progress_dialog: Optional[QProgressDialog] = None
-        self._progress_active: bool = False  # Flag to safely ignore progress updates after close
+        # Çalışan işler; status bar en son başlayanı gösterir, Cancel onu iptal eder
+        self._progress_jobs: list[_ProgressJob] = []
+        # Son kayıttan beri proje değişti mi (autosave yalnızca o zaman yazar)
+        self._dirty: bool = False
+        self._audio_future: Optional[Future] = None  # Yükleme sonrası başlayan WAV çıkarımı
         self._video_path: Optional[Path] = None
+        self._pending_media: Optional[Path] = None  # Probe'u süren son import
         self._updating_position: bool = False  # Prevent recursion between video and timeline
+        # Timeline'a henüz yansıtılmamış video pozisyonu
+        self._pending_position: Optional[float] = None
+        # Video pozisyonu frame hızında gelir; timeline en fazla ~30 Hz'de çizilir
+        self._position_timer = QTimer(self)
+        self._position_timer.setSingleShot(True)
+        self._position_timer.setInterval(33)
+        self._position_timer.timeout.connect(self._flush_position)
+        # Analiz parametreleri: spinbox'lar her tık/tuşta değil, 250 ms durulunca işlenir
+        self._param_debounce = QTimer(self)
+        self._param_debounce.setSingleShot(True)
+        self._param_debounce.setInterval(250)
+        self._param_debounce.timeout.connect(self._on_params_settled)
         self._active_workers: list = []  # Keep workers alive until callbacks complete
 
+        # Progress widget'ları yalnızca ana thread'de, kuyruklanmış slot ile güncellenir
+        self.progress_update.connect(self._update_progress, Qt.QueuedConnection)
+
         # Dil ayarı
         if self.settings.language:
             set_language(self.settings.language)
@@ -114,6 +487,9 @@ class MainWindow(QMainWindow):
         self._update_ui_language()
         self._set_app_icon()
 
+        # Uygulama gizlenince (macOS Cmd+H vb.) oynatıcı decode etmesin
+        QApplication.instance().applicationStateChanged.connect(self._update_player_suspension)
+
         # Autosave timer
         if self.settings.autosave_enabled:
             self.autosave_timer = QTimer(self)
@@ -156,12 +532,34 @@ class MainWindow(QMainWindow):
         self.thread_pool.start(worker)
         logger.debug(f"Worker started, {len(self._active_workers)} active workers")
 
+    def changeEvent(self, event):
+        """Minimize edilince video decode'unu durdur."""
+        if event.type() == QEvent.WindowStateChange:
+            self._update_player_suspension()
+        super().changeEvent(event)
+
+    def _update_player_suspension(self, *_):
+        """Pencere minimize, uygulama arka planda ya da gizliyse oynatıcı frame okumaz."""
+        if not hasattr(self, "video_player"):
+            return
+        # Masaüstünde odak kaybı ApplicationInactive; Hidden/Suspended mobil/macOS durumları
+        hidden_states = (
+            Qt.ApplicationInactive,
+            Qt.ApplicationHidden,
+            Qt.ApplicationSuspended,
+        )
+        self.video_player.pause_background(
+            self.isMinimized() or QApplication.applicationState() in hidden_states
+        )
+
     def _set_app_icon(self):
         """Set application icon."""
         try:
             icon_path = Path(__file__).parent.parent.parent / "resources" / "icon.png"
-            if icon_path.exists():
-                icon = QIcon(str(icon_path))
+            if MainWindow._APP_ICON is None and icon_path.exists():
+                MainWindow._APP_ICON = QIcon(str(icon_path))
+            icon = MainWindow._APP_ICON
+            if icon is not None:
                 self.setWindowIcon(icon)
                 QApplication.instance().setWindowIcon(icon)
                 logger.debug(f"App icon set from: {icon_path}")
@@ -214,7 +612,7 @@ class MainWindow(QMainWindow):
         """FFmpeg'i Homebrew ile kur."""
         from app.media.ffmpeg_installer import install_ffmpeg_via_homebrew
 
-        self._show_progress_dialog(tr("ffmpeg_installing"), tr("btn_cancel"))
+        job = self._show_progress_dialog(tr("ffmpeg_installing"), tr("btn_cancel"))
 
         def do_work(progress_callback):
             success, message = install_ffmpeg_via_homebrew(
@@ -223,7 +621,7 @@ class MainWindow(QMainWindow):
             return success, message
 
         def on_complete(result):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             success, message = result
 
             if success:
@@ -241,55 +639,71 @@ class MainWindow(QMainWindow):
                 )
 
         def on_error(error):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             QMessageBox.critical(self, tr("dialog_error"), str(error))
 
         worker = Worker(do_work)
-        worker.signals.progress.connect(self._update_progress, Qt.QueuedConnection)
+        self._connect_progress(worker, job)
         worker.signals.result.connect(on_complete, Qt.QueuedConnection)
         worker.signals.error.connect(on_error, Qt.QueuedConnection)
         self._start_worker(worker)
 
-    @Slot(int, str)
-    def _update_progress(self, value: int, message: str):
+    def _connect_progress(self, worker: Worker, job: _ProgressJob):
+        """Worker ilerlemesini, hangi işe ait olduğuyla birlikte UI thread'ine aktar."""
+        worker.signals.progress.connect(
+            lambda value, message: self.progress_update.emit(job, value, message)
+        )
+
+    @Slot(object, int, str)
+    def _update_progress(self, job: _ProgressJob, value: int, message: str):
         """Thread-safe progress update slot."""
-        # Check flag first to avoid race conditions with deleted dialogs
-        if not self._progress_active:
+        job.value = value
+        if message:
+            job.message = message
+        # Kapanan / iptal edilen ya da arkada kalan işin güncellemesi bar'a yansımaz
+        if not self._progress_jobs or self._progress_jobs[-1] is not job:
             return
-        try:
-            dialog = self._progress_dialog
-            if dialog is not None and not dialog.wasCanceled():
-                dialog.setValue(value)
-                if message:
-                    dialog.setLabelText(message)
-        except (RuntimeError, AttributeError):
-            # Dialog was deleted or in invalid state
-            self._progress_active = False
-            self._progress_dialog = None
-
-    def _show_progress_dialog(self, title: str, cancel_text: str):
-        """Create and show a progress dialog safely."""
-        self._close_progress_dialog()  # Close any existing dialog first
-        self._progress_dialog = QProgressDialog(title, cancel_text, 0, 100, self)
-        self._progress_dialog.setWindowModality(Qt.ApplicationModal)
-        self._progress_dialog.setMinimumDuration(0)
-        self._progress_dialog.setAutoClose(False)
-        self._progress_dialog.setAutoReset(False)
-        self._progress_active = True
-        self._progress_dialog.show()
-        QApplication.processEvents()  # Ensure dialog is visible
-
-    def _close_progress_dialog(self):
-        """Close progress dialog safely."""
-        self._progress_active = False  # Set flag first to block any queued signals
-        dialog = self._progress_dialog
-        self._progress_dialog = None
-        if dialog is not None:
-            try:
-                dialog.close()
-                dialog.deleteLater()
-            except (RuntimeError, AttributeError):
-                pass  # Dialog already deleted
+        self.statusbar_progress.setValue(value)
+        if message:
+            self.statusbar.showMessage(message)
+
+    def _show_progress_dialog(self, title: str, cancel_text: str) -> _ProgressJob:
+        """Yeni bir iş için status bar'daki progress bar ve Cancel butonunu göster."""
+        job = _ProgressJob(title)
+        self._progress_jobs.append(job)
+        self.statusbar_cancel.setText(cancel_text)
+        self._show_progress_job(job)
+        return job
+
+    def _show_progress_job(self, job: _ProgressJob):
+        """Status bar'ı verilen işin son durumuyla doldur."""
+        self.statusbar_progress.setRange(0, 100)
+        self.statusbar_progress.setValue(job.value)
+        self.statusbar_cancel.setEnabled(True)
+        self.statusbar.showMessage(job.message or job.title)
+        self.statusbar_progress.show()
+        self.statusbar_cancel.show()
+
+    def _close_progress_dialog(self, job: _ProgressJob):
+        """İşi status bar'dan düşür; hâlâ çalışan iş varsa onu göster."""
+        if job not in self._progress_jobs:
+            return  # İptal edilmiş ya da zaten kapatılmış
+        self._progress_jobs.remove(job)
+        if self._progress_jobs:
+            self._show_progress_job(self._progress_jobs[-1])
+        else:
+            self.statusbar_progress.hide()
+            self.statusbar_cancel.hide()
+
+    def _cancel_progress(self):
+        """Cancel: gösterilen işe iptal isteği bırak, onu status bar'dan düşür."""
+        if not self._progress_jobs:
+            return
+        job = self._progress_jobs[-1]
+        job.cancelled = True
+        self._close_progress_dialog(job)
+        if not self._progress_jobs:
+            self.statusbar.showMessage(tr("status_ready"))
 
     def _setup_ui(self):
         """UI bileşenlerini oluştur."""
@@ -341,10 +755,12 @@ class MainWindow(QMainWindow):
         # Logo/Title
         title_label = QLabel("🎬 AutoCut")
         title_label.setObjectName("appTitle")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        if MainWindow._TITLE_FONT is None:
+            title_font = QFont()
+            title_font.setPointSize(18)
+            title_font.setBold(True)
+            MainWindow._TITLE_FONT = title_font
+        title_label.setFont(MainWindow._TITLE_FONT)
         layout.addWidget(title_label)
 
         # Media info
@@ -420,6 +836,21 @@ class MainWindow(QMainWindow):
         self.vad_check = QCheckBox(tr("use_vad"))
         settings_layout.addRow(self.vad_check)
 
+        # Başlangıçta seçili preset'in değerlerini göster
+        self._on_preset_changed(self.preset_combo.currentIndex())
+
+        for spin in (
+            self.threshold_spin,
+            self.min_duration_spin,
+            self.pre_pad_spin,
+            self.post_pad_spin,
+            self.merge_gap_spin,
+            self.keep_short_spin,
+        ):
+            # start(int) overload'ı değeri interval sanmasın diye lambda
+            spin.valueChanged.connect(lambda _: self._param_debounce.start())
+        self.vad_check.toggled.connect(lambda _: self._param_debounce.start())
+
         layout.addWidget(settings_group)
 
         # Action buttons
@@ -535,10 +966,14 @@ class MainWindow(QMainWindow):
         cuts_layout = QVBoxLayout(cuts_widget)
         cuts_layout.setContentsMargins(0, 8, 0, 0)
 
-        self.cuts_list = QListWidget()
+        # Model/view: binlerce cut'ta yalnızca görünen satırlar çizilir
+        self._cuts_model = CutsModel(self._format_time, self)
+        self.cuts_list = QListView()
         self.cuts_list.setObjectName("cutsList")
-        self.cuts_list.itemClicked.connect(self._on_cut_list_clicked)
-        self.cuts_list.itemDoubleClicked.connect(self._on_cut_list_double_clicked)
+        self.cuts_list.setUniformItemSizes(True)
+        self.cuts_list.setModel(self._cuts_model)
+        self.cuts_list.clicked.connect(self._on_cut_list_clicked)
+        self.cuts_list.doubleClicked.connect(self._on_cut_list_double_clicked)
         cuts_layout.addWidget(self.cuts_list)
 
         self.cut_info_label = QLabel(tr("no_file_loaded"))
@@ -587,6 +1022,7 @@ class MainWindow(QMainWindow):
         stats_group = QGroupBox(tr("panel_statistics"))
         stats_group.setObjectName("statsGroup")
         stats_layout = QFormLayout(stats_group)
+        self._stats_group = stats_group
 
         self.original_duration_label = QLabel("—")
         stats_layout.addRow(tr("stats_original") + ":", self.original_duration_label)
@@ -607,18 +1043,21 @@ class MainWindow(QMainWindow):
         return panel
 
     def _populate_presets(self):
-        """Preset listesini doldur."""
-        self.preset_combo.clear()
-        preset_names = {
-            "Podcast": tr("preset_podcast"),
-            "Tutorial": tr("preset_tutorial"),
-            "Meeting": tr("preset_meeting"),
-            "Noisy Room": tr("preset_noisy"),
-            "Aggressive": tr("preset_aggressive"),
-        }
-        for preset in DEFAULT_PRESETS:
-            name = preset_names.get(preset.name, preset.name)
-            self.preset_combo.addItem(name, preset)
+        """Preset listesini doldur (seçim ve parametreler korunur)."""
+        preset_names = _preset_display_names(get_language())
+        current = max(self.preset_combo.currentIndex(), 0)
+
+        # clear/addItem currentIndexChanged yayar; _on_preset_changed kullanıcının
+        # parametrelerini preset değerleriyle ezmesin
+        self.preset_combo.blockSignals(True)
+        try:
+            self.preset_combo.clear()
+            for preset in DEFAULT_PRESETS:
+                name = preset_names.get(preset.name, preset.name)
+                self.preset_combo.addItem(name, preset)
+            self.preset_combo.setCurrentIndex(min(current, self.preset_combo.count() - 1))
+        finally:
+            self.preset_combo.blockSignals(False)
 
     def _setup_menu(self):
         """Menü bar oluştur."""
@@ -742,292 +1181,21 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.statusbar)
         self.statusbar.showMessage(tr("status_ready"))
 
-    def _apply_theme(self):
-        """Tema uygula - Siyah/Beyaz minimal tema."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a1a;
-            }
-
-            #leftPanel, #rightPanel {
-                background-color: #222222;
-                border: none;
-            }
-
-            #centerPanel {
-                background-color: #1a1a1a;
-            }
-
-            #appTitle {
-                color: #ffffff;
-                padding: 8px 0;
-            }
-
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #333333;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding: 12px 8px 8px 8px;
-                font-weight: 500;
-            }
-
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 6px;
-                color: #888888;
-            }
-
-            QLabel {
-                color: #ffffff;
-                background: transparent;
-            }
-
-            #mediaInfo, #cutInfo {
-                color: #888888;
-                font-size: 12px;
-                padding: 8px;
-                background-color: #2a2a2a;
-                border-radius: 6px;
-            }
-
-            QPushButton {
-                background-color: #333333;
-                color: #ffffff;
-                border: 1px solid #444444;
-                border-radius: 6px;
-                padding: 10px 16px;
-                font-weight: 500;
-            }
-
-            QPushButton:hover {
-                background-color: #444444;
-                border-color: #666666;
-            }
-
-            QPushButton:pressed {
-                background-color: #222222;
-            }
-
-            QPushButton:disabled {
-                background-color: #1a1a1a;
-                color: #555555;
-                border-color: #2a2a2a;
-            }
-
-            #primaryButton {
-                background-color: #ffffff;
-                color: #000000;
-                border-color: #ffffff;
-            }
-
-            #primaryButton:hover {
-                background-color: #e0e0e0;
-            }
-
-            #primaryButton:disabled {
-                background-color: #444444;
-                color: #888888;
-                border-color: #444444;
-            }
-
-            #playButton {
-                background-color: #ffffff;
-                color: #000000;
-                border-radius: 20px;
-                font-size: 16px;
-            }
-
-            #playButton:hover {
-                background-color: #e0e0e0;
-            }
-
-            #zoomButton {
-                padding: 4px 10px;
-                min-width: 28px;
-            }
-
-            QComboBox, QSpinBox, QDoubleSpinBox {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #444444;
-                border-radius: 6px;
-                padding: 8px 12px;
-            }
-
-            QComboBox:hover, QSpinBox:hover, QDoubleSpinBox:hover {
-                border-color: #666666;
-            }
-
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-
-            QComboBox QAbstractItemView {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                selection-background-color: #444444;
-            }
-
-            QListWidget {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #333333;
-                border-radius: 6px;
-            }
-
-            QListWidget::item {
-                padding: 8px;
-                border-radius: 4px;
-            }
-
-            QListWidget::item:selected {
-                background-color: #ffffff;
-                color: #000000;
-            }
-
-            QListWidget::item:hover:!selected {
-                background-color: #3a3a3a;
-            }
-
-            QCheckBox {
-                color: #ffffff;
-                spacing: 8px;
-            }
-
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #444444;
-                border-radius: 4px;
-                background-color: #2a2a2a;
-            }
-
-            QCheckBox::indicator:checked {
-                background-color: #ffffff;
-                border-color: #ffffff;
-            }
-
-            QTabWidget::pane {
-                border: 1px solid #333333;
-                border-radius: 6px;
-                background-color: #222222;
-            }
-
-            QTabBar::tab {
-                background-color: #2a2a2a;
-                color: #888888;
-                border: none;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-            }
-
-            QTabBar::tab:selected {
-                background-color: #222222;
-                color: #ffffff;
-                border-bottom: 2px solid #ffffff;
-            }
-
-            QSlider::groove:horizontal {
-                background: #333333;
-                height: 6px;
-                border-radius: 3px;
-            }
-
-            QSlider::handle:horizontal {
-                background: #ffffff;
-                width: 16px;
-                height: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-
-            QSlider::sub-page:horizontal {
-                background: #888888;
-                border-radius: 3px;
-            }
-
-            #timeLabel {
-                color: #ffffff;
-                font-family: "Menlo", "Consolas", "DejaVu Sans Mono";
-                font-size: 13px;
-                font-weight: bold;
-            }
-
-            #playbackControls {
-                background-color: #222222;
-                border-radius: 8px;
-                margin: 0 12px;
-            }
-
-            QMenuBar {
-                background-color: #222222;
-                color: #ffffff;
-                border-bottom: 1px solid #333333;
-            }
-
-            QMenuBar::item:selected {
-                background-color: #333333;
-            }
-
-            QMenu {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #333333;
-            }
-
-            QMenu::item:selected {
-                background-color: #444444;
-            }
+        # Arka plan işleri için gömülü progress (modal dialog yerine)
+        self.statusbar_progress = QProgressBar()
+        self.statusbar_progress.setMaximumWidth(200)
+        self.statusbar_progress.setTextVisible(True)
+        self.statusbar_progress.hide()
+        self.statusbar.addPermanentWidget(self.statusbar_progress)
 
-            QToolBar {
-                background-color: #222222;
-                border-bottom: 1px solid #333333;
-                padding: 4px;
-                spacing: 4px;
-            }
+        self.statusbar_cancel = QPushButton(tr("btn_cancel"))
+        self.statusbar_cancel.clicked.connect(self._cancel_progress)
+        self.statusbar_cancel.hide()
+        self.statusbar.addPermanentWidget(self.statusbar_cancel)
 
-            #statusBar {
-                background-color: #222222;
-                color: #888888;
-                border-top: 1px solid #333333;
-            }
-
-            QScrollBar:vertical {
-                background-color: #1a1a1a;
-                width: 10px;
-            }
-
-            QScrollBar::handle:vertical {
-                background-color: #444444;
-                border-radius: 5px;
-                min-height: 30px;
-            }
-
-            QScrollBar::handle:vertical:hover {
-                background-color: #666666;
-            }
-
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-
-            QProgressDialog {
-                background-color: #2a2a2a;
-            }
-
-            QMessageBox {
-                background-color: #2a2a2a;
-            }
-
-            QMessageBox QLabel {
-                color: #ffffff;
-            }
-        """)
+    def _apply_theme(self):
+        """Tema uygula - Siyah/Beyaz minimal tema."""
+        self.setStyleSheet(_DARK_QSS)
 
     def _update_ui_language(self):
         """UI dilini güncelle."""
@@ -1054,41 +1222,75 @@ class MainWindow(QMainWindow):
         self._load_media(Path(file_path))
 
     def _load_media(self, file_path: Path):
-        """Medya dosyasını yükle."""
+        """Medya dosyasını yükle (ffprobe arka planda çalışır)."""
         self.statusbar.showMessage(tr("progress_loading"))
 
-        try:
-            media_info = probe_media(file_path)
+        # Değişmemiş dosya: ffprobe'a gerek yok
+        cached = probe_cache.get(file_path)
+        if cached is not None:
+            self._pending_media = None
+            self._on_media_probed(file_path, cached)
+            return
 
-            self.project = Project(
-                name=file_path.stem,
-                created_at=datetime.now().isoformat(),
-                media_info=media_info,
+        # Üst üste import'larda yalnızca son seçilen dosya yüklenir
+        self._pending_media = file_path
+
+        def do_work(progress_callback):
+            media_info = probe_media(
+                file_path, probesize=PROBE_SIZE, analyzeduration=PROBE_ANALYZE_DURATION
             )
+            probe_cache.put(file_path, media_info)
+            return media_info
 
-            # Store video path for playback
-            self._video_path = file_path
+        def on_complete(media_info):
+            if self._pending_media != file_path:
+                logger.debug(f"Stale probe result ignored: {file_path}")
+                return
+            self._pending_media = None
+            self._on_media_probed(file_path, media_info)
 
-            # Load video into player
-            if self.video_player.load_video(file_path):
-                logger.info(f"Video loaded into player: {file_path}")
-            else:
-                logger.warning(f"Failed to load video into player: {file_path}")
+        def on_error(error):
+            if self._pending_media != file_path:
+                return
+            self._pending_media = None
+            QMessageBox.critical(self, tr("dialog_error"), tr("error_analysis_failed", str(error)))
+            self.statusbar.showMessage(tr("status_ready"))
+
+        worker = Worker(do_work)
+        worker.signals.result.connect(on_complete, Qt.QueuedConnection)
+        worker.signals.error.connect(on_error, Qt.QueuedConnection)
+        self._start_worker(worker)
 
-            # Set video path for timeline thumbnails
-            self.timeline.set_video(file_path)
+    def _on_media_probed(self, file_path: Path, media_info: MediaInfo):
+        """Probe bittiğinde (ana thread'de) projeyi kur ve yüklemeye devam et."""
+        self.project = Project(
+            name=file_path.stem,
+            created_at=datetime.now().isoformat(),
+            media_info=media_info,
+        )
+        self._dirty = False
+        # Liste modeli yeni projenin (boş) cuts listesine bağlanır
+        self._update_cuts_list()
 
-            self._update_media_info()
-            self.analyze_btn.setEnabled(True)
-            self.analyze_action.setEnabled(True)
+        # Store video path for playback
+        self._video_path = file_path
 
-            self._extract_and_analyze()
+        # Load video into player
+        if self.video_player.load_video(file_path):
+            logger.info(f"Video loaded into player: {file_path}")
+        else:
+            logger.warning(f"Failed to load video into player: {file_path}")
 
-            self.statusbar.showMessage(tr("status_loaded", file_path.name))
+        # Set video path for timeline thumbnails
+        self.timeline.set_video(file_path)
 
-        except FFmpegError as e:
-            QMessageBox.critical(self, tr("dialog_error"), tr("error_analysis_failed", str(e)))
-            self.statusbar.showMessage(tr("status_ready"))
+        self._update_media_info()
+        self.analyze_btn.setEnabled(True)
+        self.analyze_action.setEnabled(True)
+
+        self._extract_and_analyze()
+
+        self.statusbar.showMessage(tr("status_loaded", file_path.name))
 
     def _update_media_info(self):
         """Media info labelını güncelle."""
@@ -1113,16 +1315,28 @@ class MainWindow(QMainWindow):
             return
 
         media = self.project.media_info
+        # Analiz/transkript worker'ları WAV hazır olmadan başlarsa bunu bekler
+        audio_future: Future = Future()
+        self._audio_future = audio_future
 
-        self._show_progress_dialog(tr("progress_extracting"), tr("btn_cancel"))
+        job = self._show_progress_dialog(tr("progress_extracting"), tr("btn_cancel"))
 
         def do_work(progress_callback):
-            cache_dir = Settings.get_cache_dir()
-            audio_path = cache_dir / f"{media.file_path.stem}_audio.wav"
+            from app.media.waveform import WaveformGenerator
+
+            # Future her durumda çözülmeli; yoksa _wait_for_audio bekleyen kalır
+            try:
+                cache_dir = Settings.get_cache_dir()
+                audio_path = cache_dir / f"{media.file_path.stem}_audio.wav"
 
-            progress_callback(10, tr("progress_extracting"))
-            extract_audio(media.file_path, audio_path, sample_rate=48000, mono=True)
+                progress_callback(10, tr("progress_extracting"))
+                extract_audio(media.file_path, audio_path, sample_rate=48000, mono=True)
+            except Exception as e:
+                audio_future.set_exception(e)
+                raise
             media.audio_path = audio_path
+            # Waveform beklenmeden audio kullanıma açılır
+            audio_future.set_result(audio_path)
 
             progress_callback(50, tr("progress_generating_waveform"))
             generator = WaveformGenerator(samples_per_bucket=256, cache_dir=cache_dir)
@@ -1134,7 +1348,7 @@ class MainWindow(QMainWindow):
         def on_complete(waveform):
             try:
                 logger.info("on_complete (waveform): closing progress dialog")
-                self._close_progress_dialog()
+                self._close_progress_dialog(job)
 
                 logger.info("on_complete (waveform): setting waveform data")
                 self.waveform_data = waveform
@@ -1158,24 +1372,19 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, tr("dialog_error"), str(e))
 
         def on_error(error):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             logger.error(f"Worker error: {error}")
             QMessageBox.warning(self, tr("dialog_warning"), tr("error_analysis_failed", str(error)))
 
         worker = Worker(do_work)
-        worker.signals.progress.connect(self._update_progress, Qt.QueuedConnection)
+        self._connect_progress(worker, job)
         worker.signals.result.connect(on_complete, Qt.QueuedConnection)
         worker.signals.error.connect(on_error, Qt.QueuedConnection)
         self._start_worker(worker)
 
-    def run_analysis(self):
-        """Sessizlik analizi çalıştır."""
-        if not self.project or not self.project.media_info:
-            return
-
-        media = self.project.media_info
-
-        config = AnalysisConfig(
+    def _analysis_config_from_ui(self) -> AnalysisConfig:
+        """Sol paneldeki parametrelerden AnalysisConfig oluştur."""
+        return AnalysisConfig(
             silence_threshold_db=self.threshold_spin.value(),
             silence_min_duration_ms=self.min_duration_spin.value(),
             pre_pad_ms=self.pre_pad_spin.value(),
@@ -1184,12 +1393,57 @@ class MainWindow(QMainWindow):
             keep_short_pauses_ms=self.keep_short_spin.value(),
             use_vad=self.vad_check.isChecked(),
         )
+
+    def _on_params_settled(self):
+        """Parametre değişiklikleri duruldu - projeye bir kez yansıt."""
+        if not self.project:
+            return
+        config = self._analysis_config_from_ui()
+        if config == self.project.config:
+            return  # Değer geri alındı / aynı preset: kaydedilecek değişiklik yok
+        self.project.config = config
+        self._dirty = True
+
+    def _has_audio(self, media: MediaInfo) -> bool:
+        """WAV hazır mı ya da çıkarılıyor mu."""
+        if media.audio_path and media.audio_path.exists():
+            return True
+        future = self._audio_future
+        return future is not None and not (future.done() and future.exception())
+
+    def _wait_for_audio(self, media: MediaInfo, job: _ProgressJob) -> Path:
+        """Worker thread'inden çağrılır: çıkarılan WAV'ı (gerekirse bekleyerek) döndür."""
+        if media.audio_path and media.audio_path.exists():
+            return media.audio_path
+        future = self._audio_future
+        if future is None:
+            raise ValueError(tr("error_no_audio"))
+        # Kısa aralıklarla bekle: iptal edilen ya da yerine yeni medya yüklenen iş takılmasın
+        while True:
+            try:
+                return future.result(timeout=0.2)
+            except TimeoutError:  # concurrent.futures.TimeoutError (3.11+)
+                if job.cancelled:
+                    raise RuntimeError(tr("error_cancelled")) from None
+                if self._audio_future is not future:
+                    raise ValueError(tr("error_no_audio")) from None
+
+    def run_analysis(self):
+        """Sessizlik analizi çalıştır."""
+        if not self.project or not self.project.media_info:
+            return
+
+        media = self.project.media_info
+
+        self._param_debounce.stop()  # Bekleyen parametre değişikliği burada zaten okunuyor
+        config = self._analysis_config_from_ui()
         self.project.config = config
 
-        self._show_progress_dialog(tr("progress_analyzing"), tr("btn_cancel"))
+        job = self._show_progress_dialog(tr("progress_analyzing"), tr("btn_cancel"))
 
         def do_work(progress_callback):
             from app.media.ffmpeg import FFmpegWrapper
+            from app.analysis.silence_detector import detect_silence, detect_silence_ffmpeg
 
             # FFmpeg silencedetect kullan (daha doğru, frame-accurate)
             try:
@@ -1204,10 +1458,8 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 # Fallback: numpy-based detection
                 logger.warning(f"FFmpeg silencedetect failed, falling back to numpy: {e}")
-                if not media.audio_path or not media.audio_path.exists():
-                    raise ValueError(tr("error_no_audio"))
                 return detect_silence(
-                    media.audio_path,
+                    self._wait_for_audio(media, job),
                     config,
                     lambda p: progress_callback(int(p * 100), tr("progress_analyzing")),
                 )
@@ -1217,7 +1469,7 @@ class MainWindow(QMainWindow):
             logger.info(f"on_complete callback called with {type(cuts)}")
             try:
                 logger.info(f"Cuts received: {cuts is not None}, count: {len(cuts) if cuts else 0}")
-                self._close_progress_dialog()
+                self._close_progress_dialog(job)
                 logger.info("Progress dialog closed")
 
                 logger.info(f"Analysis complete: {len(cuts)} silence regions found")
@@ -1230,6 +1482,7 @@ class MainWindow(QMainWindow):
 
                 logger.info("Setting project.cuts...")
                 self.project.cuts = cuts
+                self._dirty = True
                 logger.info("Updating cuts list UI...")
                 self._update_cuts_list()
                 logger.info("Updating stats...")
@@ -1256,12 +1509,12 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, tr("dialog_error"), tr("analysis_error", str(e)))
 
         def on_error(error):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             logger.error(f"Analysis error: {error}")
             QMessageBox.critical(self, tr("dialog_error"), tr("error_analysis_failed", str(error)))
 
         worker = Worker(do_work)
-        worker.signals.progress.connect(self._update_progress, Qt.QueuedConnection)
+        self._connect_progress(worker, job)
 
         # Use a wrapper that ensures callback runs on main thread
         def safe_on_complete(cuts):
@@ -1341,12 +1594,12 @@ class MainWindow(QMainWindow):
         stem = self.project.media_info.file_path.stem
 
         formats = [
-            (f"{stem}_edited.fcpxml", "FCPXML Files (*.fcpxml);;All Files (*)", export_fcpxml, "FCPXML"),
-            (f"{stem}_edited.xml", "XML Files (*.xml);;All Files (*)", export_premiere_xml, "Premiere XML"),
-            (f"{stem}_edited.edl", "EDL Files (*.edl);;All Files (*)", export_edl, "EDL"),
+            (f"{stem}_edited.fcpxml", "FCPXML Files (*.fcpxml);;All Files (*)", "FCPXML"),
+            (f"{stem}_edited.xml", "XML Files (*.xml);;All Files (*)", "Premiere XML"),
+            (f"{stem}_edited.edl", "EDL Files (*.edl);;All Files (*)", "EDL"),
         ]
 
-        default_name, filter_str, export_func, format_name = formats[format_id]
+        default_name, filter_str, format_name = formats[format_id]
 
         file_path, _ = QFileDialog.getSaveFileName(self, f"Export {format_name}", default_name, filter_str)
 
@@ -1354,6 +1607,7 @@ class MainWindow(QMainWindow):
             return
 
         try:
+            export_func = _get_export_fn(format_id)
             output_path = export_func(self.project, Path(file_path))
             QMessageBox.information(self, tr("export_success"), f"{format_name} exported to:\n{output_path}")
             self.statusbar.showMessage(tr("status_exported", output_path.name))
@@ -1392,6 +1646,7 @@ class MainWindow(QMainWindow):
 
         self.project.modified_at = datetime.now().isoformat()
         self.project.save(self._project_path)
+        self._dirty = False
         self.statusbar.showMessage(tr("status_saved", self._project_path.name))
 
     def save_project_as(self):
@@ -1414,26 +1669,9 @@ class MainWindow(QMainWindow):
 
     def _update_cuts_list(self):
         """Cuts listesini güncelle."""
-        logger.info("_update_cuts_list called")
-        self.cuts_list.clear()
-
-        if not self.project:
-            logger.info("No project, returning")
-            return
-
-        logger.info(f"Adding {len(self.project.cuts)} cuts to list")
-        for cut in self.project.cuts:
-            start = self._format_time(cut.start)
-            end = self._format_time(cut.end)
-            duration = self._format_time(cut.duration)
-
-            status = "✅" if cut.enabled else "⬜"
-            text = f"{status} {start} → {end} ({duration})"
-
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, cut.id)
-
-            self.cuts_list.addItem(item)
+        cuts = self.project.cuts if self.project else []
+        logger.info(f"_update_cuts_list: {len(cuts)} cuts")
+        self._cuts_model.set_cuts(cuts)
 
     def _update_stats(self):
         """İstatistikleri güncelle."""
@@ -1444,10 +1682,18 @@ class MainWindow(QMainWindow):
         cut_total = self.project.get_total_cut_duration()
         final = self.project.get_final_duration()
 
-        self.original_duration_label.setText(self._format_time(original))
-        self.cut_duration_label.setText(f"−{self._format_time(cut_total)}")
-        self.final_duration_label.setText(self._format_time(final))
-        self.cut_count_label.setText(str(len([c for c in self.project.cuts if c.enabled])))
+        enabled_count = sum(1 for c in self.project.cuts if c.enabled)
+
+        # Dört label tek seferde yeniden çizilsin (label başına ayrı layout/paint yok)
+        self._stats_group.setUpdatesEnabled(False)
+        try:
+            self.original_duration_label.setText(self._format_time(original))
+            self.cut_duration_label.setText(f"−{self._format_time(cut_total)}")
+            self.final_duration_label.setText(self._format_time(final))
+            self.cut_count_label.setText(str(enabled_count))
+        finally:
+            self._stats_group.setUpdatesEnabled(True)
+        self._stats_group.update()
 
     def _format_time(self, seconds: float) -> str:
         """Saniyeyi HH:MM:SS.mmm formatına dönüştür."""
@@ -1465,32 +1711,50 @@ class MainWindow(QMainWindow):
         preset = self.preset_combo.itemData(index)
         if preset:
             config = preset.config
-            self.threshold_spin.setValue(config.silence_threshold_db)
-            self.min_duration_spin.setValue(config.silence_min_duration_ms)
-            self.pre_pad_spin.setValue(config.pre_pad_ms)
-            self.post_pad_spin.setValue(config.post_pad_ms)
-            self.merge_gap_spin.setValue(config.merge_gap_ms)
-            self.vad_check.setChecked(config.use_vad)
+            # Widget'lar koddan doldurulur: her setValue debounce'u tetiklemesin
+            widgets = (
+                self.threshold_spin,
+                self.min_duration_spin,
+                self.pre_pad_spin,
+                self.post_pad_spin,
+                self.merge_gap_spin,
+                self.vad_check,
+            )
+            for widget in widgets:
+                widget.blockSignals(True)
+            try:
+                self.threshold_spin.setValue(config.silence_threshold_db)
+                self.min_duration_spin.setValue(config.silence_min_duration_ms)
+                self.pre_pad_spin.setValue(config.pre_pad_ms)
+                self.post_pad_spin.setValue(config.post_pad_ms)
+                self.merge_gap_spin.setValue(config.merge_gap_ms)
+                self.vad_check.setChecked(config.use_vad)
+            finally:
+                for widget in widgets:
+                    widget.blockSignals(False)
+            # Projeye tek seferde yansıt; gerçekten değiştiyse dirty olur
+            self._param_debounce.start()
 
     def _on_cut_selected(self, cut_id: str):
         """Timeline'da cut seçildi."""
-        for i in range(self.cuts_list.count()):
-            item = self.cuts_list.item(i)
-            if item.data(Qt.UserRole) == cut_id:
-                self.cuts_list.setCurrentItem(item)
-                break
+        row = self._cuts_model.row_of(cut_id)
+        if row >= 0:
+            index = self._cuts_model.index(row)
+            self.cuts_list.setCurrentIndex(index)
+            self.cuts_list.scrollTo(index)
 
     def _on_cut_toggled(self, cut_id: str, enabled: bool):
         """Cut enable/disable."""
         if not self.project:
             return
 
-        for cut in self.project.cuts:
-            if cut.id == cut_id:
-                cut.enabled = enabled
-                break
+        row = self._cuts_model.row_of(cut_id)
+        cut = self._cuts_model.cut_at(self._cuts_model.index(row))
+        if cut is not None:
+            cut.enabled = enabled
+            self._cuts_model.refresh_row(row)
+            self._dirty = True
 
-        self._update_cuts_list()
         self._update_stats()
 
     def _on_playhead_moved(self, time_sec: float):
@@ -1505,9 +1769,19 @@ class MainWindow(QMainWindow):
             self._updating_position = False
 
     def _on_video_position_changed(self, time_sec: float):
-        """Video pozisyonu değişti - timeline'ı güncelle."""
+        """Video pozisyonu değişti - timeline güncellemesini biriktir."""
         if self._updating_position:
             return
+        self._pending_position = time_sec
+        if not self._position_timer.isActive():
+            self._position_timer.start()
+
+    def _flush_position(self):
+        """Biriken son video pozisyonunu timeline'a uygula."""
+        time_sec = self._pending_position
+        self._pending_position = None
+        if time_sec is None:
+            return
         self._updating_position = True
         try:
             self.timeline.set_playhead(time_sec)
@@ -1515,62 +1789,54 @@ class MainWindow(QMainWindow):
             self._updating_position = False
 
 
-    def _on_cut_list_clicked(self, item: QListWidgetItem):
+    def _on_cut_list_clicked(self, index: QModelIndex):
         """Cuts listesinde tıklama."""
-        cut_id = item.data(Qt.UserRole)
-        if not self.project:
+        cut = self._cuts_model.cut_at(index)
+        if not self.project or cut is None:
             return
 
-        for cut in self.project.cuts:
-            if cut.id == cut_id:
-                self.cut_info_label.setText(
-                    f"⏱ Start: {self._format_time(cut.start)}\n"
-                    f"⏱ End: {self._format_time(cut.end)}\n"
-                    f"📊 Avg dB: {cut.source_avg_db:.1f}\n"
-                    f"{'✅ Enabled' if cut.enabled else '⬜ Disabled'}"
-                )
-                break
+        self.cut_info_label.setText(
+            f"⏱ Start: {self._format_time(cut.start)}\n"
+            f"⏱ End: {self._format_time(cut.end)}\n"
+            f"📊 Avg dB: {cut.source_avg_db:.1f}\n"
+            f"{'✅ Enabled' if cut.enabled else '⬜ Disabled'}"
+        )
 
-    def _on_cut_list_double_clicked(self, item: QListWidgetItem):
+    def _on_cut_list_double_clicked(self, index: QModelIndex):
         """Cuts listesinde çift tıklama."""
-        cut_id = item.data(Qt.UserRole)
-        if not self.project:
+        cut = self._cuts_model.cut_at(index)
+        if not self.project or cut is None:
             return
 
-        for cut in self.project.cuts:
-            if cut.id == cut_id:
-                self.timeline.set_playhead(cut.start)
-                self.timeline.zoom_to_range(cut.start - 1, cut.end + 1)
-                break
+        self.timeline.set_playhead(cut.start)
+        self.timeline.zoom_to_range(cut.start - 1, cut.end + 1)
 
     def _toggle_selected_cut(self):
         """Seçili cut'ı toggle et."""
-        item = self.cuts_list.currentItem()
-        if not item or not self.project:
+        index = self.cuts_list.currentIndex()
+        cut = self._cuts_model.cut_at(index)
+        if cut is None or not self.project:
             return
 
-        cut_id = item.data(Qt.UserRole)
-        for cut in self.project.cuts:
-            if cut.id == cut_id:
-                cut.enabled = not cut.enabled
-                break
+        cut.enabled = not cut.enabled
+        self._dirty = True
 
-        self._update_cuts_list()
+        self._cuts_model.refresh_row(index.row())
         self._update_stats()
-        self.timeline.update()
+        self.timeline.update_cut(cut.id)
 
     def _delete_selected_cut(self):
         """Seçili cut'ı sil."""
-        item = self.cuts_list.currentItem()
-        if not item or not self.project:
+        index = self.cuts_list.currentIndex()
+        cut = self._cuts_model.cut_at(index)
+        if cut is None or not self.project:
             return
 
-        cut_id = item.data(Qt.UserRole)
-        self.project.cuts = [c for c in self.project.cuts if c.id != cut_id]
-
-        self._update_cuts_list()
+        # Model project.cuts'ı doğrudan tutar; satır yerinde silinir
+        self._cuts_model.remove_row(index.row())
+        self._dirty = True
         self._update_stats()
-        self.timeline.set_cuts(self.project.cuts)
+        self.timeline.remove_cut(cut.id)
 
 
 
@@ -1581,7 +1847,7 @@ class MainWindow(QMainWindow):
             return
 
         media = self.project.media_info
-        if not media.audio_path or not media.audio_path.exists():
+        if not self._has_audio(media):
             QMessageBox.warning(self, tr("dialog_warning"), tr("error_no_audio"))
             return
 
@@ -1597,22 +1863,23 @@ class MainWindow(QMainWindow):
 
     def _run_gemini_transcription(self, media):
         """Gemini ile transkripsiyon."""
-        self._show_progress_dialog(tr("progress_transcribing"), tr("btn_cancel"))
+        job = self._show_progress_dialog(tr("progress_transcribing"), tr("btn_cancel"))
 
         def do_work(progress_callback):
             from app.transcript.transcriber import transcribe_with_gemini
 
             progress_callback(5, tr("gemini_connecting"))
             return transcribe_with_gemini(
-                media.audio_path,
+                self._wait_for_audio(media, job),
                 api_key=self.settings.gemini_api_key,
                 model=self.settings.gemini_model,
                 progress_callback=lambda p, msg: progress_callback(int(p), msg),
             )
 
         def on_complete(segments):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             self.project.transcript_segments = segments
+            self._dirty = True
             self.transcript_list.clear()
             for seg in segments:
                 self.transcript_list.addItem(f"[{self._format_time(seg.start)}] {seg.text}")
@@ -1620,11 +1887,11 @@ class MainWindow(QMainWindow):
             self.statusbar.showMessage(tr("gemini_transcribed", len(segments)))
 
         def on_error(error):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             QMessageBox.critical(self, tr("dialog_error"), tr("gemini_error", str(error)))
 
         worker = Worker(do_work)
-        worker.signals.progress.connect(self._update_progress, Qt.QueuedConnection)
+        self._connect_progress(worker, job)
         worker.signals.result.connect(on_complete, Qt.QueuedConnection)
         worker.signals.error.connect(on_error, Qt.QueuedConnection)
         self._start_worker(worker)
@@ -1638,8 +1905,9 @@ class MainWindow(QMainWindow):
 
         layout = QVBoxLayout(dialog)
 
-        # Check which models are downloaded
-        from app.transcript.transcriber import is_model_downloaded
+        # Check which models are downloaded (tek cache taraması)
+        from app.transcript.transcriber import get_downloaded_models
+        downloaded = set(get_downloaded_models())
 
         # Model seçimi
         model_group = QGroupBox(tr("transcription_model_select"))
@@ -1656,18 +1924,18 @@ class MainWindow(QMainWindow):
 
         default_index = 1  # Default: base
         for i, (model_id, name, desc) in enumerate(models):
-            is_downloaded = is_model_downloaded(model_id)
+            is_downloaded = model_id in downloaded
             status = "✅" if is_downloaded else "⬇️"
             model_combo.addItem(f"{status} {name} - {desc}", model_id)
             # Select first downloaded model as default if base is not downloaded
-            if is_downloaded and not is_model_downloaded("base") and default_index == 1:
+            if is_downloaded and "base" not in downloaded and default_index == 1:
                 default_index = i
 
         model_combo.setCurrentIndex(default_index)
         model_layout.addWidget(model_combo)
 
         # Download status info
-        downloaded_count = sum(1 for m, _, _ in models if is_model_downloaded(m))
+        downloaded_count = sum(1 for m, _, _ in models if m in downloaded)
         status_label = QLabel(f"✅ = {tr('transcription_downloaded')} ({downloaded_count}/5)  |  ⬇️ = {tr('transcription_will_download')}")
         status_label.setStyleSheet("color: #888; font-size: 10px; padding: 4px;")
         model_layout.addWidget(status_label)
@@ -1691,7 +1959,7 @@ class MainWindow(QMainWindow):
 
         selected_model = model_combo.currentData()
 
-        self._show_progress_dialog(tr("progress_transcribing"), tr("btn_cancel"))
+        job = self._show_progress_dialog(tr("progress_transcribing"), tr("btn_cancel"))
 
         def do_work(progress_callback):
             from app.transcript.transcriber import transcribe_audio, TranscriptConfig, ModelSize
@@ -1719,14 +1987,15 @@ class MainWindow(QMainWindow):
 
             progress_callback(5, tr("model_loading", model_size.value))
             return transcribe_audio(
-                media.audio_path,
+                self._wait_for_audio(media, job),
                 config,
                 lambda p, msg: progress_callback(int(p), msg),
             )
 
         def on_complete(segments):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             self.project.transcript_segments = segments
+            self._dirty = True
             self.transcript_list.clear()
             for seg in segments:
                 self.transcript_list.addItem(f"[{self._format_time(seg.start)}] {seg.text}")
@@ -1734,11 +2003,11 @@ class MainWindow(QMainWindow):
             self.statusbar.showMessage(f"Transcribed {len(segments)} segments")
 
         def on_error(error):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             QMessageBox.critical(self, tr("dialog_error"), str(error))
 
         worker = Worker(do_work)
-        worker.signals.progress.connect(self._update_progress, Qt.QueuedConnection)
+        self._connect_progress(worker, job)
         worker.signals.result.connect(on_complete, Qt.QueuedConnection)
         worker.signals.error.connect(on_error, Qt.QueuedConnection)
         self._start_worker(worker)
@@ -1850,11 +2119,10 @@ class MainWindow(QMainWindow):
         if len(segments) > 10:
             logger.info(f"  ... and {len(segments) - 10} more segments")
 
-        self._show_progress_dialog(tr("render_progress"), tr("btn_cancel"))
+        job = self._show_progress_dialog(tr("render_progress"), tr("btn_cancel"))
 
         def do_work(progress_callback):
             from app.media.ffmpeg import FFmpegWrapper
-            import subprocess
 
             ffmpeg = FFmpegWrapper()
 
@@ -1873,73 +2141,60 @@ class MainWindow(QMainWindow):
                 logger.info(f"Deleting existing output: {output_path}")
                 output_path.unlink()
 
-            progress_callback(10, tr("render_merging"))
+            if self.settings.render_stream_copy:
+                # Hızlı yol: decode/encode yok, segmentler keyframe'den kopyalanır
+                progress_callback(10, tr("render_cutting"))
+                result = ffmpeg.cut_segments_copy(
+                    media.file_path,
+                    segments,
+                    output_path,
+                    lambda p: progress_callback(10 + int(p * 85), tr("render_cutting")),
+                    should_cancel=lambda: job.cancelled,
+                )
+                if result is None:
+                    logger.info("Render cancelled by user")
+                    return None
+                progress_callback(100, tr("render_complete"))
+                return result
 
-            # Build FFmpeg filter_complex for selecting and concatenating segments
-            # This does everything in one pass - more reliable than many temp files
-
-            # For many segments, use trim filter approach
-            filter_parts = []
-            concat_inputs = []
-
-            for i, (start, end) in enumerate(segments):
-                # Trim video and audio for each segment
-                filter_parts.append(f"[0:v]trim=start={start}:end={end},setpts=PTS-STARTPTS[v{i}]")
-                filter_parts.append(f"[0:a]atrim=start={start}:end={end},asetpts=PTS-STARTPTS[a{i}]")
-                concat_inputs.append(f"[v{i}][a{i}]")
-
-            # Concat all segments
-            filter_complex = ";".join(filter_parts)
-            filter_complex += f";{''.join(concat_inputs)}concat=n={len(segments)}:v=1:a=1[outv][outa]"
-
-            logger.info(f"Filter has {len(segments)} segments")
-
-            # Build FFmpeg command
-            cmd = [
-                ffmpeg.ffmpeg_path,
-                "-y",
-                "-i", str(media.file_path),
-                "-filter_complex", filter_complex,
-                "-map", "[outv]",
-                "-map", "[outa]",
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-crf", "18",
-                "-c:a", "aac",
-                "-b:a", "192k",
-                str(output_path)
-            ]
-
-            logger.info(f"Running FFmpeg with filter_complex (re-encoding)...")
-
-            # Run with progress updates
-            process = subprocess.Popen(
-                cmd,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
+            progress_callback(10, tr("render_merging"))
 
-            # Monitor progress
-            while True:
-                line = process.stderr.readline()
-                if not line and process.poll() is not None:
-                    break
-                if "time=" in line:
-                    # Extract time from FFmpeg output
-                    try:
-                        time_str = line.split("time=")[1].split()[0]
-                        parts = time_str.split(":")
-                        current_time = float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-                        progress = min(95, 10 + int((current_time / total_segment_duration) * 85))
-                        progress_callback(progress, f"{current_time:.0f}s / {total_segment_duration:.0f}s")
-                    except:
-                        pass
+            def on_progress(fraction: float) -> None:
+                current_time = fraction * total_segment_duration
+                progress_callback(
+                    min(95, 10 + int(fraction * 85)),
+                    f"{current_time:.0f}s / {total_segment_duration:.0f}s",
+                )
 
-            return_code = process.wait()
+            def render(encoder: str) -> Optional[Path]:
+                # Zaman çizelgesi parçalara bölünüp paralel encode edilir
+                return ffmpeg.render_segments(
+                    media.file_path,
+                    segments,
+                    output_path,
+                    encoder,
+                    on_progress,
+                    should_cancel=lambda: job.cancelled,
+                )
 
-            if return_code != 0:
-                logger.error(f"FFmpeg error (code {return_code})")
-                raise RuntimeError(f"FFmpeg encoding failed")
+            # Donanım encoder'ı (NVENC/QSV/VideoToolbox) varsa encode GPU'da yapılır
+            encoder = ffmpeg.video_encoder()
+            logger.info(f"Running FFmpeg with filter_complex (re-encoding, {encoder})...")
+            try:
+                result = render(encoder)
+            except FFmpegError as e:
+                if encoder == "libx264":
+                    raise RuntimeError(f"FFmpeg encoding failed: {e}") from e
+                # Encoder listede olsa da donanım yok/desteklenmiyor olabilir
+                logger.warning(f"{encoder} render failed, falling back to libx264: {e}")
+                try:
+                    result = render("libx264")
+                except FFmpegError as e2:
+                    raise RuntimeError(f"FFmpeg encoding failed: {e2}") from e2
+
+            if result is None:
+                logger.info("Render cancelled by user")
+                return None
 
             # Verify output
             if output_path.exists():
@@ -1952,7 +2207,9 @@ class MainWindow(QMainWindow):
             return output_path
 
         def on_complete(result_path):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
+            if result_path is None:  # Kullanıcı iptal etti
+                return
 
             # Calculate saved time
             total_cut = sum(c.duration for c in enabled_cuts)
@@ -1966,21 +2223,24 @@ class MainWindow(QMainWindow):
             self.statusbar.showMessage(tr("status_saved", result_path.name))
 
         def on_error(error):
-            self._close_progress_dialog()
+            self._close_progress_dialog(job)
             QMessageBox.critical(self, tr("dialog_error"), tr("render_error", error))
 
         worker = Worker(do_work)
-        worker.signals.progress.connect(self._update_progress, Qt.QueuedConnection)
+        self._connect_progress(worker, job)
         worker.signals.result.connect(on_complete, Qt.QueuedConnection)
         worker.signals.error.connect(on_error, Qt.QueuedConnection)
         self._start_worker(worker)
 
     def _autosave(self):
-        """Otomatik kaydet."""
+        """Otomatik kaydet (değişiklik yoksa diske dokunmaz)."""
+        if not self._dirty:
+            return
         if self.project and self._project_path:
             try:
                 self.project.modified_at = datetime.now().isoformat()
                 self.project.save(self._project_path)
+                self._dirty = False
             except Exception as e:
                 logger.warning(f"Autosave failed: {e}")
 
@@ -343,6 +343,14 @@ class SettingsDialog(QDialog):
         export_layout.addRow(tr("settings_default_export") + ":", self.default_export_combo)
 
         layout.addWidget(export_group)
+
+        render_group = QGroupBox(tr("settings_render_group"))
+        render_layout = QFormLayout(render_group)
+
+        self.render_stream_copy_check = QCheckBox(tr("settings_render_stream_copy"))
+        render_layout.addRow(self.render_stream_copy_check)
+
+        layout.addWidget(render_group)
         layout.addStretch()
         return widget
 
@@ -413,6 +421,7 @@ class SettingsDialog(QDialog):
         export_index = self.default_export_combo.findData(self.settings.default_export_format)
         if export_index >= 0:
             self.default_export_combo.setCurrentIndex(export_index)
+        self.render_stream_copy_check.setChecked(self.settings.render_stream_copy)
 
         self._update_model_info()
 
@@ -457,6 +466,7 @@ class SettingsDialog(QDialog):
 
         # Export
         self.settings.default_export_format = self.default_export_combo.currentData()
+        self.settings.render_stream_copy = self.render_stream_copy_check.isChecked()
 
         # Gemini
         self.settings.gemini_enabled = self.gemini_enabled_check.isChecked()
@@ -11,7 +11,7 @@ Final Cut Pro / Adobe Premiere style timeline:
 
 from __future__ import annotations
 
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from pathlib import Path
 import logging
 import cv2
@@ -37,11 +37,14 @@ from PySide6.QtGui import (
     QLinearGradient,
     QFont,
     QPixmap,
+    QPixmapCache,
     QImage,
 )
 
 from app.core.models import Cut, CutType
-from app.media.waveform import WaveformData
+
+if TYPE_CHECKING:
+    from app.media.waveform import WaveformData
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +67,10 @@ VIDEO_TRACK_HEIGHT = 60
 AUDIO_TRACK_HEIGHT = 80
 TOTAL_HEIGHT = RULER_HEIGHT + VIDEO_TRACK_HEIGHT + AUDIO_TRACK_HEIGHT
 
+# Waveform, bu genişlikte pixmap tile'ları olarak QPixmapCache'te tutulur
+WAVEFORM_TILE_WIDTH = 512
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+
 
 class VideoThumbnailItem(QGraphicsItem):
     """Video thumbnails track."""
@@ -202,16 +209,21 @@ class VideoThumbnailItem(QGraphicsItem):
 class WaveformItem(QGraphicsItem):
     """Audio waveform track - Final Cut Pro style."""
 
+    _generation = 0  # Her yeni waveform verisi için artar (cache anahtarı)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.waveform_data: Optional[WaveformData] = None
         self.pixels_per_second: float = 100.0
         self.height: float = AUDIO_TRACK_HEIGHT
+        self._data_key: int = 0
 
     def set_waveform(self, data: WaveformData):
         """Set waveform data."""
         logger.info(f"WaveformItem.set_waveform called, duration={data.duration if data else 'None'}")
         self.waveform_data = data
+        WaveformItem._generation += 1
+        self._data_key = WaveformItem._generation
         if data:
             self.prepareGeometryChange()
             # Defer update to avoid immediate repaint issues
@@ -230,63 +242,42 @@ class WaveformItem(QGraphicsItem):
         width = self.waveform_data.duration * self.pixels_per_second
         return QRectF(0, 0, width, self.height)
 
-    def paint(self, painter: QPainter, option, widget):
-        rect = self.boundingRect()
+    def _tile(self, index: int, width: int, dpr: float) -> QPixmap:
+        """[index * TILE, (index + 1) * TILE) aralığının waveform pixmap'i (cache'li)."""
+        key = f"wf_{self._data_key}_{self.pixels_per_second:.4f}_{dpr:g}_{index}"
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            return cached
 
-        # Track background
-        painter.fillRect(rect, QBrush(COLOR_TRACK_BG))
+        tile_x0 = index * WAVEFORM_TILE_WIDTH
+        tile_w = min(WAVEFORM_TILE_WIDTH, width - tile_x0)
 
-        if not self.waveform_data:
-            return
+        pixmap = QPixmap(int(tile_w * dpr), int(self.height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
 
-        try:
-            painter.setRenderHint(QPainter.Antialiasing)
+        start_time = tile_x0 / self.pixels_per_second
+        end_time = (tile_x0 + tile_w) / self.pixels_per_second
+        min_peaks, max_peaks = self.waveform_data.get_peaks_for_range(
+            start_time, end_time, tile_w
+        )
 
-            width = int(rect.width())
-            if width <= 0:
-                return
+        if len(max_peaks):
             center_y = self.height / 2
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
 
-            # Calculate visible area
-            view = self.scene().views()[0] if self.scene() and self.scene().views() else None
-            if view:
-                visible_rect = view.mapToScene(view.viewport().rect()).boundingRect()
-                start_x = max(0, int(visible_rect.left()))
-                end_x = min(width, int(visible_rect.right()) + 1)
-            else:
-                start_x = 0
-                end_x = min(width, 2000)
-
-            # Get peak data
-            start_time = start_x / self.pixels_per_second
-            end_time = end_x / self.pixels_per_second
-            num_points = max(1, end_x - start_x)
-
-            if num_points <= 0:
-                return
-
-            min_peaks, max_peaks = self.waveform_data.get_peaks_for_range(
-                start_time, end_time, num_points
-            )
-
-            if len(max_peaks) == 0:
-                return
-
-            # Create waveform path
+            # Create waveform path (tile koordinatlarında)
             path = QPainterPath()
-            path.moveTo(start_x, center_y)
+            path.moveTo(0, center_y)
 
             # Upper half (max peaks)
             for i, peak in enumerate(max_peaks):
-                x = start_x + i
-                y = center_y - (peak * center_y * 0.85)
-                path.lineTo(x, y)
+                path.lineTo(i, center_y - (peak * center_y * 0.85))
 
             # Lower half (min peaks) - reversed
             for i in range(len(min_peaks) - 1, -1, -1):
-                x = start_x + i
-                y = center_y - (min_peaks[i] * center_y * 0.85)
-                path.lineTo(x, y)
+                path.lineTo(i, center_y - (min_peaks[i] * center_y * 0.85))
 
             path.closeSubpath()
 
@@ -301,6 +292,47 @@ class WaveformItem(QGraphicsItem):
             # Outline
             painter.setPen(QPen(COLOR_WAVEFORM, 0.5))
             painter.drawPath(path)
+            painter.end()
+
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def paint(self, painter: QPainter, option, widget):
+        rect = self.boundingRect()
+
+        # Track background
+        painter.fillRect(rect, QBrush(COLOR_TRACK_BG))
+
+        if not self.waveform_data:
+            return
+
+        try:
+            width = int(rect.width())
+            if width <= 0:
+                return
+            center_y = self.height / 2
+
+            # Calculate visible area
+            view = self.scene().views()[0] if self.scene() and self.scene().views() else None
+            if view:
+                visible_rect = view.mapToScene(view.viewport().rect()).boundingRect()
+                start_x = max(0, int(visible_rect.left()))
+                end_x = min(width, int(visible_rect.right()) + 1)
+            else:
+                start_x = 0
+                end_x = min(width, 2000)
+
+            if end_x <= start_x:
+                return
+
+            # Pan/zoom'da PCM tekrar örneklenmez; görünür tile'lar cache'ten çizilir
+            dpr = widget.devicePixelRatioF() if widget is not None else 1.0
+            first_tile = start_x // WAVEFORM_TILE_WIDTH
+            last_tile = (end_x - 1) // WAVEFORM_TILE_WIDTH
+            for index in range(first_tile, last_tile + 1):
+                painter.drawPixmap(
+                    QPointF(index * WAVEFORM_TILE_WIDTH, 0), self._tile(index, width, dpr)
+                )
 
             # Center line
             painter.setPen(QPen(QColor("#404040"), 1))
@@ -504,6 +536,10 @@ class TimelineWidget(QWidget):
         self._cut_items: dict[str, CutOverlayItem] = {}
         self._video_path: Optional[Path] = None
 
+        # Varsayılan 10 MB, birkaç zoom seviyesinin waveform tile'larına yetmez
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -608,6 +644,18 @@ class TimelineWidget(QWidget):
         self.view.viewport().update()
         logger.info(f"Timeline updated with {len(self._cut_items)} cut overlays")
 
+    def update_cut(self, cut_id: str):
+        """Tek cut overlay'ini cut'ın güncel haline göre yeniden çiz."""
+        item = self._cut_items.get(cut_id)
+        if item is not None:
+            item.update_from_cut()
+
+    def remove_cut(self, cut_id: str):
+        """Tek cut overlay'ini kaldır (self.cuts çağıran tarafından güncellenir)."""
+        item = self._cut_items.pop(cut_id, None)
+        if item is not None:
+            self.scene.removeItem(item)
+
     def set_playhead(self, time_sec: float, emit_signal: bool = False):
         """Set playhead position."""
         self.playhead_time = max(0, min(time_sec, self.duration)) if self.duration > 0 else 0
@@ -57,6 +57,9 @@ class VideoPlayer(QWidget):
         self._skip_cuts: bool = True
         self._slider_pressed: bool = False
         self._pending_seek: Optional[int] = None
+        # BGR->RGB dönüşümü için frame'ler arasında yeniden kullanılan buffer
+        self._rgb: Optional[np.ndarray] = None
+        self._suspended: bool = False  # Pencere görünmezken decode durduruldu mu
 
         # Timer for frame updates
         self._timer = QTimer(self)
@@ -191,10 +194,26 @@ class VideoPlayer(QWidget):
     def pause(self):
         """Pause playback."""
         self._is_playing = False
+        self._suspended = False
         self._timer.stop()
         self._play_btn.setText(tr("player_play"))
         self.playback_paused.emit()
 
+    def pause_background(self, suspend: bool):
+        """
+        Pencere görünmezken frame decode'unu durdur / geri başlat.
+
+        Oynatma durumu (is_playing) değişmez; görünür olunca kaldığı yerden devam eder.
+        """
+        if suspend:
+            if self._is_playing and self._timer.isActive():
+                self._timer.stop()
+                self._suspended = True
+        elif self._suspended:
+            self._suspended = False
+            if self._is_playing:
+                self._timer.start()  # Son interval ile
+
     def toggle_playback(self):
         """Toggle play/pause."""
         if self._is_playing:
@@ -263,14 +282,17 @@ class VideoPlayer(QWidget):
     def _display_frame(self, frame: np.ndarray):
         """Convert and display a frame."""
         try:
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Convert BGR to RGB into the persistent buffer (no per-frame allocation)
+            if self._rgb is None or self._rgb.shape != frame.shape:
+                self._rgb = np.empty(frame.shape, dtype=np.uint8)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
 
             h, w, ch = frame_rgb.shape
             bytes_per_line = ch * w
 
-            # Create QImage - make a copy to ensure data ownership
-            q_img = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
+            # QImage buffer'ı paylaşır; QPixmap.fromImage aşağıda veriyi kendisi kopyalar,
+            # buffer bir sonraki frame'e kadar değişmez
+            q_img = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
 
             # Scale to fit label while maintaining aspect ratio
             label_size = self._video_label.size()
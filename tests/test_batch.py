@@ -0,0 +1,30 @@
+"""Tests for parallel batch processing."""
+
+from pathlib import Path
+
+from app.media import batch
+
+
+def _name_length(path: Path) -> int:
+    """Worker process'te çalışan basit (pickle edilebilir) fn."""
+    return len(path.name)
+
+
+class TestBatchProcess:
+    """batch_process testleri."""
+
+    def test_runs_fn_in_pool(self):
+        """Her dosyanın sonucu kendi path'ine eşlenir, progress 1.0'da biter."""
+        paths = [Path("/a/clip.mp4"), Path("/b/clip.mp4"), Path("/c/long_name.mov")]
+        progress = []
+
+        results = batch.batch_process(
+            paths, _name_length, max_workers=2, progress_callback=progress.append
+        )
+
+        assert results == {path: len(path.name) for path in paths}
+        assert progress[-1] == 1.0
+
+    def test_empty(self):
+        """Boş listede pool açılmaz."""
+        assert batch.batch_process([], _name_length) == {}
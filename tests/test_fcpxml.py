@@ -7,6 +7,7 @@ from lxml import etree
 
 from app.core.models import MediaInfo, Project, Cut, CutType
 from app.export.fcpxml import (
+    PARALLEL_CLIP_THRESHOLD,
     FCPXMLBuilder,
     export_fcpxml,
     time_to_rational,
@@ -199,6 +200,23 @@ class TestFCPXMLBuilder:
         finally:
             output_path.unlink(missing_ok=True)
 
+    def test_build_many_segments_keeps_order(self, sample_project):
+        """Çok sayıda segmentte (paralel yol) clip sırası korunur."""
+        sample_project.media_info.duration = 2000.0
+        sample_project.cuts = [
+            Cut(start=i * 2.0 + 1.0, end=i * 2.0 + 1.5, cut_type=CutType.SILENCE)
+            for i in range(PARALLEL_CLIP_THRESHOLD + 100)
+        ]
+
+        builder = FCPXMLBuilder(project=sample_project, output_path=Path("unused.fcpxml"))
+        root = builder.build()
+
+        clips = root.find(".//spine").findall("asset-clip")
+        assert len(clips) == PARALLEL_CLIP_THRESHOLD + 101
+        assert [c.get("name") for c in clips[:3]] == ["Clip 1", "Clip 2", "Clip 3"]
+        assert clips[-1].get("name") == f"Clip {len(clips)}"
+        assert clips[1].get("start") == time_to_rational(1.5, 30.0)
+
     def test_save_valid_xml(self, sample_project):
         """Geçerli XML dosyası oluşturma."""
         with tempfile.NamedTemporaryFile(suffix=".fcpxml", delete=False) as f:
@@ -221,6 +239,26 @@ class TestFCPXMLBuilder:
         finally:
             output_path.unlink(missing_ok=True)
 
+    def test_to_bytes_matches_lxml(self, sample_project):
+        """Byte parçalarıyla üretilen çıktı lxml serileştirmesiyle birebir aynı."""
+        sample_project.media_info.fps = 29.97
+        sample_project.media_info.file_path = Path("/test/my & <video>.mp4")
+        sample_project.cuts = [
+            Cut(start=10.0, end=20.5, cut_type=CutType.SILENCE),
+            Cut(start=60.3, end=80.0, cut_type=CutType.SILENCE),
+        ]
+
+        builder = FCPXMLBuilder(project=sample_project, output_path=Path("unused.fcpxml"))
+        expected = etree.tostring(
+            builder.build(),
+            pretty_print=True,
+            xml_declaration=True,
+            encoding="UTF-8",
+            doctype="<!DOCTYPE fcpxml>",
+        )
+
+        assert builder.to_bytes() == expected
+
     def test_to_string(self, sample_project):
         """XML string çıktısı."""
         with tempfile.NamedTemporaryFile(suffix=".fcpxml", delete=False) as f:
@@ -284,3 +322,25 @@ class TestExportFunction:
             assert root.get("version") == "1.9"
         finally:
             output_path.unlink(missing_ok=True)
+
+    def test_export_with_validation(self):
+        """Doğrulamalı export aynı dosyayı yazar."""
+        project = Project(name="Validate Test")
+        project.media_info = MediaInfo(
+            file_path=Path("/test/video.mp4"),
+            duration=60.0,
+            fps=30.0,
+            width=1920,
+            height=1080,
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".fcpxml", delete=False) as f:
+            output_path = Path(f.name)
+
+        try:
+            export_fcpxml(project, output_path, validate=True)
+
+            root = etree.parse(str(output_path)).getroot()
+            assert len(root.findall(".//asset-clip")) == 1
+        finally:
+            output_path.unlink(missing_ok=True)
@@ -0,0 +1,155 @@
+"""Tests for ffmpeg render helpers."""
+
+import stat
+from pathlib import Path
+
+import pytest
+
+from app.media import ffmpeg
+from app.media.ffmpeg import (
+    RENDER_MIN_BATCH_SECONDS,
+    FFmpegWrapper,
+    split_segments,
+    trim_concat_filter,
+)
+
+# Argümanlarını satır satır loglayıp son argümanı (çıktı) oluşturan sahte ffmpeg.
+# Satır tek write ile eklenir; paralel çağrıların logları birbirine karışmaz
+_FAKE_FFMPEG = """#!/bin/sh
+sep=$(printf '\\037')
+line=
+for arg; do line="$line$arg$sep"; done
+printf '%s\\n' "$line" >> "$FAKE_FFMPEG_LOG"
+for last; do :; done
+touch "$last"
+"""
+
+
+def _total(segments):
+    return sum(end - start for start, end in segments)
+
+
+class TestSplitSegments:
+    """split_segments testleri."""
+
+    def test_short_timeline_single_batch(self):
+        """Kısa içerik bölünmez."""
+        segments = [(0.0, 5.0), (10.0, 20.0)]
+
+        assert split_segments(segments, 8) == [segments]
+
+    def test_balanced_and_ordered(self):
+        """Parçalar eşit süreli, birleşince orijinal içerik."""
+        segments = [(0.0, 50.0), (60.0, 200.0), (210.0, 215.0)]
+        batches = split_segments(segments, 4)
+
+        assert len(batches) == 4
+        for batch in batches:
+            assert _total(batch) == pytest.approx(_total(segments) / 4)
+
+        flat = [seg for batch in batches for seg in batch]
+        assert flat[0][0] == 0.0 and flat[-1][1] == 215.0
+        assert _total(flat) == pytest.approx(_total(segments))
+        for (_, prev_end), (start, _) in zip(flat, flat[1:], strict=False):
+            assert start >= prev_end
+
+    def test_single_long_segment_is_split(self):
+        """Tek uzun segment de parçalara dağıtılır."""
+        batches = split_segments([(0.0, 4 * RENDER_MIN_BATCH_SECONDS)], 4)
+
+        assert [len(batch) for batch in batches] == [1, 1, 1, 1]
+
+
+class TestTrimConcatFilter:
+    """trim_concat_filter testleri."""
+
+    def test_offset(self):
+        """Segment zamanları girişteki seek kadar kaydırılır."""
+        graph = trim_concat_filter([(10.0, 12.0), (15.0, 16.0)], offset=10.0)
+
+        assert "[0:v]trim=start=0.0:end=2.0" in graph
+        assert "[0:a]atrim=start=5.0:end=6.0" in graph
+        assert graph.endswith("[v0][a0][v1][a1]concat=n=2:v=1:a=1[outv][outa]")
+
+    def test_video_only(self):
+        """Video'suz/audio'suz grafik diğer akışa dokunmaz."""
+        graph = trim_concat_filter([(0.0, 1.0)], video=True, audio=False)
+
+        assert "atrim" not in graph
+        assert graph.endswith("[v0]concat=n=1:v=1:a=0[outv]")
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """Komutları log dosyasına yazan FFmpegWrapper."""
+    binary = tmp_path / "ffmpeg"
+    binary.write_text(_FAKE_FFMPEG)
+    binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("FAKE_FFMPEG_LOG", str(log))
+    monkeypatch.setattr(ffmpeg.os, "cpu_count", lambda: 4)
+
+    wrapper = FFmpegWrapper.__new__(FFmpegWrapper)
+    wrapper._ffmpeg = str(binary)
+
+    def calls() -> list[list[str]]:
+        return [line.split("\x1f")[:-1] for line in log.read_text().splitlines()]
+
+    return wrapper, calls
+
+
+@pytest.mark.parametrize(
+    ("banner", "expected"),
+    [
+        ("ffmpeg version 4.3.2 Copyright (c) 2000-2021", False),
+        ("ffmpeg version n4.4 Copyright (c) 2000-2021", True),
+        ("ffmpeg version 6.1.1 Copyright (c) 2000-2023", True),
+        ("ffmpeg version N-112233-gabcdef Copyright (c) 2000-2024", True),
+    ],
+)
+def test_stats_period_gated_on_version(tmp_path, banner, expected):
+    """-stats_period yalnızca 4.4+ (ve git build) ffmpeg'e verilir."""
+    binary = tmp_path / "ffmpeg"
+    binary.write_text(f"#!/bin/sh\necho '{banner}'\n")
+    binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+
+    assert ffmpeg._supports_stats_period(str(binary)) is expected
+
+
+class TestRenderSegments:
+    """render_segments komut yapısı."""
+
+    def test_parallel_audio_encoded_once(self, fake_ffmpeg, tmp_path):
+        """Video parçaları audio'suz; audio tüm zaman çizelgesi üzerinden bir kez."""
+        wrapper, calls = fake_ffmpeg
+        segments = [(0.0, 50.0), (60.0, 200.0), (210.0, 215.0)]
+        output = tmp_path / "out" / "edited.mp4"
+
+        assert wrapper.render_segments(Path("/in.mp4"), segments, output) == output
+
+        commands = calls()
+        encodes = [cmd for cmd in commands if "-filter_complex_script" in cmd]
+        video_parts = [cmd for cmd in encodes if "[outv]" in cmd]
+        audio_jobs = [cmd for cmd in encodes if "[outa]" in cmd]
+
+        assert len(video_parts) == 4
+        assert all("[outa]" not in cmd and "-c:a" not in cmd for cmd in video_parts)
+        assert len(audio_jobs) == 1
+        assert "-c:v" not in audio_jobs[0]
+        assert audio_jobs[0][audio_jobs[0].index("-ss") + 1] == "0.000000"
+
+        final = commands[-1]
+        assert final[final.index("-f") + 1] == "concat"
+        assert final[-1] == str(output)
+        assert ["-map", "0:v", "-map", "1:a"] == final[final.index("-map"):final.index("-c")]
+
+    def test_single_part_writes_output_directly(self, fake_ffmpeg, tmp_path):
+        """Kısa zaman çizelgesi tek process, audio ve video birlikte."""
+        wrapper, calls = fake_ffmpeg
+        output = tmp_path / "edited.mp4"
+
+        assert wrapper.render_segments(Path("/in.mp4"), [(0.0, 10.0)], output) == output
+
+        (command,) = calls()
+        assert "[outv]" in command and "[outa]" in command
+        assert command[-1] == str(output)
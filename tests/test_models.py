@@ -181,6 +181,18 @@ class TestTranscriptSegment:
         assert restored.start == segment.start
         assert restored.language == segment.language
 
+    def test_slotted_without_words(self):
+        """Slot'lu modeller instance dict taşımaz, boş words paylaşılır."""
+        word = TranscriptWord("Hi", 0.0, 0.4, 0.9)
+        first = TranscriptSegment(text="a")
+        second = TranscriptSegment(text="b")
+
+        assert not hasattr(word, "__dict__")
+        assert not hasattr(first, "__dict__")
+        assert first.words == () and first.words is second.words
+        assert first.word_count == 1
+        assert first.to_dict()["words"] == []
+
 
 class TestAnalysisConfig:
     """AnalysisConfig testleri."""
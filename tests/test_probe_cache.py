@@ -0,0 +1,79 @@
+"""Tests for the MediaInfo probe cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.models import MediaInfo
+from app.media import probe_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Cache'i geçici dizine yönlendir."""
+    directory = tmp_path / "probe"
+    directory.mkdir()
+    monkeypatch.setattr(probe_cache, "_cache_dir", lambda: directory)
+    return directory
+
+
+@pytest.fixture
+def media_file(tmp_path) -> Path:
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"\0" * 128)
+    return path
+
+
+def _info(path: Path) -> MediaInfo:
+    return MediaInfo(
+        file_path=path,
+        duration=12.5,
+        fps=29.97,
+        width=1920,
+        height=1080,
+        video_codec="h264",
+        audio_path=Path("/tmp/extracted.wav"),
+    )
+
+
+class TestProbeCache:
+    """probe_cache testleri."""
+
+    def test_roundtrip(self, cache_dir, media_file):
+        """Kaydedilen bilgi aynen geri okunur, runtime alanları hariç."""
+        probe_cache.put(media_file, _info(media_file))
+        cached = probe_cache.get(media_file)
+
+        assert cached is not None
+        assert cached.file_path == media_file
+        assert cached.duration == 12.5
+        assert cached.video_codec == "h264"
+        assert cached.audio_path is None
+
+    def test_miss(self, cache_dir, media_file):
+        """Kayıt yoksa None."""
+        assert probe_cache.get(media_file) is None
+
+    def test_invalidated_on_change(self, cache_dir, media_file):
+        """Dosya değişince cache geçersiz."""
+        probe_cache.put(media_file, _info(media_file))
+        media_file.write_bytes(b"\0" * 256)
+
+        assert probe_cache.get(media_file) is None
+
+    def test_invalidated_on_mtime(self, cache_dir, media_file):
+        """Aynı boyut, farklı mtime da geçersiz."""
+        probe_cache.put(media_file, _info(media_file))
+        stat = media_file.stat()
+        os.utime(media_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert probe_cache.get(media_file) is None
+
+    def test_corrupt_entry(self, cache_dir, media_file):
+        """Bozuk kayıt hata fırlatmaz."""
+        probe_cache.put(media_file, _info(media_file))
+        for entry in cache_dir.glob("*.json"):
+            entry.write_text("{not json")
+
+        assert probe_cache.get(media_file) is None
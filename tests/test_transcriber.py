@@ -0,0 +1,107 @@
+"""Tests for the faster-whisper decode setup and model cache checks."""
+
+import os
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.transcript.transcriber import (
+    Transcriber,
+    TranscriptConfig,
+    get_downloaded_models,
+    invalidate_model_cache,
+    is_model_downloaded,
+)
+
+
+class _StubTranscribe:
+    """transcribe() çağrısının kwargs'ını kaydeden sahte model/pipeline."""
+
+    def __init__(self, segments=(), duration: float = 0.0):
+        self.kwargs = None
+        self.segments = segments
+        self.duration = duration
+
+    def transcribe(self, audio, **kwargs):
+        self.kwargs = kwargs
+        info = SimpleNamespace(language="en", language_probability=1.0, duration=self.duration)
+        return iter(self.segments), info
+
+
+def _transcriber(batch_size: int, clips) -> tuple[Transcriber, _StubTranscribe]:
+    transcriber = Transcriber(TranscriptConfig(batch_size=batch_size, preload=False))
+    stub = _StubTranscribe()
+    transcriber._model = stub
+    transcriber._batched = stub if batch_size > 1 else None
+    transcriber._speech_clips = lambda audio: clips
+    return transcriber, stub
+
+
+class TestFasterWhisperClips:
+    """Ön VAD aralıklarının decoder'a aktarımı."""
+
+    def test_batched_uses_pipeline_vad(self):
+        """Batched pipeline'a clip_timestamps verilmez, VAD'i kendisi yapar."""
+        transcriber, stub = _transcriber(8, [(1.0, 2.5), (4.0, 40.0)])
+        transcriber._start_faster_whisper(np.zeros(16000, dtype=np.float32))
+
+        assert "clip_timestamps" not in stub.kwargs
+        assert stub.kwargs["vad_filter"] is True
+        assert stub.kwargs["batch_size"] == 8
+
+    def test_sequential_gets_flat_seconds(self):
+        """Sıralı decode'a düz saniye listesi verilir, VAD tekrar çalışmaz."""
+        transcriber, stub = _transcriber(1, [(1.0, 2.5), (4.0, 6.0)])
+        transcriber._start_faster_whisper(np.zeros(16000, dtype=np.float32))
+
+        assert stub.kwargs["clip_timestamps"] == [1.0, 2.5, 4.0, 6.0]
+        assert stub.kwargs["vad_filter"] is False
+
+
+class TestModelCache:
+    """İndirilmiş model kontrolü."""
+
+    def test_download_finishing_is_seen(self, tmp_path, monkeypatch):
+        """Snapshot'a sonradan eklenen model dosyası cache'e takılmaz."""
+        monkeypatch.setenv("HF_HOME", str(tmp_path))
+        invalidate_model_cache()
+        snapshot = tmp_path / "models--Systran--faster-whisper-base" / "snapshots" / "rev"
+        snapshot.mkdir(parents=True)
+
+        assert is_model_downloaded("base") is False
+
+        (snapshot / "model.bin").write_bytes(b"")
+        stat = snapshot.stat()
+        os.utime(snapshot, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert is_model_downloaded("base") is True
+        assert get_downloaded_models() == ["base"]
+
+
+class TestPipelined:
+    """pipeline_preprocessing ile segment dönüşümü."""
+
+    def test_progress_reported_off_decode_thread(self):
+        """Segment progress'i decode'u süren thread'de değil, tüketicide bildirilir."""
+        segments = [
+            SimpleNamespace(text=f" s{i} ", start=float(i), end=i + 1.0, words=None)
+            for i in range(5)
+        ]
+        config = TranscriptConfig(batch_size=1, preload=False, pipeline_preprocessing=True)
+        transcriber = Transcriber(config)
+        transcriber._model = _StubTranscribe(segments, duration=5.0)
+        transcriber._speech_clips = lambda audio: None
+
+        threads = []
+
+        def progress(value, message):
+            if message.startswith("Transcribing"):
+                threads.append(threading.get_ident())
+
+        result = transcriber._transcribe_faster_whisper(
+            np.zeros(16000, dtype=np.float32), progress
+        )
+
+        assert [segment.text for segment in result] == [f"s{i}" for i in range(5)]
+        assert threads and threading.get_ident() not in threads